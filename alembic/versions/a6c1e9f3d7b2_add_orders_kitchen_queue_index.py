@@ -0,0 +1,26 @@
+"""Add kitchen queue index on orders
+
+Revision ID: a6c1e9f3d7b2
+Revises: f4b8d2a6c1e3
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c1e9f3d7b2'
+down_revision: Union[str, Sequence[str], None] = 'f4b8d2a6c1e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_orders_restaurant_status_created', 'orders', ['restaurant_id', 'status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_restaurant_status_created', table_name='orders')
@@ -0,0 +1,28 @@
+"""Add address coordinates
+
+Revision ID: a9e4d2c7b3f1
+Revises: f2c6a9d4e1b8
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9e4d2c7b3f1'
+down_revision: Union[str, Sequence[str], None] = 'f2c6a9d4e1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('addresses', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('addresses', sa.Column('longitude', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('addresses', 'longitude')
+    op.drop_column('addresses', 'latitude')
@@ -0,0 +1,32 @@
+"""Add composite indexes for product listing
+
+Revision ID: b3c41f9a7d20
+Revises: f0f0fa29cc01
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3c41f9a7d20'
+down_revision: Union[str, Sequence[str], None] = 'f0f0fa29cc01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_products_available_price_id', 'products', ['is_available', 'price', 'id'], unique=False)
+    op.create_index('ix_products_available_name_id', 'products', ['is_available', 'name', 'id'], unique=False)
+    op.create_index('ix_products_restaurant_available_price_id', 'products', ['restaurant_id', 'is_available', 'price', 'id'], unique=False)
+    op.create_index('ix_products_category_available_price_id', 'products', ['category_id', 'is_available', 'price', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_category_available_price_id', table_name='products')
+    op.drop_index('ix_products_restaurant_available_price_id', table_name='products')
+    op.drop_index('ix_products_available_name_id', table_name='products')
+    op.drop_index('ix_products_available_price_id', table_name='products')
@@ -0,0 +1,33 @@
+"""Add composite indexes for restaurant listing
+
+Revision ID: b7f3e1a5c9d2
+Revises: a9e4d2c7b3f1
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7f3e1a5c9d2'
+down_revision: Union[str, Sequence[str], None] = 'a9e4d2c7b3f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Unrated restaurants sort as rating 0; queries use the same expression
+    op.create_index('ix_restaurants_active_rating_id', 'restaurants', ['is_active', sa.text('coalesce(rating, 0)'), 'id'], unique=False)
+    op.create_index('ix_restaurants_active_name_id', 'restaurants', ['is_active', 'name', 'id'], unique=False)
+    op.create_index('ix_restaurants_active_city_rating_id', 'restaurants', ['is_active', 'city', sa.text('coalesce(rating, 0)'), 'id'], unique=False)
+    op.create_index('ix_restaurants_active_city_name_id', 'restaurants', ['is_active', 'city', 'name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_restaurants_active_city_name_id', table_name='restaurants')
+    op.drop_index('ix_restaurants_active_city_rating_id', table_name='restaurants')
+    op.drop_index('ix_restaurants_active_name_id', table_name='restaurants')
+    op.drop_index('ix_restaurants_active_rating_id', table_name='restaurants')
@@ -0,0 +1,37 @@
+"""Add restaurant opening hours
+
+Revision ID: c3d8f4b6a2e9
+Revises: b7f3e1a5c9d2
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8f4b6a2e9'
+down_revision: Union[str, Sequence[str], None] = 'b7f3e1a5c9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'restaurant_hours',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('restaurant_id', sa.Integer(), nullable=False),
+        sa.Column('day_of_week', sa.SmallInteger(), nullable=False),
+        sa.Column('open_minute', sa.SmallInteger(), nullable=False),
+        sa.Column('close_minute', sa.SmallInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_restaurant_hours_restaurant_id'), 'restaurant_hours', ['restaurant_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_restaurant_hours_restaurant_id'), table_name='restaurant_hours')
+    op.drop_table('restaurant_hours')
@@ -0,0 +1,50 @@
+"""Add product full-text search index
+
+Revision ID: c7d2e8a41b95
+Revises: b3c41f9a7d20
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e8a41b95'
+down_revision: Union[str, Sequence[str], None] = 'b3c41f9a7d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        # Local runs: FTS5 table keyed by product id, synced by the product services
+        op.execute("CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(name, description)")
+        op.execute(
+            "INSERT INTO products_fts (rowid, name, description) "
+            "SELECT id, name, coalesce(description, '') FROM products"
+        )
+        return
+
+    # Name terms rank above description terms (weights A and B)
+    op.execute(
+        """
+        ALTER TABLE products ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+    op.create_index('ix_products_search_vector', 'products', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS products_fts")
+        return
+
+    op.drop_index('ix_products_search_vector', table_name='products')
+    op.drop_column('products', 'search_vector')
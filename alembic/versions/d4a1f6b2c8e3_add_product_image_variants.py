@@ -0,0 +1,28 @@
+"""Add product image variant columns
+
+Revision ID: d4a1f6b2c8e3
+Revises: c7d2e8a41b95
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a1f6b2c8e3'
+down_revision: Union[str, Sequence[str], None] = 'c7d2e8a41b95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('products', sa.Column('thumbnail_url', sa.String(), nullable=True))
+    op.add_column('products', sa.Column('image_variants', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('products', 'image_variants')
+    op.drop_column('products', 'thumbnail_url')
@@ -0,0 +1,65 @@
+"""Add reviews and rating aggregates
+
+Revision ID: d5e9a3c1f7b4
+Revises: c3d8f4b6a2e9
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e9a3c1f7b4'
+down_revision: Union[str, Sequence[str], None] = 'c3d8f4b6a2e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'reviews',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('restaurant_id', sa.Integer(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=True),
+        sa.Column('rating', sa.SmallInteger(), nullable=False),
+        sa.Column('comment', sa.String(length=1000), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_reviews_user_id'), 'reviews', ['user_id'], unique=False)
+    op.create_index('ux_reviews_order_restaurant', 'reviews', ['order_id'], unique=True, postgresql_where=sa.text('product_id IS NULL'))
+    op.create_index('ux_reviews_order_product', 'reviews', ['order_id', 'product_id'], unique=True, postgresql_where=sa.text('product_id IS NOT NULL'))
+    op.create_index('ix_reviews_restaurant_product_id', 'reviews', ['restaurant_id', 'product_id', 'id'], unique=False)
+    op.create_index('ix_reviews_product_id', 'reviews', ['product_id', 'id'], unique=False)
+
+    # Running aggregates; existing admin-set restaurant ratings are kept
+    # until the first review recomputes them
+    op.add_column('restaurants', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('restaurants', sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('products', sa.Column('rating', sa.Float(), nullable=True))
+    op.add_column('products', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('products', sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('products', 'rating_sum')
+    op.drop_column('products', 'rating_count')
+    op.drop_column('products', 'rating')
+    op.drop_column('restaurants', 'rating_sum')
+    op.drop_column('restaurants', 'rating_count')
+    op.drop_index('ix_reviews_product_id', table_name='reviews')
+    op.drop_index('ix_reviews_restaurant_product_id', table_name='reviews')
+    op.drop_index('ux_reviews_order_product', table_name='reviews')
+    op.drop_index('ux_reviews_order_restaurant', table_name='reviews')
+    op.drop_index(op.f('ix_reviews_user_id'), table_name='reviews')
+    op.drop_table('reviews')
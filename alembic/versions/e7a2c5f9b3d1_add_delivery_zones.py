@@ -0,0 +1,35 @@
+"""Add restaurant delivery zones
+
+Revision ID: e7a2c5f9b3d1
+Revises: d5e9a3c1f7b4
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a2c5f9b3d1'
+down_revision: Union[str, Sequence[str], None] = 'd5e9a3c1f7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'delivery_zones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('restaurant_id', sa.Integer(), nullable=False),
+        sa.Column('polygon', sa.JSON(), nullable=False),
+        sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_delivery_zones_restaurant_id'), 'delivery_zones', ['restaurant_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_delivery_zones_restaurant_id'), table_name='delivery_zones')
+    op.drop_table('delivery_zones')
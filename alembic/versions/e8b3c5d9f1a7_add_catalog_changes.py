@@ -0,0 +1,44 @@
+"""Add catalog change log
+
+Revision ID: e8b3c5d9f1a7
+Revises: d4a1f6b2c8e3
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3c5d9f1a7'
+down_revision: Union[str, Sequence[str], None] = 'd4a1f6b2c8e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'catalog_changes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('entity_type', sa.String(length=20), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+    # Seed one change per existing row, so `since=0` yields the full catalog
+    for entity_type, table in (
+        ('category', 'categories'),
+        ('restaurant', 'restaurants'),
+        ('product', 'products'),
+    ):
+        op.execute(
+            f"INSERT INTO catalog_changes (entity_type, entity_id, changed_at) "
+            f"SELECT '{entity_type}', id, updated_at FROM {table} ORDER BY id"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('catalog_changes')
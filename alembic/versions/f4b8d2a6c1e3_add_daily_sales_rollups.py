@@ -0,0 +1,49 @@
+"""Add daily sales rollups
+
+Revision ID: f4b8d2a6c1e3
+Revises: e7a2c5f9b3d1
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b8d2a6c1e3'
+down_revision: Union[str, Sequence[str], None] = 'e7a2c5f9b3d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'restaurant_daily_sales',
+        sa.Column('restaurant_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('orders', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('delivery_fees', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('restaurant_id', 'day'),
+    )
+    op.create_table(
+        'product_daily_sales',
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('restaurant_id', sa.Integer(), nullable=False),
+        sa.Column('units', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('product_id', 'day'),
+    )
+    op.create_index('ix_product_daily_sales_restaurant_day', 'product_daily_sales', ['restaurant_id', 'day'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_product_daily_sales_restaurant_day', table_name='product_daily_sales')
+    op.drop_table('product_daily_sales')
+    op.drop_table('restaurant_daily_sales')
@@ -4,7 +4,9 @@ Cart Controller
 Handles shopping cart operations for authenticated users.
 """
 
-from fastapi import APIRouter, Depends, status, Path
+from typing import List
+
+from fastapi import APIRouter, Depends, status, Path, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.database import get_db
@@ -14,15 +16,19 @@ from schemas.cart_schema import (
     CartItemCreate, 
     CartItemUpdate
 )
+from schemas.product_schema import RecommendedProduct
 from schemas.response_schema import APIResponse, success_response
 from utils.role_dependencies import require_authenticated
+from utils.http_cache_utils import not_modified_response, set_validators
 from services.cart_services import (
     get_cart_service,
+    get_cart_validators_service,
     add_item_service,
     update_item_service,
     remove_item_service,
     clear_cart_service
 )
+from services.recommendation_services import get_cart_recommendations_service
 
 
 router = APIRouter(
@@ -36,20 +42,52 @@ router = APIRouter(
     response_model=APIResponse[CartResponse],
 )
 async def get_my_cart(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_authenticated),
 ):
     """
     Get the current user's shopping cart.
     Creates a new cart if one doesn't exist.
+    Supports conditional GET: returns 304 while the cart is unchanged.
     """
+    validators = await get_cart_validators_service(db, current_user)
+    if validators:
+        not_modified = not_modified_response(request, *validators, private=True)
+        if not_modified:
+            return not_modified
+
     cart = await get_cart_service(db, current_user)
+    if validators:
+        set_validators(response, *validators, private=True)
     return success_response(
         message="Cart fetched successfully",
         data=cart,
     )
 
 
+@router.get(
+    "/recommendations",
+    response_model=APIResponse[List[RecommendedProduct]],
+)
+async def get_cart_recommendations(
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),
+):
+    """
+    "People also ordered" suggestions for the current cart: products most
+    often ordered together with the cart's items, excluding those items.
+    Empty for an empty cart.
+    """
+    products = await get_cart_recommendations_service(db, current_user, limit=limit)
+    return success_response(
+        message="Cart recommendations fetched successfully",
+        data=products,
+    )
+
+
 @router.post(
     "/items",
     response_model=APIResponse[CartResponse],
@@ -0,0 +1,45 @@
+"""
+Catalog Controller
+
+Incremental catalog sync for client apps.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.database import get_db
+from models.user_model import User
+from schemas.catalog_schema import CatalogChanges
+from schemas.response_schema import APIResponse, success_response
+from services.catalog_services import get_catalog_changes_service
+from utils.role_dependencies import require_authenticated
+
+
+router = APIRouter(
+    prefix="/catalog",
+    tags=["Catalog"],
+)
+
+
+@router.get(
+    "/changes",
+    response_model=APIResponse[CatalogChanges],
+)
+async def get_catalog_changes(
+    since: int = Query(0, ge=0, description="Last synced version; 0 for a full sync"),
+    limit: int = Query(500, ge=1, le=2000, description="Max changes per call"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),
+):
+    """
+    Products, categories and restaurants changed after `since`.
+
+    Store the returned `version` and pass it as `since` next time;
+    repeat while `has_more` is true.
+    **Authentication required.**
+    """
+    changes = await get_catalog_changes_service(db, since, limit)
+    return success_response(
+        message="Catalog changes fetched successfully",
+        data=changes,
+    )
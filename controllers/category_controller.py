@@ -5,7 +5,7 @@ Handles HTTP requests for Category APIs.
 """
 
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.database import get_db
@@ -19,8 +19,15 @@ from services.category_services import (
     delete_category_service,
 )
 
+from services.catalog_services import get_catalog_version_service
 from models.user_model import User
 from utils.role_dependencies import require_admin
+from utils.http_cache_utils import (
+    catalog_etag,
+    make_etag,
+    not_modified_response,
+    set_validators,
+)
 
 router = APIRouter(
     prefix="/categories",
@@ -48,9 +55,19 @@ async def create_category(
 )
 async def get_category_by_id(
     category_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
-    return await get_category_by_id_service(db, category_id)
+    category = await get_category_by_id_service(db, category_id)
+
+    etag = make_etag("category", category.id, category.updated_at)
+    not_modified = not_modified_response(request, etag, category.updated_at)
+    if not_modified:
+        return not_modified
+
+    set_validators(response, etag, category.updated_at)
+    return category
 
 
 @router.get(
@@ -59,9 +76,18 @@ async def get_category_by_id(
     status_code=status.HTTP_200_OK,
 )
 async def get_all_categories(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
-    return await get_all_categories_service(db)
+    etag = catalog_etag(request, await get_catalog_version_service(db))
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
+    categories = await get_all_categories_service(db)
+    set_validators(response, etag)
+    return categories
 
 
 @router.put(
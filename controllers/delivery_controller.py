@@ -1,15 +1,48 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.database import get_db
 from models.user_model import User
+from schemas.delivery_schema import DeliveryEstimate
 from schemas.response_schema import APIResponse, success_response
+from services.delivery_services import estimate_delivery_service
 from utils.role_dependencies import require_authenticated
 from utils.delivery_utils import uber_client
 from repositories import order_repository
 
 router = APIRouter(prefix="/delivery", tags=["Delivery"])
 
+
+@router.get("/estimates", response_model=APIResponse[List[DeliveryEstimate]])
+async def get_delivery_estimates(
+    restaurant_ids: List[int] = Query(..., max_length=100, description="Repeat per restaurant"),
+    address_id: Optional[int] = Query(None, description="Defaults to the user's default address"),
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lng: Optional[float] = Query(None, ge=-180, le=180),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),
+):
+    """
+    Estimated delivery fee and ETA from each restaurant to a drop-off point,
+    computed locally from coordinates. For browsing screens; the fee charged
+    at checkout still comes from a live Uber quote.
+    """
+    estimates = await estimate_delivery_service(
+        db,
+        current_user,
+        restaurant_ids,
+        address_id=address_id,
+        lat=lat,
+        lng=lng,
+    )
+    return success_response(
+        message="Delivery estimates fetched successfully",
+        data=estimates,
+    )
+
+
 @router.get("/{order_id}/status", response_model=APIResponse[dict])
 async def get_order_delivery_status(
     order_id: int,
@@ -12,13 +12,16 @@ from db.database import get_db
 from models.user_model import User
 from models.category_model import Category
 from schemas.inventory_schema import StockUpdate, StockSet
-from schemas.response_schema import APIResponse, success_response
+from schemas.response_schema import APIResponse, InventoryResponse, success_response
 from utils.role_dependencies import require_admin, require_authenticated
 from services.inventory_services import (
     set_stock_service,
     increase_stock_service,
     decrease_stock_service,
     get_current_stock_service,
+    set_product_stock_service,
+    increase_product_stock_service,
+    get_product_stock_service,
 )
 
 
@@ -115,3 +118,69 @@ async def get_category_stock(
         message="Stock fetched successfully",
         data=stock,
     )
+
+
+@router.post(
+    "/products/{product_id}/set",
+    response_model=APIResponse[InventoryResponse],
+)
+async def set_product_stock(
+    body: StockSet,
+    product_id: int = Path(..., description="Product ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    """
+    Set available stock for a product (starts tracking it if untracked).
+    **Admin only.**
+    """
+    inventory = await set_product_stock_service(
+        db, product_id, body.stock, current_user
+    )
+    return success_response(
+        message="Stock updated successfully",
+        data=inventory,
+    )
+
+
+@router.post(
+    "/products/{product_id}/add",
+    response_model=APIResponse[InventoryResponse],
+)
+async def add_product_stock(
+    body: StockUpdate,
+    product_id: int = Path(..., description="Product ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    """
+    Increase available stock for a product.
+    **Admin only.**
+    """
+    inventory = await increase_product_stock_service(
+        db, product_id, body.amount, current_user
+    )
+    return success_response(
+        message="Stock increased successfully",
+        data=inventory,
+    )
+
+
+@router.get(
+    "/products/{product_id}",
+    response_model=APIResponse[InventoryResponse],
+)
+async def get_product_stock(
+    product_id: int = Path(..., description="Product ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),
+):
+    """
+    Get available and reserved stock for a product.
+    **Authenticated users only.**
+    """
+    inventory = await get_product_stock_service(db, product_id)
+    return success_response(
+        message="Stock fetched successfully",
+        data=inventory,
+    )
@@ -0,0 +1,97 @@
+"""
+Kitchen Controller
+
+Kitchen screens: the queue of paid orders, status updates as orders move,
+and a server-sent event stream so screens update without polling. Admin
+only until restaurants carry an owner to scope staff access by.
+"""
+
+from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, Path, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.database import get_db
+from models.user_model import User
+from schemas.order_schema import OrderResponse, OrderStatus, OrderUpdateStatus
+from schemas.response_schema import APIResponse, success_response
+from utils.role_dependencies import require_admin
+from services import kitchen_services
+
+
+router = APIRouter(
+    prefix="/kitchen",
+    tags=["Kitchen"],
+)
+
+
+@router.get(
+    "/restaurants/{restaurant_id}/orders",
+    response_model=APIResponse[List[OrderResponse]],
+)
+async def get_kitchen_queue(
+    restaurant_id: int = Path(..., description="Restaurant ID"),
+    status: Optional[List[OrderStatus]] = Query(None, description="Statuses to include (default: confirmed, preparing)"),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    """
+    A restaurant's active orders, oldest first. Fetch this once, then
+    follow `/stream`. **Admin access required.**
+    """
+    orders = await kitchen_services.get_kitchen_queue_service(
+        db,
+        restaurant_id=restaurant_id,
+        statuses=status or kitchen_services.KITCHEN_STATUSES,
+        limit=limit,
+    )
+    return success_response(
+        message="Kitchen queue fetched successfully",
+        data=orders,
+    )
+
+
+@router.get("/restaurants/{restaurant_id}/stream")
+async def stream_kitchen_events(
+    request: Request,
+    restaurant_id: int = Path(..., description="Restaurant ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    """
+    Server-sent events: `order_confirmed` when a payment confirms an order,
+    `order_status` when an order moves; data is the order as JSON.
+    **Admin access required.**
+    """
+    stream = await kitchen_services.open_kitchen_stream_service(db, request, restaurant_id)
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.put(
+    "/orders/{order_id}/status",
+    response_model=APIResponse[OrderResponse],
+)
+async def update_kitchen_order_status(
+    order_id: int = Path(..., description="Order ID"),
+    update: OrderUpdateStatus = Body(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    """
+    Move an order forward: confirmed -> preparing -> delivered.
+    **Admin access required.**
+    """
+    order = await kitchen_services.update_kitchen_order_status_service(
+        db,
+        order_id=order_id,
+        new_status=update.status,
+    )
+    return success_response(
+        message="Order status updated",
+        data=order,
+    )
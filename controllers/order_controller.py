@@ -4,8 +4,8 @@ Order Controller
 Handles order placement, retrieval, and cancellation.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, status, Path
+from typing import List, Optional
+from fastapi import APIRouter, Depends, status, Path, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.database import get_db
@@ -13,10 +13,13 @@ from models.user_model import User
 from schemas.order_schema import OrderResponse
 from schemas.response_schema import APIResponse, success_response
 from utils.role_dependencies import require_authenticated
+from utils.http_cache_utils import not_modified_response, set_validators
+from utils.fieldset_utils import sparse_response
 from services.order_services import (
     place_order_service,
     get_my_orders_service,
     get_order_details_service,
+    get_order_validators_service,
     cancel_order_service
 )
 
@@ -55,17 +58,24 @@ async def checkout(
     response_model=APIResponse[List[OrderResponse]],
 )
 async def get_my_orders(
+    fields: Optional[str] = Query(
+        None, description="Comma-separated order fields to return, e.g. status,total_amount"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_authenticated),
 ):
     """
     List all orders for the current user.
+    `fields` narrows the columns read and the fields returned.
     """
-    orders = await get_my_orders_service(db, current_user)
-    return success_response(
+    orders = await get_my_orders_service(db, current_user, fields=fields)
+    body = success_response(
         message="Orders fetched successfully",
         data=orders,
     )
+    if fields is not None:
+        return sparse_response(body)
+    return body
 
 
 @router.get(
@@ -73,14 +83,23 @@ async def get_my_orders(
     response_model=APIResponse[OrderResponse],
 )
 async def get_order_details(
+    request: Request,
+    response: Response,
     order_id: int = Path(..., description="Order ID"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_authenticated),
 ):
     """
     Get detailed view of a specific order.
+    Supports conditional GET: returns 304 while the order is unchanged.
     """
+    etag, last_modified = await get_order_validators_service(db, current_user, order_id)
+    not_modified = not_modified_response(request, etag, last_modified, private=True)
+    if not_modified:
+        return not_modified
+
     order = await get_order_details_service(db, current_user, order_id)
+    set_validators(response, etag, last_modified, private=True)
     return success_response(
         message="Order details fetched successfully",
         data=order,
@@ -97,7 +116,8 @@ async def cancel_order(
     current_user: User = Depends(require_authenticated),
 ):
     """
-    Cancel a pending order.
+    Cancel a pending order. Admins may also cancel a confirmed, paid order
+    the kitchen has not started; its payment is refunded.
     """
     order = await cancel_order_service(db, current_user, order_id)
     return success_response(
@@ -2,9 +2,19 @@
 # Imports
 # ============================================================
 
-from typing import List
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.database import get_db
@@ -12,17 +22,48 @@ from schemas.product_schema import (
     ProductCreate,
     ProductUpdate,
     ProductResponse,
+    ProductPage,
+    ProductSort,
+    ProductSearchPage,
+    ProductImportReport,
+    ProductBulkUpdate,
+    ProductBulkUpdateReport,
+    ProductFacets,
+    PopularProduct,
+    RecommendedProduct,
+    ProductImageUploadRequest,
+    ProductImageUploadTicket,
+    ProductImageUploadComplete,
 )
 from schemas.response_schema import APIResponse, success_response
 from services.product_services import (
     create_product_service,
     get_product_by_id_service,
     get_all_products_service,
+    search_products_service,
     update_product_service,
     delete_product_service,
+    import_products_service,
+    bulk_update_products_service,
+    get_product_facets_service,
+)
+from services.popularity_services import get_popular_products_service
+from services.catalog_services import get_catalog_version_service
+from services.recommendation_services import get_product_recommendations_service
+from services.product_image_services import (
+    create_image_upload_service,
+    complete_image_upload_service,
 )
 from models.user_model import User
 from utils.role_dependencies import require_admin
+from utils.import_utils import iter_csv_rows, iter_ndjson_rows
+from utils.fieldset_utils import sparse_response
+from utils.http_cache_utils import (
+    catalog_etag,
+    make_etag,
+    not_modified_response,
+    set_validators,
+)
 
 
 # ============================================================
@@ -41,33 +82,180 @@ router = APIRouter(
 
 @router.get(
     "/",
-    response_model=APIResponse[List[ProductResponse]],
+    response_model=APIResponse[ProductPage],
 )
 async def get_all_products(
+    request: Request,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    sort: ProductSort = Query("newest"),
+    restaurant_id: Optional[int] = Query(None),
+    category_id: Optional[int] = Query(None),
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated product fields to return, e.g. name,price,image_url"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Fetch all available products.
+    Fetch a page of available products.
 
-    Unavailable (soft-deleted) products
-    are filtered out in the service layer.
+    Filtering, sorting and keyset pagination are done in SQL.
+    Pass `next_cursor` back as `cursor` (with the same `sort`)
+    to fetch the following page. `fields` narrows both the
+    columns read and the fields returned (`id` is always included).
+
+    Supports conditional GET (`If-None-Match`).
     
     **Public endpoint - no authentication required.**
     """
-    products = await get_all_products_service(db)
-    return success_response(
+    etag = catalog_etag(request, await get_catalog_version_service(db))
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
+    page = await get_all_products_service(
+        db,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        restaurant_id=restaurant_id,
+        category_id=category_id,
+        min_price=min_price,
+        max_price=max_price,
+        fields=fields,
+    )
+    body = success_response(
         message="Products fetched successfully",
         status_code=status.HTTP_200_OK,
+        data=page,
+    )
+    if fields is not None:
+        sparse = sparse_response(body)
+        set_validators(sparse, etag)
+        return sparse
+
+    set_validators(response, etag)
+    return body
+
+
+@router.get(
+    "/popular",
+    response_model=APIResponse[List[PopularProduct]],
+)
+async def get_popular_products(
+    limit: int = Query(20, ge=1, le=100),
+    restaurant_id: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Most popular available products, from recent orders and favorites
+    with older activity decayed. Rankings are refreshed periodically.
+    
+    **Public endpoint - no authentication required.**
+    """
+    products = await get_popular_products_service(db, limit=limit, restaurant_id=restaurant_id)
+    return success_response(
+        message="Popular products fetched successfully",
+        status_code=status.HTTP_200_OK,
         data=products,
     )
 
 
+@router.get(
+    "/facets",
+    response_model=APIResponse[ProductFacets],
+)
+async def get_product_facets(
+    request: Request,
+    response: Response,
+    restaurant_id: Optional[int] = Query(None),
+    category_id: Optional[int] = Query(None),
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Counts of available products per category, per restaurant and
+    per price bucket, for the same filters as `GET /products`.
+
+    Supports conditional GET (`If-None-Match`).
+    
+    **Public endpoint - no authentication required.**
+    """
+    etag = catalog_etag(request, await get_catalog_version_service(db))
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
+    facets = await get_product_facets_service(
+        db,
+        restaurant_id=restaurant_id,
+        category_id=category_id,
+        min_price=min_price,
+        max_price=max_price,
+    )
+    set_validators(response, etag)
+    return success_response(
+        message="Product facets fetched successfully",
+        status_code=status.HTTP_200_OK,
+        data=facets,
+    )
+
+
+@router.get(
+    "/search",
+    response_model=APIResponse[ProductSearchPage],
+)
+async def search_products(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    restaurant_id: Optional[int] = Query(None),
+    category_id: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Full-text search over product names and descriptions.
+
+    Results are ranked by relevance, name matches first.
+    Supports conditional GET (`If-None-Match`).
+    
+    **Public endpoint - no authentication required.**
+    """
+    etag = catalog_etag(request, await get_catalog_version_service(db))
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
+    page = await search_products_service(
+        db,
+        q,
+        limit=limit,
+        cursor=cursor,
+        restaurant_id=restaurant_id,
+        category_id=category_id,
+    )
+    set_validators(response, etag)
+    return success_response(
+        message="Products searched successfully",
+        status_code=status.HTTP_200_OK,
+        data=page,
+    )
+
+
 @router.get(
     "/{product_id}",
     response_model=APIResponse[ProductResponse],
 )
 async def get_product_by_id(
     product_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -75,10 +263,19 @@ async def get_product_by_id(
 
     Returns 404 if the product does not exist
     or is unavailable.
+
+    Supports conditional GET (`If-None-Match` / `If-Modified-Since`).
     
     **Public endpoint - no authentication required.**
     """
     product = await get_product_by_id_service(db, product_id)
+
+    etag = make_etag("product", product.id, product.updated_at)
+    not_modified = not_modified_response(request, etag, product.updated_at)
+    if not_modified:
+        return not_modified
+
+    set_validators(response, etag, product.updated_at)
     return success_response(
         message="Product fetched successfully",
         status_code=status.HTTP_200_OK,
@@ -86,6 +283,31 @@ async def get_product_by_id(
     )
 
 
+@router.get(
+    "/{product_id}/recommendations",
+    response_model=APIResponse[List[RecommendedProduct]],
+)
+async def get_product_recommendations(
+    product_id: int,
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Available products most often ordered together with this one.
+    Lists are precomputed from order history and refreshed periodically.
+
+    Returns 404 if the product does not exist or is unavailable.
+    
+    **Public endpoint - no authentication required.**
+    """
+    products = await get_product_recommendations_service(db, product_id, limit=limit)
+    return success_response(
+        message="Product recommendations fetched successfully",
+        status_code=status.HTTP_200_OK,
+        data=products,
+    )
+
+
 # ============================================================
 # Admin-Only Routes
 # ============================================================
@@ -116,6 +338,128 @@ async def create_product(
     )
 
 
+@router.post(
+    "/import",
+    response_model=APIResponse[ProductImportReport],
+)
+async def import_products(
+    file: UploadFile = File(..., description="CSV (with header) or NDJSON, one product per row"),
+    format: Optional[Literal["csv", "ndjson"]] = Query(
+        None, description="Defaults to the file extension"
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),  # Admin only
+):
+    """
+    Bulk-create products from an uploaded menu file.
+
+    Rows use the same fields as `POST /products`
+    (name, price, category_name, restaurant_id, ...).
+    The upload is streamed and inserted in batches; invalid
+    or duplicate rows are listed in the report instead of
+    failing the whole import.
+    
+    **Admin access required.**
+    """
+    if format is None:
+        filename = (file.filename or "").lower()
+        if filename.endswith(".csv"):
+            format = "csv"
+        elif filename.endswith((".ndjson", ".jsonl")):
+            format = "ndjson"
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot infer file format; pass format=csv or format=ndjson",
+            )
+
+    rows = iter_csv_rows(file.file) if format == "csv" else iter_ndjson_rows(file.file)
+    report = await import_products_service(db, rows)
+    return success_response(
+        message="Products imported",
+        status_code=status.HTTP_200_OK,
+        data=report,
+    )
+
+
+@router.post(
+    "/{product_id}/image/upload-url",
+    response_model=APIResponse[ProductImageUploadTicket],
+)
+async def create_product_image_upload(
+    product_id: int,
+    payload: ProductImageUploadRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),  # Admin only
+):
+    """
+    Get a presigned form for uploading a product image directly
+    to object storage.
+
+    POST the file as multipart/form-data to `upload_url` with all
+    `fields`, then confirm with `/image/complete`.
+    
+    **Admin access required.**
+    """
+    ticket = await create_image_upload_service(db, product_id, payload.content_type)
+    return success_response(
+        message="Upload URL created",
+        status_code=status.HTTP_200_OK,
+        data=ticket,
+    )
+
+
+@router.post(
+    "/{product_id}/image/complete",
+    response_model=APIResponse[ProductResponse],
+)
+async def complete_product_image_upload(
+    product_id: int,
+    payload: ProductImageUploadComplete,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),  # Admin only
+):
+    """
+    Confirm an uploaded product image.
+
+    Sets `image_url` right away; `thumbnail_url` and `image_variants`
+    are filled in once the image worker has rendered them.
+    
+    **Admin access required.**
+    """
+    product = await complete_image_upload_service(db, product_id, payload.key)
+    return success_response(
+        message="Product image updated",
+        status_code=status.HTTP_200_OK,
+        data=product,
+    )
+
+
+@router.patch(
+    "/bulk",
+    response_model=APIResponse[ProductBulkUpdateReport],
+)
+async def bulk_update_products(
+    payload: ProductBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),  # Admin only
+):
+    """
+    Update price and/or availability of many products at once.
+
+    All changes are applied in one statement and one transaction.
+    Unknown product ids are skipped and listed in `missing_ids`.
+    
+    **Admin access required.**
+    """
+    report = await bulk_update_products_service(db=db, payload=payload)
+    return success_response(
+        message="Products updated successfully",
+        status_code=status.HTTP_200_OK,
+        data=report,
+    )
+
+
 @router.patch(
     "/{product_id}",
     response_model=APIResponse[ProductResponse],
@@ -4,9 +4,9 @@ Restaurant Controllers - REST API Endpoints
 Role-based access control is enforced at this layer using dependencies.
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Body, Path
+from fastapi import APIRouter, Depends, Body, Path, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.database import get_db
@@ -15,14 +15,35 @@ from services.restaurant_services import (
     update_restaurant_service,
     get_restaurant_by_id_service,
     get_all_restaurants_service,
+    get_restaurant_menu_service,
+    get_nearby_restaurants_service,
+    get_restaurant_hours_service,
+    set_restaurant_hours_service,
+    get_delivery_zones_service,
+    set_delivery_zones_service,
 )
+from services.popularity_services import get_popular_restaurants_service
+from services.catalog_services import get_catalog_version_service
 from schemas.restaurant_schema import (
     RestaurantCreate,
     RestaurantUpdate,
     RestaurantResponse,
+    RestaurantPage,
+    RestaurantSort,
+    NearbySort,
+    RestaurantMenu,
+    PopularRestaurant,
+    NearbyRestaurantPage,
+    RestaurantHoursUpdate,
+    RestaurantHoursResponse,
+    DeliveryZonesUpdate,
+    DeliveryZonesResponse,
 )
 from models.user_model import User
 from utils.role_dependencies import require_admin, require_authenticated
+from utils.http_cache_utils import catalog_etag, make_etag, not_modified_response, set_validators
+from utils.opening_hours import minute_of_week
+from utils.fieldset_utils import sparse_response
 
 
 router = APIRouter(
@@ -69,33 +90,242 @@ async def update_restaurant_controller(
     )
 
 
+@router.put(
+    "/{restaurant_id}/hours",
+    response_model=RestaurantHoursResponse,
+)
+async def set_restaurant_hours_controller(
+    restaurant_id: int = Path(..., description="Restaurant ID"),
+    hours: RestaurantHoursUpdate = Body(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),  # Admin only
+):
+    """
+    Replace a restaurant's weekly opening hours. An empty list removes
+    the schedule (always open). **Admin access required.**
+    """
+    return await set_restaurant_hours_service(
+        db=db,
+        restaurant_id=restaurant_id,
+        hours=hours,
+    )
+
+
+@router.put(
+    "/{restaurant_id}/delivery-zones",
+    response_model=DeliveryZonesResponse,
+)
+async def set_delivery_zones_controller(
+    restaurant_id: int = Path(..., description="Restaurant ID"),
+    zones: DeliveryZonesUpdate = Body(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),  # Admin only
+):
+    """
+    Replace a restaurant's delivery zones (polygons of lat/lng vertices).
+    An empty list removes the restriction. **Admin access required.**
+    """
+    return await set_delivery_zones_service(
+        db=db,
+        restaurant_id=restaurant_id,
+        zones=zones,
+    )
+
+
 # ============================================================
 # Authenticated User Routes
 # ============================================================
 
+@router.get(
+    "/popular",
+    response_model=List[PopularRestaurant],
+)
+async def get_popular_restaurants_controller(
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),  # Any authenticated user
+):
+    """
+    Most popular restaurants by recent, decayed order and favorite activity.
+    Rankings are refreshed periodically. **Authentication required.**
+    """
+    return await get_popular_restaurants_service(db=db, limit=limit)
+
+
+@router.get(
+    "/nearby",
+    response_model=NearbyRestaurantPage,
+)
+async def get_nearby_restaurants_controller(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    radius: float = Query(5.0, gt=0, le=50, description="Radius in km"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    open_now: bool = Query(False, description="Only restaurants open right now"),
+    serviceable_only: bool = Query(False, description="Only restaurants that deliver to (`lat`, `lng`)"),
+    sort: NearbySort = Query("distance", description="distance, or fastest (ETA incl. kitchen load)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),  # Any authenticated user
+):
+    """
+    Active restaurants within `radius` km of (`lat`, `lng`), nearest first
+    or fastest first, with their distance, delivery estimate and current
+    kitchen load. **Authentication required.**
+    """
+    return await get_nearby_restaurants_service(
+        db=db,
+        lat=lat,
+        lng=lng,
+        radius_km=radius,
+        limit=limit,
+        cursor=cursor,
+        open_now=open_now,
+        serviceable_only=serviceable_only,
+        sort=sort,
+    )
+
+
 @router.get(
     "/{restaurant_id}",
     response_model=RestaurantResponse,
 )
 async def get_restaurant_by_id_controller(
+    request: Request,
+    response: Response,
     restaurant_id: int = Path(..., description="Restaurant ID"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_authenticated),  # Any authenticated user
 ):
-    """Fetch a restaurant by ID. **Authentication required.**"""
-    return await get_restaurant_by_id_service(
+    """Fetch a restaurant by ID. Supports conditional GET. **Authentication required.**"""
+    restaurant = await get_restaurant_by_id_service(
         db=db,
         restaurant_id=restaurant_id,
     )
 
+    etag = make_etag("restaurant", restaurant.id, restaurant.updated_at)
+    not_modified = not_modified_response(request, etag, restaurant.updated_at)
+    if not_modified:
+        return not_modified
+
+    set_validators(response, etag, restaurant.updated_at)
+    return restaurant
+
+
+@router.get(
+    "/{restaurant_id}/hours",
+    response_model=RestaurantHoursResponse,
+)
+async def get_restaurant_hours_controller(
+    restaurant_id: int = Path(..., description="Restaurant ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),  # Any authenticated user
+):
+    """Fetch a restaurant's weekly opening hours and whether it is open now. **Authentication required.**"""
+    return await get_restaurant_hours_service(
+        db=db,
+        restaurant_id=restaurant_id,
+    )
+
+
+@router.get(
+    "/{restaurant_id}/delivery-zones",
+    response_model=DeliveryZonesResponse,
+)
+async def get_delivery_zones_controller(
+    restaurant_id: int = Path(..., description="Restaurant ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),  # Any authenticated user
+):
+    """Fetch a restaurant's delivery zones. **Authentication required.**"""
+    return await get_delivery_zones_service(
+        db=db,
+        restaurant_id=restaurant_id,
+    )
+
+
+@router.get(
+    "/{restaurant_id}/menu",
+    response_model=RestaurantMenu,
+)
+async def get_restaurant_menu_controller(
+    request: Request,
+    restaurant_id: int = Path(..., description="Restaurant ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),  # Any authenticated user
+):
+    """
+    Fetch a restaurant's available products grouped by category.
+    Served as pre-serialized JSON. Supports conditional GET. **Authentication required.**
+    """
+    etag, body = await get_restaurant_menu_service(
+        db=db,
+        restaurant_id=restaurant_id,
+    )
+
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
+    response = Response(content=body, media_type="application/json")
+    set_validators(response, etag)
+    return response
+
 
 @router.get(
     "",
-    response_model=List[RestaurantResponse],
+    response_model=RestaurantPage,
 )
 async def get_all_restaurants_controller(
+    request: Request,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    sort: RestaurantSort = Query("rating"),
+    is_active: bool = Query(True),
+    city: Optional[str] = Query(None, max_length=100),
+    min_rating: Optional[float] = Query(None, ge=0),
+    open_now: bool = Query(False, description="Only restaurants open right now"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated restaurant fields to return, e.g. name,rating"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_authenticated),  # Any authenticated user
 ):
-    """Fetch all restaurants. **Authentication required.**"""
-    return await get_all_restaurants_service(db=db)
+    """
+    Fetch a page of restaurants, active ones by default.
+
+    Filtering, sorting and keyset pagination are done in SQL. Pass
+    `next_cursor` back as `cursor` (with the same `sort`) to fetch the
+    following page; unrated restaurants sort as rating 0. `fields` narrows
+    the columns read and the fields returned.
+    Supports conditional GET. **Authentication required.**
+    """
+    # Opening state changes by the minute without a catalog write
+    etag = catalog_etag(
+        request,
+        await get_catalog_version_service(db),
+        minute_of_week() if open_now else None,
+    )
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
+    page = await get_all_restaurants_service(
+        db=db,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        is_active=is_active,
+        city=city,
+        min_rating=min_rating,
+        open_now=open_now,
+        fields=fields,
+    )
+    if fields is not None:
+        sparse = sparse_response(page)
+        set_validators(sparse, etag)
+        return sparse
+
+    set_validators(response, etag)
+    return page
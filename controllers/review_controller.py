@@ -0,0 +1,113 @@
+"""
+Review Controller
+
+Customers rate paid orders: the restaurant and each ordered product.
+Listing reviews is public.
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, Path, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.database import get_db
+from models.user_model import User
+from schemas.review_schema import ReviewCreate, ReviewUpdate, ReviewResponse, ReviewPage
+from schemas.response_schema import APIResponse, success_response
+from utils.role_dependencies import require_authenticated
+from services import review_services
+
+
+router = APIRouter(
+    prefix="/reviews",
+    tags=["Reviews"],
+)
+
+
+@router.get(
+    "/",
+    response_model=APIResponse[ReviewPage],
+)
+async def list_reviews(
+    restaurant_id: Optional[int] = Query(None, description="A restaurant's own reviews"),
+    product_id: Optional[int] = Query(None, description="A product's reviews"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Newest-first reviews of a restaurant or of a product (pass exactly one).
+
+    **Public endpoint - no authentication required.**
+    """
+    page = await review_services.get_reviews_service(
+        db,
+        restaurant_id=restaurant_id,
+        product_id=product_id,
+        limit=limit,
+        cursor=cursor,
+    )
+    return success_response(
+        message="Reviews fetched successfully",
+        data=page,
+    )
+
+
+@router.post(
+    "/",
+    response_model=APIResponse[ReviewResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_review(
+    data: ReviewCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),
+):
+    """
+    Review a paid order's restaurant (omit `product_id`) or one of its
+    products. One review of each per order.
+    """
+    review = await review_services.create_review_service(db, current_user, data)
+    return success_response(
+        message="Review created successfully",
+        status_code=status.HTTP_201_CREATED,
+        data=review,
+    )
+
+
+@router.patch(
+    "/{review_id}",
+    response_model=APIResponse[ReviewResponse],
+)
+async def update_review(
+    data: ReviewUpdate,
+    review_id: int = Path(..., description="Review ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),
+):
+    """
+    Change the rating or comment of your review.
+    """
+    review = await review_services.update_review_service(db, current_user, review_id, data)
+    return success_response(
+        message="Review updated successfully",
+        data=review,
+    )
+
+
+@router.delete(
+    "/{review_id}",
+    response_model=APIResponse[None],
+)
+async def delete_review(
+    review_id: int = Path(..., description="Review ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_authenticated),
+):
+    """
+    Delete your review (admins may delete any review).
+    """
+    await review_services.delete_review_service(db, current_user, review_id)
+    return success_response(
+        message="Review deleted successfully",
+        data=None,
+    )
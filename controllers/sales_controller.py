@@ -0,0 +1,74 @@
+"""
+Sales Controller
+
+Restaurant sales dashboard (daily totals and best sellers) served from the
+daily rollups, and the admin backfill that rebuilds them from orders.
+"""
+
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Path, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.database import get_db
+from models.user_model import User
+from schemas.sales_schema import SalesDashboard, SalesBackfillResult
+from schemas.response_schema import APIResponse, success_response
+from utils.role_dependencies import require_admin
+from services import sales_services
+
+
+router = APIRouter(
+    prefix="/sales",
+    tags=["Sales"],
+)
+
+
+@router.get(
+    "/restaurants/{restaurant_id}",
+    response_model=APIResponse[SalesDashboard],
+)
+async def get_sales_dashboard(
+    restaurant_id: int = Path(..., description="Restaurant ID"),
+    start: Optional[date] = Query(None, description="First day (default: 29 days before end)"),
+    end: Optional[date] = Query(None, description="Last day (default: today)"),
+    top_products: int = Query(10, ge=1, le=100, description="Best sellers to include"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    """
+    Orders and revenue per day, plus best-selling products, over a date
+    range. **Admin access required** (restaurants have no owner link to
+    scope this to).
+    """
+    dashboard = await sales_services.get_sales_dashboard_service(
+        db,
+        restaurant_id=restaurant_id,
+        start=start,
+        end=end,
+        top_products=top_products,
+    )
+    return success_response(
+        message="Sales fetched successfully",
+        data=dashboard,
+    )
+
+
+@router.post(
+    "/backfill",
+    response_model=APIResponse[SalesBackfillResult],
+)
+async def backfill_sales(
+    days: int = Query(30, ge=1, le=3660, description="Trailing days to rebuild, today included"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    """
+    Rebuild the daily sales rollups for the trailing `days` from order
+    history. Run off-peak. **Admin access required.**
+    """
+    result = await sales_services.backfill_sales_service(db, days=days)
+    return success_response(
+        message="Sales rollups rebuilt",
+        data=result,
+    )
@@ -0,0 +1,40 @@
+"""
+Search Controller
+
+Search-as-you-type suggestions served from the in-memory typeahead index.
+"""
+
+from typing import List, Optional
+from fastapi import APIRouter, Query
+
+from schemas.search_schema import SuggestionResponse, SuggestionType
+from schemas.response_schema import APIResponse, success_response
+from services.search_services import suggest_service
+
+
+router = APIRouter(
+    prefix="/search",
+    tags=["Search"],
+)
+
+
+@router.get(
+    "/suggest",
+    response_model=APIResponse[List[SuggestionResponse]],
+)
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="Typed prefix"),
+    limit: int = Query(10, ge=1, le=25),
+    types: Optional[List[SuggestionType]] = Query(None, description="Restrict to these entry types"),
+):
+    """
+    Suggest product, restaurant and category names starting with `q`.
+    Most popular first.
+    
+    **Public endpoint - no authentication required.**
+    """
+    suggestions = suggest_service(q, limit=limit, types=types)
+    return success_response(
+        message="Suggestions fetched successfully",
+        data=suggestions,
+    )
@@ -23,12 +23,88 @@ class Settings(BaseSettings):
     UBER_DIRECT_AUTH_URL: str = "https://auth.uber.com/oauth/v2/token"
     UBER_DIRECT_API_BASE: str = "https://api.uber.com"
 
+    # Review ratings: Bayesian prior, as if every restaurant/product started
+    # with REVIEW_PRIOR_WEIGHT ratings of REVIEW_PRIOR_MEAN
+    REVIEW_PRIOR_MEAN: float = 3.5
+    REVIEW_PRIOR_WEIGHT: float = 5.0
+
+    # Opening hours are entered and evaluated in this timezone
+    RESTAURANT_TIMEZONE: str = "Asia/Kolkata"
+
+    # Local delivery estimates (browsing only; checkout still uses Uber quotes)
+    DELIVERY_BASE_FEE: float = 25.0
+    DELIVERY_INCLUDED_KM: float = 2.0
+    DELIVERY_FEE_PER_KM: float = 8.0
+    DELIVERY_MAX_FEE: float = 150.0
+    DELIVERY_MAX_DISTANCE_KM: float = 15.0
+    DELIVERY_ROAD_FACTOR: float = 1.3  # road distance per straight-line km
+    DELIVERY_SPEED_KMPH: float = 20.0
+    DELIVERY_PREP_MINUTES: float = 15.0
+
+    # Kitchen load (in-process counters of queued orders)
+    KITCHEN_CONCURRENT_ORDERS: int = 4  # orders a kitchen prepares in parallel
+    ORDER_LOAD_WINDOW_HOURS: int = 6  # older open orders are not counted
+    ORDER_LOAD_RESYNC_SECONDS: int = 300
+    KITCHEN_STREAM_HEARTBEAT_SECONDS: int = 15
+
+    # Unpaid checkouts release their stock reservations after this long
+    PENDING_ORDER_TTL_MINUTES: int = 30
+    ORDER_EXPIRY_SWEEP_SECONDS: int = 60
+    ORDER_EXPIRY_BATCH_SIZE: int = 500
+
     # Firebase (Optional)
     FIREBASE_CREDENTIALS: Optional[str] = None
 
     # CORS
     CORS_ORIGINS: List[str] = []
 
+    # Catalog cache (in-process, per worker)
+    CATALOG_CACHE_TTL_SECONDS: int = 60
+    CATALOG_CACHE_MAX_ENTRIES: int = 10000
+    MENU_CACHE_MAX_ENTRIES: int = 2000
+
+    # Object storage (S3-compatible; set S3_ENDPOINT_URL for MinIO)
+    S3_BUCKET: Optional[str] = None
+    S3_REGION: str = "us-east-1"
+    S3_ENDPOINT_URL: Optional[str] = None
+    S3_ACCESS_KEY_ID: Optional[str] = None
+    S3_SECRET_ACCESS_KEY: Optional[str] = None
+    S3_PUBLIC_BASE_URL: Optional[str] = None  # defaults to <endpoint>/<bucket>
+    S3_PRESIGN_EXPIRES_SECONDS: int = 900
+    PRODUCT_IMAGE_MAX_BYTES: int = 10 * 1024 * 1024
+    IMAGE_WORKER_PROCESSES: int = 2
+
+    # Category name registry reload (picks up other workers' renames)
+    CATEGORY_REGISTRY_RELOAD_SECONDS: int = 60
+
+    # Opening hours reload (other workers' schedule changes, failed warm-up)
+    OPENING_HOURS_RELOAD_SECONDS: int = 60
+
+    # open_now listings: rows read per query, and the most scanned per page
+    # (a page may come back short, with a cursor to keep scanning)
+    OPEN_NOW_BATCH_SIZE: int = 500
+    OPEN_NOW_SCAN_LIMIT: int = 5000
+
+    # Delivery zone reload (other workers' zone changes, failed warm-up)
+    DELIVERY_ZONES_RELOAD_SECONDS: int = 60
+
+    # Geo index reload (restaurants added or moved by other workers)
+    GEO_INDEX_RELOAD_SECONDS: int = 60
+
+    # Popularity ranking (background job)
+    POPULARITY_REFRESH_SECONDS: int = 300
+    POPULARITY_WINDOW_DAYS: int = 30
+    POPULARITY_HALF_LIFE_DAYS: float = 7.0
+
+    # Frequently-bought-together recommendations (background job)
+    RECOMMENDATIONS_REFRESH_SECONDS: int = 3600
+    RECOMMENDATIONS_WINDOW_DAYS: int = 180
+    RECOMMENDATIONS_TOP_K: int = 20
+    RECOMMENDATIONS_MIN_CO_ORDERS: int = 2
+
+    # Sales dashboard (reads daily rollups)
+    SALES_DASHBOARD_MAX_DAYS: int = 366
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 settings = Settings()
@@ -59,4 +59,12 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+def get_dialect_name(db: AsyncSession) -> str:
+    """
+    Name of the SQL dialect behind a session ("postgresql", "sqlite", ...).
+    Used where Postgres-specific SQL needs a local SQLite equivalent.
+    """
+    return db.get_bind().dialect.name
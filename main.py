@@ -16,17 +16,119 @@ from controllers.payment_controller import router as payment_router
 from controllers.address_controller import router as address_router
 from controllers.delivery_controller import router as delivery_router
 from controllers.favorite_controller import router as favorite_router
+from controllers.search_controller import router as search_router
+from controllers.catalog_controller import router as catalog_router
+from controllers.review_controller import router as review_router
+from controllers.sales_controller import router as sales_router
+from controllers.kitchen_controller import router as kitchen_router
 
 
 from schemas.response_schema import APIResponse
 from core.config import settings
+from db.database import AsyncSessionLocal
+from services.search_services import rebuild_typeahead_index
+from services.category_services import load_category_registry, reload_category_registry_job
+from services.restaurant_services import (
+    load_geo_index,
+    load_opening_hours,
+    load_delivery_zones,
+    reload_opening_hours_job,
+    reload_delivery_zones_job,
+    reload_geo_index_job,
+)
+from services.popularity_services import refresh_popularity_job
+from services.recommendation_services import refresh_recommendations_job
+from services.order_load_services import load_order_load, resync_order_load_job
+from services.order_services import expire_pending_orders_job
+from utils.image_worker import image_worker_pool
+from utils.periodic_task import PeriodicTask
+from utils.logger_utils import get_logger
 import utils.firebase  # IMPORTANT
 import models
 
 
+logger = get_logger(__name__)
+
+popularity_task = PeriodicTask(
+    "popularity-refresh",
+    settings.POPULARITY_REFRESH_SECONDS,
+    refresh_popularity_job,
+)
+
+recommendations_task = PeriodicTask(
+    "recommendations-refresh",
+    settings.RECOMMENDATIONS_REFRESH_SECONDS,
+    refresh_recommendations_job,
+)
+
+category_registry_task = PeriodicTask(
+    "category-registry-reload",
+    settings.CATEGORY_REGISTRY_RELOAD_SECONDS,
+    reload_category_registry_job,
+)
+
+geo_index_task = PeriodicTask(
+    "geo-index-reload",
+    settings.GEO_INDEX_RELOAD_SECONDS,
+    reload_geo_index_job,
+)
+
+opening_hours_task = PeriodicTask(
+    "opening-hours-reload",
+    settings.OPENING_HOURS_RELOAD_SECONDS,
+    reload_opening_hours_job,
+)
+
+delivery_zones_task = PeriodicTask(
+    "delivery-zones-reload",
+    settings.DELIVERY_ZONES_RELOAD_SECONDS,
+    reload_delivery_zones_job,
+)
+
+order_load_task = PeriodicTask(
+    "order-load-resync",
+    settings.ORDER_LOAD_RESYNC_SECONDS,
+    resync_order_load_job,
+)
+
+order_expiry_task = PeriodicTask(
+    "order-expiry",
+    settings.ORDER_EXPIRY_SWEEP_SECONDS,
+    expire_pending_orders_job,
+)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Warm in-memory read indexes; the API still serves if the DB is unreachable
+    try:
+        async with AsyncSessionLocal() as db:
+            await rebuild_typeahead_index(db)
+            await load_category_registry(db)
+            await load_geo_index(db)
+            await load_opening_hours(db)
+            await load_delivery_zones(db)
+            await load_order_load(db)
+    except Exception as e:
+        logger.error("Startup index build failed: %s", str(e))
+    popularity_task.start()
+    recommendations_task.start()
+    category_registry_task.start()
+    geo_index_task.start()
+    opening_hours_task.start()
+    delivery_zones_task.start()
+    order_load_task.start()
+    order_expiry_task.start()
     yield
+    await order_expiry_task.stop()
+    await order_load_task.stop()
+    await delivery_zones_task.stop()
+    await opening_hours_task.stop()
+    await geo_index_task.stop()
+    await category_registry_task.stop()
+    await recommendations_task.stop()
+    await popularity_task.stop()
+    image_worker_pool.shutdown()
 
 
 app = FastAPI(
@@ -94,6 +196,11 @@ api_router.include_router(payment_router)
 api_router.include_router(address_router)
 api_router.include_router(delivery_router)
 api_router.include_router(favorite_router)
+api_router.include_router(search_router)
+api_router.include_router(catalog_router)
+api_router.include_router(review_router)
+api_router.include_router(sales_router)
+api_router.include_router(kitchen_router)
 
 
 app.include_router(api_router)
@@ -12,6 +12,13 @@ from .payment_model import Payment
 from .audit_log_model import AuditLog
 from .inventory_history_model import InventoryHistory
 from .favorite_model import Favorite
+from .catalog_change_model import CatalogChange
+from .product_recommendation_model import ProductRecommendation
+from .restaurant_hours_model import RestaurantHours
+from .review_model import Review
+from .delivery_zone_model import DeliveryZone
+from .restaurant_daily_sales_model import RestaurantDailySales
+from .product_daily_sales_model import ProductDailySales
 
 __all__ = [
     "User",
@@ -28,5 +35,12 @@ __all__ = [
     "AuditLog",
     "InventoryHistory",
     "Favorite",
+    "CatalogChange",
+    "ProductRecommendation",
+    "RestaurantHours",
+    "Review",
+    "DeliveryZone",
+    "RestaurantDailySales",
+    "ProductDailySales",
 ]
 
@@ -26,6 +26,9 @@ class Address(Base, TimestampMixin):
 
     country: Mapped[str] = mapped_column(String(100), nullable=False)
 
+    latitude: Mapped[float | None]
+    longitude: Mapped[float | None]
+
     is_default: Mapped[bool] = mapped_column(server_default="false", nullable=False)
 
     # Relationships
@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.database import Base
+
+
+class CatalogChange(Base):
+    """
+    Append-only log of catalog writes. The autoincrement id is the
+    catalog version clients sync from (`GET /catalog/changes?since=`);
+    ids are allocated in commit order.
+    """
+    __tablename__ = "catalog_changes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    entity_type: Mapped[str] = mapped_column(String(20), nullable=False)  # product | category | restaurant
+    entity_id: Mapped[int] = mapped_column(nullable=False)
+
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
@@ -0,0 +1,23 @@
+from sqlalchemy import ForeignKey, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.database import Base
+
+
+class DeliveryZone(Base):
+    """
+    One delivery polygon of a restaurant, as a list of [latitude, longitude]
+    vertices. A restaurant with no zones delivers anywhere within the
+    distance limit.
+    """
+    __tablename__ = "delivery_zones"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    restaurant_id: Mapped[int] = mapped_column(
+        ForeignKey("restaurants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    polygon: Mapped[list] = mapped_column(JSON, nullable=False)
@@ -1,5 +1,5 @@
 from typing import Optional
-from sqlalchemy import String, Numeric, ForeignKey
+from sqlalchemy import String, Numeric, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.database import Base
@@ -8,6 +8,10 @@ from models.base_model import TimestampMixin
 
 class Order(Base, TimestampMixin):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Kitchen queue: a restaurant's orders in a status, oldest first
+        Index("ix_orders_restaurant_status_created", "restaurant_id", "status", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -26,7 +30,7 @@ class Order(Base, TimestampMixin):
     status: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        default="pending"  # pending | confirmed | preparing | delivered | cancelled
+        default="pending"  # pending | confirmed | preparing | delivered | cancelled | expired_unreleased
     )
 
     total_amount: Mapped[float] = mapped_column(
@@ -37,7 +41,7 @@ class Order(Base, TimestampMixin):
     payment_status: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        default="unpaid"  # unpaid | paid | failed | refunded
+        default="unpaid"  # unpaid | paid | failed | refunded | refund_pending
     )
 
     # Uber Direct Fields
@@ -30,7 +30,7 @@ class Payment(Base, TimestampMixin):
         String(50),
         nullable=False,
         default="pending"
-    )  # pending | completed | failed | refunded
+    )  # pending | completed | failed | refunded | refund_pending
 
     # Relationships
     order = relationship("Order", back_populates="payment")
@@ -0,0 +1,31 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Index, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.database import Base
+
+
+class ProductDailySales(Base):
+    """
+    Units and item revenue of a product per day, from the same orders as
+    RestaurantDailySales. `restaurant_id` is denormalized so a restaurant's
+    product breakdown is one index range scan.
+    """
+    __tablename__ = "product_daily_sales"
+    __table_args__ = (
+        Index("ix_product_daily_sales_restaurant_day", "restaurant_id", "day"),
+    )
+
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    restaurant_id: Mapped[int] = mapped_column(
+        ForeignKey("restaurants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    units: Mapped[int] = mapped_column(nullable=False, default=0)
+    revenue: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean, Numeric, ForeignKey
+from sqlalchemy import String, Boolean, Numeric, ForeignKey, Index, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.database import Base
@@ -18,8 +18,18 @@ class Product(Base, TimestampMixin):
 
     image_url: Mapped[str | None] = mapped_column(String)
 
+    # Filled in by the image worker after an upload: JPEG thumbnail and
+    # WebP variants keyed by name ("webp_320", ...)
+    thumbnail_url: Mapped[str | None] = mapped_column(String)
+    image_variants: Mapped[dict | None] = mapped_column(JSON)
+
     is_available: Mapped[bool] = mapped_column(Boolean, server_default="true", nullable=False)
 
+    # Maintained by review writes: Bayesian average over rating_sum / rating_count
+    rating: Mapped[float | None]
+    rating_count: Mapped[int] = mapped_column(server_default="0", default=0, nullable=False)
+    rating_sum: Mapped[int] = mapped_column(server_default="0", default=0, nullable=False)
+
     category_id: Mapped[int] = mapped_column(
         ForeignKey("categories.id", ondelete="CASCADE"),
         nullable=False,
@@ -32,6 +42,14 @@ class Product(Base, TimestampMixin):
         index=True
     )
 
+    # Composite indexes backing keyset pagination of the product listing
+    __table_args__ = (
+        Index("ix_products_available_price_id", "is_available", "price", "id"),
+        Index("ix_products_available_name_id", "is_available", "name", "id"),
+        Index("ix_products_restaurant_available_price_id", "restaurant_id", "is_available", "price", "id"),
+        Index("ix_products_category_available_price_id", "category_id", "is_available", "price", "id"),
+    )
+
     # Relationships
     category = relationship(
         "Category",
@@ -0,0 +1,27 @@
+from sqlalchemy import Float, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.database import Base
+
+
+class ProductRecommendation(Base):
+    """
+    Precomputed "frequently bought together" neighbours: the top-k products
+    most often ordered with `product_id`, ranked from 0. The whole table is
+    rebuilt by the recommendations job.
+    """
+    __tablename__ = "product_recommendations"
+
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    rank: Mapped[int] = mapped_column(primary_key=True)
+
+    recommended_product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    score: Mapped[float] = mapped_column(Float, nullable=False)  # cosine of the two order sets
+    co_orders: Mapped[int] = mapped_column(nullable=False)  # orders containing both products
@@ -0,0 +1,25 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.database import Base
+
+
+class RestaurantDailySales(Base):
+    """
+    Paid, non-cancelled orders of a restaurant per day (RESTAURANT_TIMEZONE,
+    by order placement). Maintained incrementally on payment and
+    cancellation; rebuilt for a date range by the sales backfill.
+    """
+    __tablename__ = "restaurant_daily_sales"
+
+    restaurant_id: Mapped[int] = mapped_column(
+        ForeignKey("restaurants.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    orders: Mapped[int] = mapped_column(nullable=False, default=0)
+    revenue: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False, default=0)  # incl. delivery fees
+    delivery_fees: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False, default=0)
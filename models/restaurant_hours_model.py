@@ -0,0 +1,25 @@
+from sqlalchemy import ForeignKey, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.database import Base
+
+
+class RestaurantHours(Base):
+    """
+    One opening interval of a restaurant's weekly schedule, in minutes of
+    the day (RESTAURANT_TIMEZONE). `close_minute <= open_minute` means the
+    interval runs past midnight into the next day.
+    """
+    __tablename__ = "restaurant_hours"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    restaurant_id: Mapped[int] = mapped_column(
+        ForeignKey("restaurants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    day_of_week: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # 0 = Monday
+    open_minute: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # 0..1439
+    close_minute: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # 0..1439
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean
+from sqlalchemy import String, Boolean, Index, func, literal_column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.database import Base
@@ -30,7 +30,25 @@ class Restaurant(Base, TimestampMixin):
     longitude: Mapped[float | None]
     phone_number: Mapped[str | None] = mapped_column(String(20))
 
+    # Maintained by review writes: Bayesian average over rating_sum / rating_count
     rating: Mapped[float | None]
+    rating_count: Mapped[int] = mapped_column(server_default="0", default=0, nullable=False)
+    rating_sum: Mapped[int] = mapped_column(server_default="0", default=0, nullable=False)
+
+    # Listing sort keys (see restaurant_repository.RESTAURANT_SORT_KEYS);
+    # unrated restaurants sort as rating 0
+    __table_args__ = (
+        Index(
+            "ix_restaurants_active_rating_id",
+            "is_active", func.coalesce(literal_column("rating"), literal_column("0")), "id",
+        ),
+        Index("ix_restaurants_active_name_id", "is_active", "name", "id"),
+        Index(
+            "ix_restaurants_active_city_rating_id",
+            "is_active", "city", func.coalesce(literal_column("rating"), literal_column("0")), "id",
+        ),
+        Index("ix_restaurants_active_city_name_id", "is_active", "city", "name", "id"),
+    )
 
     # Relationships
     orders = relationship(
@@ -0,0 +1,57 @@
+from sqlalchemy import ForeignKey, Index, SmallInteger, String, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from db.database import Base
+from models.base_model import TimestampMixin
+
+
+class Review(Base, TimestampMixin):
+    """
+    A rating left for a paid order: for its restaurant (`product_id` is
+    NULL) or for one of its products. At most one of each per order.
+    """
+    __tablename__ = "reviews"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    order_id: Mapped[int] = mapped_column(
+        ForeignKey("orders.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    restaurant_id: Mapped[int] = mapped_column(
+        ForeignKey("restaurants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    product_id: Mapped[int | None] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+    )
+
+    rating: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # 1..5
+
+    comment: Mapped[str | None] = mapped_column(String(1000))
+
+    __table_args__ = (
+        # One restaurant review and one review per product, per order
+        Index(
+            "ux_reviews_order_restaurant", "order_id", unique=True,
+            postgresql_where=text("product_id IS NULL"), sqlite_where=text("product_id IS NULL"),
+        ),
+        Index(
+            "ux_reviews_order_product", "order_id", "product_id", unique=True,
+            postgresql_where=text("product_id IS NOT NULL"), sqlite_where=text("product_id IS NOT NULL"),
+        ),
+        # Newest-first review lists per restaurant / product
+        Index("ix_reviews_restaurant_product_id", "restaurant_id", "product_id", "id"),
+        Index("ix_reviews_product_id", "product_id", "id"),
+    )
+
+    # Relationships
+    user = relationship("User")
@@ -1,5 +1,7 @@
+from datetime import datetime
+from typing import Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
 
 from models.cart_model import Cart
@@ -20,6 +22,34 @@ async def get_cart_by_user_id(db: AsyncSession, user_id: int) -> Cart | None:
     return result.scalars().first()
 
 
+async def get_cart_version(db: AsyncSession, user_id: int) -> Optional[Tuple]:
+    """
+    Cheap change marker for a user's cart, used for conditional GETs:
+    (cart_id, cart.updated_at, latest item update, item count, latest product update).
+    Adding, changing or removing an item, or editing a product in the cart, changes it.
+    """
+    result = await db.execute(
+        select(
+            Cart.id,
+            Cart.updated_at,
+            func.max(CartItem.updated_at),
+            func.count(CartItem.id),
+            func.max(Product.updated_at),
+        )
+        .outerjoin(CartItem, CartItem.cart_id == Cart.id)
+        .outerjoin(Product, Product.id == CartItem.product_id)
+        .where(Cart.user_id == user_id)
+        .group_by(Cart.id, Cart.updated_at)
+    )
+    row = result.first()
+    return tuple(row) if row else None
+
+
+def latest_change(version: Tuple) -> datetime:
+    """Most recent timestamp in a cart version tuple."""
+    return max(t for t in (version[1], version[2], version[4]) if t is not None)
+
+
 async def create_cart(db: AsyncSession, user_id: int) -> Cart:
     cart = Cart(user_id=user_id)
     db.add(cart)
@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.database import get_dialect_name
+from models.catalog_change_model import CatalogChange
+
+
+# Arbitrary constant naming the Postgres advisory lock that orders catalog versions
+CATALOG_VERSION_LOCK_KEY = 7301
+
+
+async def record_changes(db: AsyncSession, entity_type: str, entity_ids: Iterable[int]) -> None:
+    """
+    Append one change row per id (single multi-row INSERT). Does not commit:
+    called right before the catalog write's own commit, so the change is
+    logged exactly when the write lands.
+
+    Versions must become visible in id order, or a feed reader could move
+    past a lower id that commits later. On Postgres the ids are allocated
+    under a transaction-scoped advisory lock held until commit, so catalog
+    writers commit in version order. SQLite already serializes writers.
+    """
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"entity_type": entity_type, "entity_id": entity_id, "changed_at": now}
+        for entity_id in entity_ids
+    ]
+    if not rows:
+        return
+    if get_dialect_name(db) == "postgresql":
+        await db.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"),
+            {"key": CATALOG_VERSION_LOCK_KEY},
+        )
+    await db.execute(insert(CatalogChange), rows)
+
+
+async def get_changes_since(
+    db: AsyncSession,
+    since: int,
+    limit: int,
+) -> List[CatalogChange]:
+    """Changes with version > `since`, oldest first, at most `limit` rows."""
+    result = await db.execute(
+        select(CatalogChange)
+        .where(CatalogChange.id > since)
+        .order_by(CatalogChange.id)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def get_latest_version(db: AsyncSession) -> Optional[int]:
+    result = await db.execute(select(func.max(CatalogChange.id)))
+    return result.scalar()
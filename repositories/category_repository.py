@@ -1,14 +1,17 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from models.category_model import Category
+from repositories import catalog_change_repository
 from schemas.category_schema import CategoryCreate, CategoryUpdate
 
 
 async def create(db: AsyncSession, category_in: CategoryCreate) -> Category:
     category = Category(**category_in.dict())
     db.add(category)
+    await db.flush()
+    await catalog_change_repository.record_changes(db, "category", [category.id])
     await db.commit()
     await db.refresh(category)
     return category
@@ -19,6 +22,15 @@ async def get_by_id(db: AsyncSession, category_id: int) -> Optional[Category]:
     return result.scalar_one_or_none()
 
 
+async def get_by_ids(db: AsyncSession, category_ids: Set[int]) -> List[Category]:
+    if not category_ids:
+        return []
+    result = await db.execute(
+        select(Category).where(Category.id.in_(category_ids)).order_by(Category.id)
+    )
+    return result.scalars().all()
+
+
 async def get_all(db: AsyncSession) -> List[Category]:
     result = await db.execute(select(Category))
     return result.scalars().all()
@@ -38,6 +50,7 @@ async def update(
     for field, value in update_data.items():
         setattr(category, field, value)
 
+    await catalog_change_repository.record_changes(db, "category", [category.id])
     await db.commit()
     await db.refresh(category)
     return category
@@ -1,9 +1,10 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from models.category_model import Category
 from models.inventory_history_model import InventoryHistory
+from models.inventory_model import ProductInventory
 
 
 async def get_category_with_lock(db: AsyncSession, category_id: int) -> Optional[Category]:
@@ -48,3 +49,99 @@ async def get_history_by_category(db: AsyncSession, category_id: int) -> List[In
         .order_by(InventoryHistory.created_at.desc())
     )
     return result.scalars().all()
+
+
+# ─────────────────────────────────────────────
+# Product-level inventory
+#
+# Every stock movement is a single conditional UPDATE: the row lock is held
+# only for that statement, and the WHERE clause enforces the invariant
+# instead of a read-check-write. None of these commit.
+# ─────────────────────────────────────────────
+
+async def get_product_inventory(db: AsyncSession, product_id: int) -> Optional[ProductInventory]:
+    result = await db.execute(
+        select(ProductInventory).where(ProductInventory.product_id == product_id)
+    )
+    return result.scalars().first()
+
+
+async def get_tracked_product_ids(db: AsyncSession, product_ids: Iterable[int]) -> Set[int]:
+    """Ids among `product_ids` that have an inventory row (others are not stock-tracked)."""
+    product_ids = set(product_ids)
+    if not product_ids:
+        return set()
+    result = await db.execute(
+        select(ProductInventory.product_id).where(ProductInventory.product_id.in_(product_ids))
+    )
+    return set(result.scalars().all())
+
+
+async def create_product_inventory(db: AsyncSession, product_id: int, available: int) -> ProductInventory:
+    inventory = ProductInventory(product_id=product_id, available_quantity=available, reserved_quantity=0)
+    db.add(inventory)
+    await db.flush()
+    return inventory
+
+
+async def set_available_stock(db: AsyncSession, product_id: int, available: int) -> bool:
+    result = await db.execute(
+        update(ProductInventory)
+        .where(ProductInventory.product_id == product_id)
+        .values(available_quantity=available)
+    )
+    return result.rowcount == 1
+
+
+async def add_available_stock(db: AsyncSession, product_id: int, quantity: int) -> bool:
+    result = await db.execute(
+        update(ProductInventory)
+        .where(ProductInventory.product_id == product_id)
+        .values(available_quantity=ProductInventory.available_quantity + quantity)
+    )
+    return result.rowcount == 1
+
+
+async def reserve_stock(db: AsyncSession, product_id: int, quantity: int) -> bool:
+    """Move `quantity` from available to reserved; False if not enough is available."""
+    result = await db.execute(
+        update(ProductInventory)
+        .where(
+            ProductInventory.product_id == product_id,
+            ProductInventory.available_quantity >= quantity,
+        )
+        .values(
+            available_quantity=ProductInventory.available_quantity - quantity,
+            reserved_quantity=ProductInventory.reserved_quantity + quantity,
+        )
+    )
+    return result.rowcount == 1
+
+
+async def commit_reserved_stock(db: AsyncSession, product_id: int, quantity: int) -> bool:
+    """Consume a reservation (the stock is sold)."""
+    result = await db.execute(
+        update(ProductInventory)
+        .where(
+            ProductInventory.product_id == product_id,
+            ProductInventory.reserved_quantity >= quantity,
+        )
+        .values(reserved_quantity=ProductInventory.reserved_quantity - quantity)
+    )
+    return result.rowcount == 1
+
+
+async def release_reserved_stock(db: AsyncSession, product_id: int, quantity: int) -> bool:
+    """Return a reservation to available stock."""
+    result = await db.execute(
+        update(ProductInventory)
+        .where(
+            ProductInventory.product_id == product_id,
+            ProductInventory.reserved_quantity >= quantity,
+        )
+        .values(
+            available_quantity=ProductInventory.available_quantity + quantity,
+            reserved_quantity=ProductInventory.reserved_quantity - quantity,
+        )
+    )
+    return result.rowcount == 1
@@ -1,7 +1,8 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func
+from sqlalchemy.orm import load_only, selectinload
 
 from models.order_model import Order
 from models.order_item_model import OrderItem
@@ -16,6 +17,7 @@ async def create_order(
     delivery_fee: float = 0.0,
     uber_quote_id: Optional[str] = None
 ) -> Order:
+    """Does not commit: the order is committed with its items and stock reservation."""
     order = Order(
         user_id=user_id,
         restaurant_id=restaurant_id,
@@ -26,8 +28,7 @@ async def create_order(
         payment_status="unpaid"
     )
     db.add(order)
-    await db.commit()
-    await db.refresh(order)
+    await db.flush()
     return order
 
 
@@ -36,6 +37,7 @@ async def create_order_items(
     order_id: int,
     items_data: List[dict]
 ) -> List[OrderItem]:
+    """Does not commit."""
     created_items = []
     for item in items_data:
         order_item = OrderItem(
@@ -47,7 +49,7 @@ async def create_order_items(
         db.add(order_item)
         created_items.append(order_item)
     
-    await db.commit()
+    await db.flush()
     return created_items
 
 
@@ -63,15 +65,70 @@ async def get_order_by_id(db: AsyncSession, order_id: int) -> Order | None:
     return result.scalars().first()
 
 
-async def get_user_orders(db: AsyncSession, user_id: int) -> List[Order]:
+async def get_order_for_update(db: AsyncSession, order_id: int) -> Order | None:
+    """Order with its items, row-locked until commit so status changes serialize."""
     result = await db.execute(
+        select(Order)
+        .where(Order.id == order_id)
+        .with_for_update(of=Order)
+        .options(selectinload(Order.items).selectinload(OrderItem.product))
+    )
+    return result.scalars().first()
+
+
+async def get_order_version(db: AsyncSession, order_id: int) -> Optional[Tuple[int, datetime]]:
+    """(user_id, updated_at) of an order, without loading items. Used for conditional GETs."""
+    result = await db.execute(
+        select(Order.user_id, Order.updated_at).where(Order.id == order_id)
+    )
+    row = result.first()
+    return (row[0], row[1]) if row else None
+
+
+async def get_user_orders(
+    db: AsyncSession,
+    user_id: int,
+    columns: Optional[Sequence[str]] = None,
+) -> List[Order]:
+    """
+    `columns` limits the loaded order columns; items are only loaded
+    when "items" is among them.
+    """
+    query = (
         select(Order)
         .where(Order.user_id == user_id)
         .order_by(Order.created_at.desc())
-        .options(
+    )
+
+    if columns:
+        query = query.options(
+            load_only(*(getattr(Order, name) for name in columns if name != "items"))
+        )
+        if "items" in columns:
+            query = query.options(selectinload(Order.items).selectinload(OrderItem.product))
+    else:
+        query = query.options(
             selectinload(Order.items).selectinload(OrderItem.product),
             selectinload(Order.restaurant)
         )
+
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def get_restaurant_orders(
+    db: AsyncSession,
+    restaurant_id: int,
+    statuses: Sequence[str],
+    limit: int,
+) -> List[Order]:
+    """A restaurant's orders in `statuses`, oldest first (ix_orders_restaurant_status_created)."""
+    result = await db.execute(
+        select(Order)
+        .where(Order.restaurant_id == restaurant_id, Order.status.in_(statuses))
+        .order_by(Order.created_at, Order.id)
+        .limit(limit)
+        .options(selectinload(Order.items).selectinload(OrderItem.product))
     )
     return result.scalars().all()
 
@@ -83,3 +140,32 @@ async def update_order_status(db: AsyncSession, order_id: int, status: str) -> O
         await db.commit()
         await db.refresh(order)
     return order
+
+
+async def get_status_counts(
+    db: AsyncSession,
+    statuses: Sequence[str],
+    since: datetime,
+) -> List[Tuple[int, str, int]]:
+    """(restaurant_id, status, count) of orders in `statuses` created since `since`."""
+    result = await db.execute(
+        select(Order.restaurant_id, Order.status, func.count())
+        .where(Order.status.in_(statuses), Order.created_at >= since)
+        .group_by(Order.restaurant_id, Order.status)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+async def get_stale_pending_order_ids(db: AsyncSession, before: datetime, limit: int) -> List[int]:
+    """Unpaid pending orders placed before `before`, oldest first."""
+    result = await db.execute(
+        select(Order.id)
+        .where(
+            Order.status == "pending",
+            Order.payment_status == "unpaid",
+            Order.created_at < before,
+        )
+        .order_by(Order.created_at)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
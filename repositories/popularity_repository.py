@@ -0,0 +1,54 @@
+"""
+Popularity Repository - Async Database Operations
+
+Windowed, per-day aggregates used by the popularity job. Rows are grouped
+by product and day in SQL, so the job reads at most one row per product
+per day instead of raw order items.
+"""
+
+from datetime import date, datetime
+from typing import List, Tuple
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.product_model import Product
+from models.order_model import Order
+from models.order_item_model import OrderItem
+from models.favorite_model import Favorite
+
+
+def _as_date(value) -> date:
+    # SQLite returns date() as an ISO string
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+async def get_daily_units(db: AsyncSession, since: datetime) -> List[Tuple[int, int, date, int]]:
+    """(product_id, restaurant_id, day, units ordered) for non-cancelled orders since `since`."""
+    day = func.date(Order.created_at)
+    result = await db.execute(
+        select(OrderItem.product_id, Product.restaurant_id, day, func.sum(OrderItem.quantity))
+        .join(Order, Order.id == OrderItem.order_id)
+        .join(Product, Product.id == OrderItem.product_id)
+        .where(
+            Order.created_at >= since,
+            Order.status != "cancelled",
+            Product.is_available.is_(True),
+        )
+        .group_by(OrderItem.product_id, Product.restaurant_id, day)
+    )
+    return [(row[0], row[1], _as_date(row[2]), int(row[3])) for row in result.all()]
+
+
+async def get_daily_favorites(db: AsyncSession, since: datetime) -> List[Tuple[int, int, date, int]]:
+    """(product_id, restaurant_id, day, favorites added) since `since`."""
+    day = func.date(Favorite.created_at)
+    result = await db.execute(
+        select(Favorite.product_id, Product.restaurant_id, day, func.count(Favorite.id))
+        .join(Product, Product.id == Favorite.product_id)
+        .where(
+            Favorite.created_at >= since,
+            Product.is_available.is_(True),
+        )
+        .group_by(Favorite.product_id, Product.restaurant_id, day)
+    )
+    return [(row[0], row[1], _as_date(row[2]), int(row[3])) for row in result.all()]
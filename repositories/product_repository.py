@@ -8,14 +8,44 @@ All functions are async and use SQLAlchemy 2.0 async patterns:
 - await session.refresh(obj)
 """
 
-from typing import List, Optional
-from sqlalchemy import select
+import re
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import (
+    select,
+    update as sql_update,
+    case,
+    tuple_,
+    func,
+    literal,
+    literal_column,
+    table,
+    column,
+    text,
+    union_all,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from db.database import get_dialect_name
 from models.product_model import Product
+from models.category_model import Category
+from repositories import catalog_change_repository
 from schemas.product_schema import ProductCreate, ProductUpdate
 
 
+# sort name -> (key columns, descending)
+PRODUCT_SORT_KEYS = {
+    "newest": ((Product.id,), True),
+    "price_asc": ((Product.price, Product.id), False),
+    "price_desc": ((Product.price, Product.id), True),
+    "name": ((Product.name, Product.id), False),
+}
+
+# Upper bounds of the price facet buckets; the last bucket is open-ended
+PRICE_FACET_EDGES = (100, 200, 300, 500)
+
+
 async def create(
     db: AsyncSession,
     product: ProductCreate
@@ -41,12 +71,55 @@ async def create_with_category_id(
     )
 
     db.add(db_product)
+    await db.flush()
+    await catalog_change_repository.record_changes(db, "product", [db_product.id])
     await db.commit()
     await db.refresh(db_product)
 
     return db_product
 
 
+async def create_many(
+    db: AsyncSession,
+    products: List[Tuple[ProductCreate, int]],
+) -> List[Product]:
+    """Insert a batch of (product, category_id) pairs in one flush and one commit."""
+    db_products = [
+        Product(
+            name=product.name,
+            description=product.description,
+            price=product.price,
+            image_url=product.image_url,
+            is_available=product.is_available,
+            category_id=category_id,
+            restaurant_id=product.restaurant_id,
+        )
+        for product, category_id in products
+    ]
+
+    db.add_all(db_products)
+    await db.flush()
+    await catalog_change_repository.record_changes(db, "product", [p.id for p in db_products])
+    await db.commit()
+
+    return db_products
+
+
+async def get_existing_names(
+    db: AsyncSession,
+    keys: Set[Tuple[int, str]],
+) -> Set[Tuple[int, str]]:
+    """Which of the given (restaurant_id, name) pairs already exist."""
+    if not keys:
+        return set()
+    result = await db.execute(
+        select(Product.restaurant_id, Product.name).where(
+            tuple_(Product.restaurant_id, Product.name).in_(list(keys))
+        )
+    )
+    return {(row[0], row[1]) for row in result.all()}
+
+
 async def get_by_id(
     db: AsyncSession,
     product_id: int
@@ -57,6 +130,18 @@ async def get_by_id(
     return result.scalars().first()
 
 
+async def get_by_ids(
+    db: AsyncSession,
+    product_ids: Set[int],
+) -> List[Product]:
+    if not product_ids:
+        return []
+    result = await db.execute(
+        select(Product).where(Product.id.in_(product_ids)).order_by(Product.id)
+    )
+    return list(result.scalars().all())
+
+
 async def get_all(
     db: AsyncSession
 ) -> List[Product]:
@@ -64,6 +149,272 @@ async def get_all(
     return list(result.scalars().all())
 
 
+def _listing_filters(
+    restaurant_id: Optional[int],
+    category_id: Optional[int],
+    min_price: Optional[float],
+    max_price: Optional[float],
+) -> List[Any]:
+    conditions = [Product.is_available.is_(True)]
+    if restaurant_id is not None:
+        conditions.append(Product.restaurant_id == restaurant_id)
+    if category_id is not None:
+        conditions.append(Product.category_id == category_id)
+    if min_price is not None:
+        conditions.append(Product.price >= min_price)
+    if max_price is not None:
+        conditions.append(Product.price <= max_price)
+    return conditions
+
+
+async def get_page(
+    db: AsyncSession,
+    *,
+    limit: int,
+    sort: str = "newest",
+    after: Optional[List[Any]] = None,
+    restaurant_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> List[Product]:
+    """
+    Fetch one keyset page of available products.
+
+    `after` holds the sort key values of the last row of the previous page.
+    One extra row is fetched so the caller can tell whether a next page exists.
+    `columns` limits the loaded attributes (sort key columns are always loaded).
+    """
+    key_columns, descending = PRODUCT_SORT_KEYS[sort]
+
+    query = select(Product).where(
+        *_listing_filters(restaurant_id, category_id, min_price, max_price)
+    )
+    if columns:
+        names = set(columns) | {c.key for c in key_columns}
+        query = query.options(load_only(*(getattr(Product, name) for name in names)))
+
+    if after:
+        key = tuple_(*key_columns)
+        values = tuple_(*after)
+        query = query.where(key < values if descending else key > values)
+
+    order_by = [c.desc() if descending else c.asc() for c in key_columns]
+    result = await db.execute(query.order_by(*order_by).limit(limit + 1))
+    return list(result.scalars().all())
+
+
+async def get_facet_counts(
+    db: AsyncSession,
+    *,
+    restaurant_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+) -> Dict[str, Dict[int, int]]:
+    """
+    Count available products per category, per restaurant and per price
+    bucket (index into PRICE_FACET_EDGES) for the listing filters, in one
+    grouped query.
+
+    Postgres uses GROUPING SETS (a single scan); SQLite has no grouping sets,
+    so the same sets are computed as a UNION ALL of grouped selects.
+    """
+    conditions = _listing_filters(restaurant_id, category_id, min_price, max_price)
+    # Inlined constants keep the expression identical in SELECT and GROUP BY
+    bucket = case(
+        *[
+            (Product.price < literal_column(str(edge)), literal_column(str(i)))
+            for i, edge in enumerate(PRICE_FACET_EDGES)
+        ],
+        else_=literal_column(str(len(PRICE_FACET_EDGES))),
+    )
+
+    if get_dialect_name(db) == "postgresql":
+        # grouping() sets a bit per argument that is NOT grouped in the row's set
+        query = (
+            select(
+                func.grouping(Product.category_id, Product.restaurant_id, bucket),
+                Product.category_id,
+                Product.restaurant_id,
+                bucket,
+                func.count(),
+            )
+            .where(*conditions)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(Product.category_id),
+                    tuple_(Product.restaurant_id),
+                    tuple_(bucket),
+                )
+            )
+        )
+        rows = []
+        for mask, category, restaurant, price_bucket, count in (await db.execute(query)).all():
+            if mask == 0b011:
+                rows.append(("category", category, count))
+            elif mask == 0b101:
+                rows.append(("restaurant", restaurant, count))
+            else:
+                rows.append(("price", price_bucket, count))
+    else:
+        query = union_all(
+            select(literal("category"), Product.category_id, func.count())
+            .where(*conditions)
+            .group_by(Product.category_id),
+            select(literal("restaurant"), Product.restaurant_id, func.count())
+            .where(*conditions)
+            .group_by(Product.restaurant_id),
+            select(literal("price"), bucket, func.count())
+            .where(*conditions)
+            .group_by(bucket),
+        )
+        rows = (await db.execute(query)).all()
+
+    facets: Dict[str, Dict[int, int]] = {"category": {}, "restaurant": {}, "price": {}}
+    for facet, value, count in rows:
+        facets[facet][int(value)] = count
+    return facets
+
+
+def page_key(product: Product, sort: str) -> List[Any]:
+    """Sort key values of a product, in cursor form."""
+    key_columns, _ = PRODUCT_SORT_KEYS[sort]
+    return [getattr(product, c.key) for c in key_columns]
+
+
+def parse_page_key(values: List[Any], sort: str) -> List[Any]:
+    """Restore typed sort key values from a decoded cursor."""
+    key_columns, _ = PRODUCT_SORT_KEYS[sort]
+    if len(values) != len(key_columns):
+        raise ValueError("Cursor does not match sort order")
+
+    parsed = []
+    for column, value in zip(key_columns, values):
+        if column is Product.price:
+            parsed.append(Decimal(str(value)))
+        elif column is Product.id:
+            parsed.append(int(value))
+        else:
+            parsed.append(str(value))
+    return parsed
+
+
+# --------------------------------------------------
+# FULL-TEXT SEARCH
+# --------------------------------------------------
+# Postgres: `products.search_vector` is a generated tsvector column with a
+# GIN index (see migration c7d2e8a41b95), so it follows every write by itself.
+# SQLite (local runs): `products_fts` is an FTS5 table keyed by product id,
+# kept in sync explicitly through `sync_search_document`.
+
+SEARCH_TS_CONFIG = "english"
+
+products_fts = table(
+    "products_fts",
+    column("rowid"),
+    column("name"),
+    column("description"),
+)
+
+_sqlite_fts_ready = False
+
+
+async def _ensure_sqlite_fts(db: AsyncSession) -> None:
+    """Create and backfill the FTS5 table if the local DB predates it."""
+    global _sqlite_fts_ready
+    if _sqlite_fts_ready:
+        return
+
+    exists = await db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'products_fts'")
+    )
+    if exists.first() is None:
+        await db.execute(text("CREATE VIRTUAL TABLE products_fts USING fts5(name, description)"))
+        await db.execute(
+            text(
+                "INSERT INTO products_fts (rowid, name, description) "
+                "SELECT id, name, coalesce(description, '') FROM products"
+            )
+        )
+        await db.commit()
+
+    _sqlite_fts_ready = True
+
+
+def _fts5_query(query: str) -> str:
+    # Quote every term so user input can never be parsed as FTS5 syntax,
+    # and prefix-match the terms so partial words still hit.
+    terms = re.findall(r"\w+", query)
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+async def sync_search_document(db: AsyncSession, product: Product) -> None:
+    """Refresh the search index entry of a product after a write."""
+    await sync_search_documents(db, [product])
+
+
+async def sync_search_documents(db: AsyncSession, products: List[Product]) -> None:
+    """Refresh the search index entries of a batch of products in one round trip."""
+    if not products or get_dialect_name(db) != "sqlite":
+        return  # Postgres generated column is maintained by the database
+
+    await _ensure_sqlite_fts(db)
+    await db.execute(
+        text("DELETE FROM products_fts WHERE rowid = :id"),
+        [{"id": p.id} for p in products],
+    )
+    await db.execute(
+        text("INSERT INTO products_fts (rowid, name, description) VALUES (:id, :name, :description)"),
+        [{"id": p.id, "name": p.name, "description": p.description or ""} for p in products],
+    )
+    await db.commit()
+
+
+async def search(
+    db: AsyncSession,
+    query: str,
+    *,
+    limit: int,
+    offset: int = 0,
+    restaurant_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+) -> List[Tuple[Product, float]]:
+    """
+    Ranked full-text search over available products' name and description.
+
+    Returns (product, rank) pairs, best match first. Fetches one extra row
+    so the caller can tell whether a next page exists.
+    """
+    if get_dialect_name(db) == "sqlite":
+        await _ensure_sqlite_fts(db)
+        fts_ref = literal_column("products_fts")
+        # bm25() is lower-is-better; negate it so rank is higher-is-better.
+        # Name matches weigh ten times description matches.
+        rank = (-func.bm25(fts_ref, 10.0, 1.0)).label("rank")
+        stmt = (
+            select(Product, rank)
+            .join(products_fts, products_fts.c.rowid == Product.id)
+            .where(fts_ref.op("MATCH")(_fts5_query(query)))
+        )
+    else:
+        ts_query = func.websearch_to_tsquery(SEARCH_TS_CONFIG, query)
+        vector = literal_column("products.search_vector")
+        rank = func.ts_rank_cd(vector, ts_query).label("rank")
+        stmt = select(Product, rank).where(vector.op("@@")(ts_query))
+
+    stmt = stmt.where(Product.is_available.is_(True))
+    if restaurant_id is not None:
+        stmt = stmt.where(Product.restaurant_id == restaurant_id)
+    if category_id is not None:
+        stmt = stmt.where(Product.category_id == category_id)
+
+    stmt = stmt.order_by(rank.desc(), Product.id).limit(limit + 1).offset(offset)
+    result = await db.execute(stmt)
+    return [(row[0], float(row[1])) for row in result.all()]
+
+
 async def update(
     db: AsyncSession,
     db_product: Product,
@@ -74,12 +425,56 @@ async def update(
     for field, value in update_data.items():
         setattr(db_product, field, value)
 
+    await catalog_change_repository.record_changes(db, "product", [db_product.id])
     await db.commit()
     await db.refresh(db_product)
 
     return db_product
 
 
+async def bulk_update_price_availability(
+    db: AsyncSession,
+    prices: Dict[int, float],
+    availability: Dict[int, bool],
+) -> Tuple[List[Product], List[int]]:
+    """
+    Apply per-product price / availability changes as one set-based UPDATE
+    (CASE on id) in one transaction.
+
+    Returns (updated products, ids that do not exist).
+    """
+    requested_ids = set(prices) | set(availability)
+
+    result = await db.execute(select(Product.id).where(Product.id.in_(requested_ids)))
+    existing_ids = set(result.scalars().all())
+    missing_ids = sorted(requested_ids - existing_ids)
+
+    if not existing_ids:
+        return [], missing_ids
+
+    values = {}
+    if prices:
+        values["price"] = case(prices, value=Product.id, else_=Product.price)
+    if availability:
+        values["is_available"] = case(availability, value=Product.id, else_=Product.is_available)
+
+    await db.execute(
+        sql_update(Product)
+        .where(Product.id.in_(existing_ids))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    await catalog_change_repository.record_changes(db, "product", sorted(existing_ids))
+    await db.commit()
+
+    result = await db.execute(
+        select(Product)
+        .where(Product.id.in_(existing_ids))
+        .execution_options(populate_existing=True)
+    )
+    return list(result.scalars().all()), missing_ids
+
+
 async def delete(
     db: AsyncSession,
     db_product: Product
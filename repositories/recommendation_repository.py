@@ -0,0 +1,100 @@
+"""
+Recommendation Repository - Async Database Operations
+
+Reads the order history the co-occurrence job needs and swaps in its
+results. Serving reads only touch `product_recommendations`, keyed by
+(product_id, rank).
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Set, Tuple
+from sqlalchemy import select, delete, insert, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.order_model import Order
+from models.order_item_model import OrderItem
+from models.product_model import Product
+from models.product_recommendation_model import ProductRecommendation
+
+
+async def get_order_history_version(db: AsyncSession, since: datetime) -> Tuple:
+    """(order count, latest order update) in the window; changes when the inputs do."""
+    result = await db.execute(
+        select(func.count(Order.id), func.max(Order.updated_at)).where(Order.created_at >= since)
+    )
+    return tuple(result.one())
+
+
+async def get_order_product_pairs(db: AsyncSession, since: datetime) -> List[Tuple[int, int]]:
+    """Distinct (order_id, product_id) for non-cancelled orders since `since`."""
+    result = await db.execute(
+        select(OrderItem.order_id, OrderItem.product_id)
+        .join(Order, Order.id == OrderItem.order_id)
+        .where(
+            Order.created_at >= since,
+            Order.status != "cancelled",
+        )
+        .distinct()
+    )
+    return [tuple(row) for row in result.all()]
+
+
+async def replace_recommendations(db: AsyncSession, rows: Iterable[dict]) -> None:
+    """Swap the whole table in one transaction; readers never see it half-built."""
+    await db.execute(delete(ProductRecommendation))
+    rows = list(rows)
+    if rows:
+        await db.execute(insert(ProductRecommendation), rows)
+    await db.commit()
+
+
+async def get_for_product(
+    db: AsyncSession,
+    product_id: int,
+    limit: int,
+) -> List[Tuple[Product, float]]:
+    """Available neighbours of one product, best first."""
+    result = await db.execute(
+        select(Product, ProductRecommendation.score)
+        .join(ProductRecommendation, ProductRecommendation.recommended_product_id == Product.id)
+        .where(
+            ProductRecommendation.product_id == product_id,
+            Product.is_available.is_(True),
+        )
+        .order_by(ProductRecommendation.rank)
+        .limit(limit)
+    )
+    return [(row[0], row[1]) for row in result.all()]
+
+
+async def get_for_products(
+    db: AsyncSession,
+    product_ids: Set[int],
+    limit: int,
+) -> List[Tuple[Product, float]]:
+    """
+    Available neighbours of a set of products (a cart), excluding the set
+    itself. A neighbour of several products scores the sum of its scores.
+    """
+    if not product_ids:
+        return []
+
+    score = func.sum(ProductRecommendation.score).label("score")
+    ranked = (
+        select(ProductRecommendation.recommended_product_id, score)
+        .where(
+            ProductRecommendation.product_id.in_(product_ids),
+            ProductRecommendation.recommended_product_id.not_in(product_ids),
+        )
+        .group_by(ProductRecommendation.recommended_product_id)
+        .subquery()
+    )
+
+    result = await db.execute(
+        select(Product, ranked.c.score)
+        .join(ranked, ranked.c.recommended_product_id == Product.id)
+        .where(Product.is_available.is_(True))
+        .order_by(ranked.c.score.desc(), Product.id)
+        .limit(limit)
+    )
+    return [(row[0], row[1]) for row in result.all()]
@@ -5,16 +5,33 @@ Placeholder for restaurant-related database operations.
 Uses SQLAlchemy 2.0 async patterns.
 """
 
-from typing import List, Optional
-from sqlalchemy import select
+from typing import Any, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import and_, select, delete, insert, func, literal_column, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from models.restaurant_model import Restaurant
+from models.product_model import Product
+from models.category_model import Category
+from models.restaurant_hours_model import RestaurantHours
+from models.delivery_zone_model import DeliveryZone
+from repositories import catalog_change_repository
 from schemas.restaurant_schema import RestaurantCreate, RestaurantUpdate
 
+# Same expression as the listing indexes, so the planner can use them
+effective_rating = func.coalesce(Restaurant.rating, literal_column("0"))
+
+# sort -> (key columns, descending)
+RESTAURANT_SORT_KEYS = {
+    "rating": ((effective_rating, Restaurant.id), True),
+    "name": ((Restaurant.name, Restaurant.id), False),
+}
+
 async def create_restaurant(db: AsyncSession, restaurant: RestaurantCreate) -> Restaurant:
     db_restaurant = Restaurant(**restaurant.dict())
     db.add(db_restaurant)
+    await db.flush()
+    await catalog_change_repository.record_changes(db, "restaurant", [db_restaurant.id])
     await db.commit()
     await db.refresh(db_restaurant)
     return db_restaurant    
@@ -23,8 +40,12 @@ async def update_restaurant(db: AsyncSession, restaurant_id: int, restaurant: Re
     db_restaurant = await get_restaurant_by_id(db, restaurant_id)
     if not db_restaurant:
         return None
-    for var, value in vars(restaurant).items():
-        setattr(db_restaurant, var, value) if value else None
+    update_data = restaurant.model_dump(exclude_unset=True)
+
+    for field, value in update_data.items():
+        setattr(db_restaurant, field, value)
+
+    await catalog_change_repository.record_changes(db, "restaurant", [restaurant_id])
     await db.commit()
     await db.refresh(db_restaurant)
     return db_restaurant
@@ -33,6 +54,181 @@ async def get_restaurant_by_id(db: AsyncSession, restaurant_id: int) -> Optional
     result = await db.execute(select(Restaurant).where(Restaurant.id == restaurant_id))
     return result.scalar_one_or_none()
 
-async def get_all_restaurants(db: AsyncSession) -> List[Restaurant]:
-    result = await db.execute(select(Restaurant))
-    return result.scalars().all()   
\ No newline at end of file
+async def get_restaurants_by_ids(db: AsyncSession, restaurant_ids: Set[int]) -> List[Restaurant]:
+    if not restaurant_ids:
+        return []
+    result = await db.execute(
+        select(Restaurant).where(Restaurant.id.in_(restaurant_ids)).order_by(Restaurant.id)
+    )
+    return result.scalars().all()
+
+async def get_page(
+    db: AsyncSession,
+    *,
+    limit: int,
+    sort: str = "rating",
+    after: Optional[List[Any]] = None,
+    is_active: bool = True,
+    city: Optional[str] = None,
+    min_rating: Optional[float] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> List[Restaurant]:
+    """
+    Fetch one keyset page of restaurants.
+
+    `after` holds the sort key values of the last row of the previous page.
+    One extra row is fetched so the caller can tell whether a next page exists.
+    `columns` limits the loaded attributes (sort key columns are always loaded).
+    """
+    key_columns, descending = RESTAURANT_SORT_KEYS[sort]
+
+    query = select(Restaurant).where(Restaurant.is_active.is_(is_active))
+    if city is not None:
+        query = query.where(Restaurant.city == city)
+    if min_rating is not None:
+        query = query.where(effective_rating >= min_rating)
+    if columns:
+        names = set(columns) | {"id", "name", "rating"}
+        query = query.options(load_only(*(getattr(Restaurant, name) for name in names)))
+
+    if after:
+        key = tuple_(*key_columns)
+        values = tuple_(*after)
+        query = query.where(key < values if descending else key > values)
+
+    order_by = [c.desc() if descending else c.asc() for c in key_columns]
+    result = await db.execute(query.order_by(*order_by).limit(limit + 1))
+    return list(result.scalars().all())
+
+async def get_menu(
+    db: AsyncSession,
+    restaurant_id: int,
+) -> Optional[Tuple[Restaurant, List[Tuple[Product, Category]]]]:
+    """
+    A restaurant and its available products with their category, in menu
+    order (category name, then product name), in one query. Inactive
+    categories are left out. None if the restaurant does not exist.
+    """
+    # Products join their category first, so a restaurant with no visible
+    # products still comes back as a single row with NULL product columns
+    menu_items = Product.__table__.join(
+        Category.__table__,
+        and_(Product.category_id == Category.id, Category.is_active.is_(True)),
+    )
+    result = await db.execute(
+        select(Restaurant, Product, Category)
+        .select_from(Restaurant)
+        .outerjoin(
+            menu_items,
+            and_(Product.restaurant_id == Restaurant.id, Product.is_available.is_(True)),
+        )
+        .where(Restaurant.id == restaurant_id)
+        .order_by(Category.name, Category.id, Product.name, Product.id)
+    )
+    rows = result.tuples().all()
+    if not rows:
+        return None
+    return rows[0][0], [(product, category) for _, product, category in rows if product is not None]
+
+def page_key(restaurant: Restaurant, sort: str) -> List[Any]:
+    """Sort key values of a restaurant, for building the next cursor."""
+    if sort == "rating":
+        return [restaurant.rating or 0.0, restaurant.id]
+    return [restaurant.name, restaurant.id]
+
+def parse_page_key(values: List[Any], sort: str) -> List[Any]:
+    """Restore typed sort key values from a decoded cursor."""
+    if len(values) != 2:
+        raise ValueError("Cursor does not match sort order")
+    first = float(values[0]) if sort == "rating" else str(values[0])
+    return [first, int(values[1])]
+
+async def get_active_locations(db: AsyncSession) -> List[tuple]:
+    """(id, latitude, longitude) of active restaurants with coordinates."""
+    result = await db.execute(
+        select(Restaurant.id, Restaurant.latitude, Restaurant.longitude).where(
+            Restaurant.is_active.is_(True),
+            Restaurant.latitude.is_not(None),
+            Restaurant.longitude.is_not(None),
+        )
+    )
+    return [tuple(row) for row in result.all()]
+
+async def get_existing_ids(db: AsyncSession, restaurant_ids: Set[int]) -> Set[int]:
+    if not restaurant_ids:
+        return set()
+    result = await db.execute(
+        select(Restaurant.id).where(Restaurant.id.in_(restaurant_ids))
+    )
+    return set(result.scalars().all())
+
+# --------------------------------------------------
+# OPENING HOURS
+# --------------------------------------------------
+
+async def get_hours(db: AsyncSession, restaurant_id: int) -> List[RestaurantHours]:
+    result = await db.execute(
+        select(RestaurantHours)
+        .where(RestaurantHours.restaurant_id == restaurant_id)
+        .order_by(RestaurantHours.day_of_week, RestaurantHours.open_minute)
+    )
+    return result.scalars().all()
+
+async def get_all_hours(db: AsyncSession) -> List[tuple]:
+    """(restaurant_id, day_of_week, open_minute, close_minute) of every schedule."""
+    result = await db.execute(
+        select(
+            RestaurantHours.restaurant_id,
+            RestaurantHours.day_of_week,
+            RestaurantHours.open_minute,
+            RestaurantHours.close_minute,
+        )
+    )
+    return [tuple(row) for row in result.all()]
+
+async def replace_hours(db: AsyncSession, restaurant_id: int, intervals: List[tuple]) -> None:
+    """Replace a restaurant's schedule with (day_of_week, open_minute, close_minute) rows."""
+    await db.execute(delete(RestaurantHours).where(RestaurantHours.restaurant_id == restaurant_id))
+    if intervals:
+        await db.execute(
+            insert(RestaurantHours),
+            [
+                {
+                    "restaurant_id": restaurant_id,
+                    "day_of_week": day,
+                    "open_minute": open_minute,
+                    "close_minute": close_minute,
+                }
+                for day, open_minute, close_minute in intervals
+            ],
+        )
+    await catalog_change_repository.record_changes(db, "restaurant", [restaurant_id])
+    await db.commit()
+
+# --------------------------------------------------
+# DELIVERY ZONES
+# --------------------------------------------------
+
+async def get_delivery_zones(db: AsyncSession, restaurant_id: int) -> List[DeliveryZone]:
+    result = await db.execute(
+        select(DeliveryZone)
+        .where(DeliveryZone.restaurant_id == restaurant_id)
+        .order_by(DeliveryZone.id)
+    )
+    return result.scalars().all()
+
+async def get_all_delivery_zones(db: AsyncSession) -> List[tuple]:
+    """(restaurant_id, polygon) of every zone."""
+    result = await db.execute(select(DeliveryZone.restaurant_id, DeliveryZone.polygon))
+    return [tuple(row) for row in result.all()]
+
+async def replace_delivery_zones(db: AsyncSession, restaurant_id: int, polygons: List[list]) -> None:
+    """Replace a restaurant's zones with the given [[lat, lng], ...] polygons."""
+    await db.execute(delete(DeliveryZone).where(DeliveryZone.restaurant_id == restaurant_id))
+    if polygons:
+        await db.execute(
+            insert(DeliveryZone),
+            [{"restaurant_id": restaurant_id, "polygon": polygon} for polygon in polygons],
+        )
+    await catalog_change_repository.record_changes(db, "restaurant", [restaurant_id])
+    await db.commit()
@@ -0,0 +1,99 @@
+"""
+Review Repository - Async Database Operations
+
+Review rows plus the running rating aggregates on restaurants and
+products. Aggregates move with one atomic UPDATE per target, in the same
+transaction as the review write; nothing here commits.
+"""
+
+from typing import List, Optional, Type, Union
+from sqlalchemy import select, update, delete, case, literal, Float
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models.review_model import Review
+from models.restaurant_model import Restaurant
+from models.product_model import Product
+from repositories import catalog_change_repository
+
+
+async def get_review_for_update(db: AsyncSession, review_id: int) -> Optional[Review]:
+    """Row-locked read: concurrent edits of one review apply their rating deltas in turn."""
+    result = await db.execute(select(Review).where(Review.id == review_id).with_for_update())
+    return result.scalars().first()
+
+
+async def create_review(db: AsyncSession, **values) -> Review:
+    review = Review(**values)
+    db.add(review)
+    # Flush so unique violations surface before the aggregates move
+    await db.flush()
+    return review
+
+
+async def delete_review(db: AsyncSession, review_id: int) -> None:
+    await db.execute(delete(Review).where(Review.id == review_id))
+
+
+async def get_page(
+    db: AsyncSession,
+    *,
+    limit: int,
+    restaurant_id: Optional[int] = None,
+    product_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+) -> List[Review]:
+    """
+    Newest-first keyset page of reviews. With `restaurant_id` only, the
+    restaurant's own reviews (not its product reviews) are listed.
+    One extra row is fetched so the caller can tell whether a next page exists.
+    """
+    query = select(Review)
+    if product_id is not None:
+        query = query.where(Review.product_id == product_id)
+    else:
+        query = query.where(Review.restaurant_id == restaurant_id, Review.product_id.is_(None))
+    if before_id is not None:
+        query = query.where(Review.id < before_id)
+
+    result = await db.execute(query.order_by(Review.id.desc()).limit(limit + 1))
+    return list(result.scalars().all())
+
+
+async def apply_rating_delta(
+    db: AsyncSession,
+    model: Type[Union[Restaurant, Product]],
+    target_id: int,
+    count_delta: int,
+    sum_delta: int,
+) -> None:
+    """
+    Move a restaurant's or product's rating aggregates by (count, sum) and
+    recompute its Bayesian average in the same statement:
+
+        rating = (prior_weight * prior_mean + sum) / (prior_weight + count)
+
+    SET expressions read the pre-update row, so concurrent reviews of the
+    same target serialize on the row lock without a read-modify-write.
+    Logs the target's catalog change alongside.
+    """
+    new_count = model.rating_count + count_delta
+    new_sum = model.rating_sum + sum_delta
+    prior_weight = literal(settings.REVIEW_PRIOR_WEIGHT, Float)
+    prior_total = literal(settings.REVIEW_PRIOR_WEIGHT * settings.REVIEW_PRIOR_MEAN, Float)
+
+    await db.execute(
+        update(model)
+        .where(model.id == target_id)
+        .values(
+            rating_count=new_count,
+            rating_sum=new_sum,
+            rating=case(
+                (new_count > 0, (prior_total + new_sum) / (prior_weight + new_count)),
+                else_=None,
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    entity_type = "product" if model is Product else "restaurant"
+    await catalog_change_repository.record_changes(db, entity_type, [target_id])
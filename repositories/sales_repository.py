@@ -0,0 +1,152 @@
+"""
+Sales Repository - Async Database Operations
+
+Daily sales rollups per restaurant and per product. Writes are additive
+upserts (INSERT ... ON CONFLICT DO UPDATE SET x = x + excluded.x), so a
+payment or cancellation moves one row per table and day without a read;
+nothing here commits. Dashboard reads touch only the rollup tables.
+"""
+
+from datetime import date, datetime
+from typing import AsyncIterator, Dict, List, Sequence, Tuple
+from sqlalchemy import select, delete, func, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.database import get_dialect_name
+from models.order_model import Order
+from models.order_item_model import OrderItem
+from models.product_model import Product
+from models.restaurant_daily_sales_model import RestaurantDailySales
+from models.product_daily_sales_model import ProductDailySales
+
+
+_RESTAURANT_TOTALS = ("orders", "revenue", "delivery_fees")
+_PRODUCT_TOTALS = ("units", "revenue")
+
+
+async def _add(db: AsyncSession, model, totals: Sequence[str], rows: List[Dict]) -> None:
+    if not rows:
+        return
+    # Both dialects support ON CONFLICT; only the insert construct differs
+    dialect_insert = postgresql.insert if get_dialect_name(db) == "postgresql" else sqlite.insert
+    stmt = dialect_insert(model)
+    table = model.__table__
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[column.name for column in table.primary_key.columns],
+        set_={name: table.c[name] + stmt.excluded[name] for name in totals},
+    )
+    await db.execute(stmt, rows)
+
+
+async def add_restaurant_sales(db: AsyncSession, rows: List[Dict]) -> None:
+    """Add {restaurant_id, day, orders, revenue, delivery_fees} deltas."""
+    await _add(db, RestaurantDailySales, _RESTAURANT_TOTALS, rows)
+
+
+async def add_product_sales(db: AsyncSession, rows: List[Dict]) -> None:
+    """Add {product_id, day, restaurant_id, units, revenue} deltas."""
+    await _add(db, ProductDailySales, _PRODUCT_TOTALS, rows)
+
+
+async def lock_sales_tables(db: AsyncSession) -> None:
+    """
+    Block rollup increments until the transaction ends (Postgres). SHARE ROW
+    EXCLUSIVE conflicts with the ROW EXCLUSIVE lock an upsert takes, so
+    payments committing meanwhile wait instead of being wiped by a rebuild.
+    SQLite (local runs) has no table locks and is left as is.
+    """
+    if get_dialect_name(db) == "postgresql":
+        await db.execute(text(
+            "LOCK TABLE restaurant_daily_sales, product_daily_sales IN SHARE ROW EXCLUSIVE MODE"
+        ))
+
+
+async def delete_sales_since(db: AsyncSession, since: date) -> None:
+    await db.execute(delete(RestaurantDailySales).where(RestaurantDailySales.day >= since))
+    await db.execute(delete(ProductDailySales).where(ProductDailySales.day >= since))
+
+
+async def stream_paid_orders(
+    db: AsyncSession,
+    since: datetime,
+    batch_size: int = 1000,
+) -> AsyncIterator[Tuple[int, int, datetime, float, float]]:
+    """(id, restaurant_id, created_at, total_amount, delivery_fee) of paid, non-cancelled orders."""
+    result = await db.stream(
+        select(Order.id, Order.restaurant_id, Order.created_at, Order.total_amount, Order.delivery_fee)
+        .where(
+            Order.created_at >= since,
+            Order.payment_status == "paid",
+            Order.status != "cancelled",
+        )
+        .execution_options(yield_per=batch_size)
+    )
+    async for row in result:
+        yield tuple(row)
+
+
+async def stream_paid_order_items(
+    db: AsyncSession,
+    since: datetime,
+    batch_size: int = 1000,
+) -> AsyncIterator[Tuple[int, datetime, int, int, float]]:
+    """(restaurant_id, created_at, product_id, quantity, price_at_time) of the same orders' items."""
+    result = await db.stream(
+        select(
+            Order.restaurant_id,
+            Order.created_at,
+            OrderItem.product_id,
+            OrderItem.quantity,
+            OrderItem.price_at_time,
+        )
+        .join(Order, Order.id == OrderItem.order_id)
+        .where(
+            Order.created_at >= since,
+            Order.payment_status == "paid",
+            Order.status != "cancelled",
+        )
+        .execution_options(yield_per=batch_size)
+    )
+    async for row in result:
+        yield tuple(row)
+
+
+async def get_daily_sales(
+    db: AsyncSession,
+    restaurant_id: int,
+    start: date,
+    end: date,
+) -> List[RestaurantDailySales]:
+    result = await db.execute(
+        select(RestaurantDailySales)
+        .where(
+            RestaurantDailySales.restaurant_id == restaurant_id,
+            RestaurantDailySales.day.between(start, end),
+        )
+        .order_by(RestaurantDailySales.day)
+    )
+    return result.scalars().all()
+
+
+async def get_product_sales(
+    db: AsyncSession,
+    restaurant_id: int,
+    start: date,
+    end: date,
+    limit: int,
+) -> List[Tuple[int, str, int, float]]:
+    """(product_id, name, units, revenue) over the range, best sellers by revenue first."""
+    revenue = func.sum(ProductDailySales.revenue)
+    result = await db.execute(
+        select(ProductDailySales.product_id, Product.name, func.sum(ProductDailySales.units), revenue)
+        .join(Product, Product.id == ProductDailySales.product_id)
+        .where(
+            ProductDailySales.restaurant_id == restaurant_id,
+            ProductDailySales.day.between(start, end),
+        )
+        .group_by(ProductDailySales.product_id, Product.name)
+        .order_by(revenue.desc(), ProductDailySales.product_id)
+        .limit(limit)
+    )
+    return [(row[0], row[1], int(row[2]), float(row[3])) for row in result.all()]
@@ -0,0 +1,76 @@
+"""
+Search Repository - Async Database Operations
+
+Bulk reads used to build the in-memory typeahead index.
+Each function returns (id, name, weight) rows in a single grouped query.
+"""
+
+from typing import List, Tuple
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.product_model import Product
+from models.restaurant_model import Restaurant
+from models.category_model import Category
+from models.order_model import Order
+from models.order_item_model import OrderItem
+from models.favorite_model import Favorite
+
+# A favorite counts as much as this many ordered units
+FAVORITE_WEIGHT = 3
+
+
+async def get_product_name_weights(db: AsyncSession) -> List[Tuple[int, str, float]]:
+    ordered = (
+        select(OrderItem.product_id, func.sum(OrderItem.quantity).label("units"))
+        .group_by(OrderItem.product_id)
+        .subquery()
+    )
+    favorited = (
+        select(Favorite.product_id, func.count(Favorite.id).label("favorites"))
+        .group_by(Favorite.product_id)
+        .subquery()
+    )
+    weight = (
+        func.coalesce(ordered.c.units, 0)
+        + FAVORITE_WEIGHT * func.coalesce(favorited.c.favorites, 0)
+    )
+
+    result = await db.execute(
+        select(Product.id, Product.name, weight)
+        .outerjoin(ordered, ordered.c.product_id == Product.id)
+        .outerjoin(favorited, favorited.c.product_id == Product.id)
+        .where(Product.is_available.is_(True))
+    )
+    return [(row[0], row[1], float(row[2])) for row in result.all()]
+
+
+async def get_restaurant_name_weights(db: AsyncSession) -> List[Tuple[int, str, float]]:
+    orders = (
+        select(Order.restaurant_id, func.count(Order.id).label("orders"))
+        .group_by(Order.restaurant_id)
+        .subquery()
+    )
+
+    result = await db.execute(
+        select(Restaurant.id, Restaurant.name, func.coalesce(orders.c.orders, 0))
+        .outerjoin(orders, orders.c.restaurant_id == Restaurant.id)
+        .where(Restaurant.is_active.is_(True))
+    )
+    return [(row[0], row[1], float(row[2])) for row in result.all()]
+
+
+async def get_category_name_weights(db: AsyncSession) -> List[Tuple[int, str, float]]:
+    products = (
+        select(Product.category_id, func.count(Product.id).label("products"))
+        .where(Product.is_available.is_(True))
+        .group_by(Product.category_id)
+        .subquery()
+    )
+
+    result = await db.execute(
+        select(Category.id, Category.name, func.coalesce(products.c.products, 0))
+        .outerjoin(products, products.c.category_id == Category.id)
+        .where(Category.is_active.is_(True))
+    )
+    return [(row[0], row[1], float(row[2])) for row in result.all()]
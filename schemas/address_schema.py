@@ -7,6 +7,8 @@ class AddressBase(BaseModel):
     state: str = Field(min_length=2, max_length=100)
     postal_code: str = Field(min_length=4, max_length=20)
     country: str = Field(min_length=2, max_length=100)
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
     is_default: bool = False
 
 class AddressCreate(AddressBase):
@@ -18,6 +20,8 @@ class AddressUpdate(BaseModel):
     state: Optional[str] = Field(None, min_length=2, max_length=100)
     postal_code: Optional[str] = Field(None, min_length=4, max_length=20)
     country: Optional[str] = Field(None, min_length=2, max_length=100)
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
     is_default: Optional[bool] = None
 
 class AddressResponse(AddressBase):
@@ -0,0 +1,17 @@
+from typing import List
+from pydantic import BaseModel
+
+from schemas.category_schema import CategoryResponse
+from schemas.product_schema import ProductResponse
+from schemas.restaurant_schema import RestaurantResponse
+
+
+class CatalogChanges(BaseModel):
+    since: int
+    version: int  # pass back as `since` on the next sync
+    has_more: bool
+    # Current state of every row changed after `since`; soft-deleted rows
+    # come back with is_available / is_active set to false
+    products: List[ProductResponse]
+    categories: List[CategoryResponse]
+    restaurants: List[RestaurantResponse]
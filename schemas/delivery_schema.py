@@ -0,0 +1,11 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class DeliveryEstimate(BaseModel):
+    restaurant_id: int
+    deliverable: bool
+    # None when the restaurant has no coordinates or is not active
+    distance_km: Optional[float] = None
+    fee: Optional[float] = None
+    eta_minutes: Optional[int] = None
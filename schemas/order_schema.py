@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, condecimal
 from datetime import datetime
 
@@ -52,5 +52,11 @@ class OrderResponse(OrderBase):
         from_attributes = True
 
 
+OrderStatus = Literal["pending", "confirmed", "preparing", "delivered", "cancelled", "expired_unreleased"]
+
+# Kitchen-side transitions: confirmed -> preparing -> delivered
+KitchenStatus = Literal["preparing", "delivered"]
+
+
 class OrderUpdateStatus(BaseModel):
-    status: str
+    status: KitchenStatus
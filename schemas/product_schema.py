@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from typing import Dict, List, Literal, Optional
 from datetime import datetime
 
 
+ProductSort = Literal["newest", "price_asc", "price_desc", "name"]
+
+
 # =========================
 # Base Schema (Shared)
 # =========================
@@ -51,8 +54,134 @@ class ProductUpdate(BaseModel):
 # =========================
 class ProductResponse(ProductBase):
     id: int
+    thumbnail_url: Optional[str] = None
+    image_variants: Optional[Dict[str, str]] = None
+    rating: Optional[float] = None
+    rating_count: int = 0
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True  # Pydantic v2
+
+
+# =========================
+# Paginated List Response
+# =========================
+class ProductPage(BaseModel):
+    items: List[ProductResponse]
+    next_cursor: Optional[str] = None
+
+
+# =========================
+# Search Response
+# =========================
+class ProductSearchHit(ProductResponse):
+    rank: float
+
+
+class ProductSearchPage(BaseModel):
+    items: List[ProductSearchHit]
+    next_cursor: Optional[str] = None
+
+
+# =========================
+# Popular Products
+# =========================
+class PopularProduct(ProductResponse):
+    score: float
+
+
+class RecommendedProduct(ProductResponse):
+    score: float
+
+
+# =========================
+# Facet Counts
+# =========================
+class ProductFacetCount(BaseModel):
+    id: int
+    count: int
+
+
+class PriceFacetCount(BaseModel):
+    min_price: float
+    max_price: Optional[float] = None  # None for the open-ended top bucket
+    count: int
+
+
+class ProductFacets(BaseModel):
+    total: int
+    categories: List[ProductFacetCount]
+    restaurants: List[ProductFacetCount]
+    price_buckets: List[PriceFacetCount]
+
+
+# =========================
+# Bulk Import Report
+# =========================
+class ProductImportRowError(BaseModel):
+    row: int
+    name: Optional[str] = None
+    error: str
+
+
+class ProductImportReport(BaseModel):
+    total_rows: int
+    created: int
+    failed: int
+    errors: List[ProductImportRowError] = []
+
+
+# =========================
+# Bulk Update (PATCH)
+# =========================
+class ProductBulkUpdateItem(BaseModel):
+    product_id: int
+    price: Optional[float] = Field(None, gt=0)
+    is_available: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def check_has_change(self):
+        if self.price is None and self.is_available is None:
+            raise ValueError("Provide price and/or is_available")
+        return self
+
+
+class ProductBulkUpdate(BaseModel):
+    items: List[ProductBulkUpdateItem] = Field(..., min_length=1, max_length=1000)
+
+    @model_validator(mode="after")
+    def check_unique_ids(self):
+        ids = [item.product_id for item in self.items]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each product_id may appear only once")
+        return self
+
+
+class ProductBulkUpdateReport(BaseModel):
+    updated: int
+    missing_ids: List[int] = []
+
+
+# =========================
+# Image Upload
+# =========================
+ProductImageContentType = Literal["image/jpeg", "image/png", "image/webp"]
+
+
+class ProductImageUploadRequest(BaseModel):
+    content_type: ProductImageContentType
+
+
+class ProductImageUploadTicket(BaseModel):
+    # multipart/form-data POST to `upload_url` with `fields` plus the file
+    upload_url: str
+    fields: Dict[str, str]
+    key: str
+    expires_in: int
+    max_bytes: int
+
+
+class ProductImageUploadComplete(BaseModel):
+    key: str = Field(..., min_length=1)
@@ -1,12 +1,22 @@
-from datetime import datetime
-from pydantic import BaseModel
+from datetime import datetime, time
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, model_validator
+
+from schemas.product_schema import ProductResponse
+from utils.delivery_zones import MAX_ZONE_SPAN_DEGREES
+
+
+RestaurantSort = Literal["rating", "name"]
+NearbySort = Literal["distance", "fastest"]
 
 
 class RestaurantBase(BaseModel):
     name: str
     description: str | None = None
     is_active: bool = True
-    rating: float | None = None
+    city: str | None = None
+    latitude: float | None = Field(None, ge=-90, le=90)
+    longitude: float | None = Field(None, ge=-180, le=180)
 
 
 class RestaurantCreate(RestaurantBase):
@@ -17,12 +27,105 @@ class RestaurantUpdate(BaseModel):
     name: str | None = None
     description: str | None = None
     is_active: bool | None = None
-    rating: float | None = None
+    city: str | None = None
+    latitude: float | None = Field(None, ge=-90, le=90)
+    longitude: float | None = Field(None, ge=-180, le=180)
 
 
 class RestaurantResponse(RestaurantBase):
     id: int
+    # Maintained from reviews only; not writable through create/update
+    rating: float | None = None
+    rating_count: int = 0
     created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class RestaurantPage(BaseModel):
+    items: List[RestaurantResponse]
+    next_cursor: Optional[str] = None
+
+
+class MenuCategory(BaseModel):
+    id: int
+    name: str
+    products: List[ProductResponse]
+
+
+class RestaurantMenu(BaseModel):
+    restaurant_id: int
+    restaurant_name: str
+    categories: List[MenuCategory]
+
+
+class PopularRestaurant(RestaurantResponse):
+    score: float
+    # Orders queued in the kitchen (pending, confirmed, preparing)
+    active_orders: int = 0
+    prep_delay_minutes: int = 0
+
+
+class NearbyRestaurant(RestaurantResponse):
+    distance_km: float
+    # Local estimate; the charged fee comes from the checkout quote
+    deliverable: bool
+    delivery_fee: float
+    # Travel, base prep time and the current prep delay
+    eta_minutes: int
+    active_orders: int = 0
+    prep_delay_minutes: int = 0
+
+
+class NearbyRestaurantPage(BaseModel):
+    items: List[NearbyRestaurant]
+    next_cursor: Optional[str] = None
+
+
+class OpeningInterval(BaseModel):
+    day_of_week: int = Field(ge=0, le=6, description="0 = Monday")
+    opens: time
+    # At or before `opens`: the interval runs past midnight (equal = 24 hours)
+    closes: time
+
+
+class RestaurantHoursUpdate(BaseModel):
+    # Empty list removes the schedule (restaurant is always open)
+    intervals: List[OpeningInterval] = Field(max_length=50)
+
+
+class RestaurantHoursResponse(BaseModel):
+    restaurant_id: int
+    timezone: str
+    open_now: bool
+    intervals: List[OpeningInterval]
+
+
+class ZoneVertex(BaseModel):
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+
+
+class DeliveryZone(BaseModel):
+    # Simple polygon, vertices in order; the closing edge is implied
+    vertices: List[ZoneVertex] = Field(min_length=3, max_length=500)
+
+    @model_validator(mode="after")
+    def check_span(self):
+        lats = [v.latitude for v in self.vertices]
+        lngs = [v.longitude for v in self.vertices]
+        if max(lats) - min(lats) > MAX_ZONE_SPAN_DEGREES or max(lngs) - min(lngs) > MAX_ZONE_SPAN_DEGREES:
+            raise ValueError(f"A zone may span at most {MAX_ZONE_SPAN_DEGREES} degrees per axis")
+        return self
+
+
+class DeliveryZonesUpdate(BaseModel):
+    # Empty list removes all zones (delivers anywhere within range)
+    zones: List[DeliveryZone] = Field(max_length=20)
+
+
+class DeliveryZonesResponse(BaseModel):
+    restaurant_id: int
+    zones: List[DeliveryZone]
@@ -0,0 +1,39 @@
+from datetime import date
+from typing import List
+from pydantic import BaseModel
+
+
+class DailySales(BaseModel):
+    day: date
+    orders: int
+    revenue: float
+    delivery_fees: float
+
+    class Config:
+        from_attributes = True
+
+
+class ProductSales(BaseModel):
+    product_id: int
+    name: str
+    units: int
+    revenue: float
+
+
+class SalesDashboard(BaseModel):
+    restaurant_id: int
+    timezone: str
+    start: date
+    end: date
+    orders: int
+    revenue: float
+    # Days without paid orders are omitted
+    days: List[DailySales]
+    top_products: List[ProductSales]
+
+
+class SalesBackfillResult(BaseModel):
+    since: date
+    orders: int
+    restaurant_days: int
+    product_days: int
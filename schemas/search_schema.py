@@ -0,0 +1,12 @@
+from typing import Literal
+from pydantic import BaseModel
+
+
+SuggestionType = Literal["product", "restaurant", "category"]
+
+
+class SuggestionResponse(BaseModel):
+    type: SuggestionType
+    id: int
+    name: str
+    score: float
@@ -4,15 +4,16 @@ Cart Services - Business Logic
 Handles cart operations, price calculations, and validations.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from models.cart_model import Cart
 from models.user_model import User
-from repositories import cart_repository
-from services.product_services import get_product_by_id_service
+from repositories import cart_repository, product_repository
 from schemas.cart_schema import CartResponse, CartItemResponse
+from utils.http_cache_utils import make_etag
 from utils.logger_utils import get_logger
 
 
@@ -59,6 +60,19 @@ async def get_cart_service(db: AsyncSession, user: User) -> CartResponse:
     )
 
 
+async def get_cart_validators_service(
+    db: AsyncSession, user: User
+) -> Optional[Tuple[str, datetime]]:
+    """
+    ETag and Last-Modified of the user's cart from one aggregate query.
+    None if the user has no cart yet.
+    """
+    version = await cart_repository.get_cart_version(db, user.id)
+    if not version:
+        return None
+    return make_etag("cart", *version), cart_repository.latest_change(version)
+
+
 async def add_item_service(
     db: AsyncSession, 
     user: User, 
@@ -72,8 +86,9 @@ async def add_item_service(
         quantity,
     )
 
-    # Validate product and get price
-    product = await get_product_by_id_service(db, product_id)
+    # Validate product and get price from the row, not the catalog cache:
+    # price_at_time is what checkout charges
+    product = await product_repository.get_by_id(db, product_id)
     if not product:
         logger.warning("Add to cart failed: product not found | product_id=%s", product_id)
         raise HTTPException(
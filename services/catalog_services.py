@@ -0,0 +1,77 @@
+"""
+Catalog Services - Incremental Sync
+
+Serves the catalog change feed: clients keep the last `version` they saw
+and fetch only rows created, updated or soft-deleted since then. The same
+version validates cached catalog responses.
+"""
+
+from typing import Dict, Set
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories import (
+    catalog_change_repository,
+    category_repository,
+    product_repository,
+    restaurant_repository,
+)
+from schemas.catalog_schema import CatalogChanges
+from schemas.category_schema import CategoryResponse
+from schemas.product_schema import ProductResponse
+from schemas.restaurant_schema import RestaurantResponse
+from utils.catalog_cache import catalog_cache
+from utils.logger_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+async def get_catalog_version_service(db: AsyncSession) -> int:
+    """
+    Latest committed catalog version, shared by all workers. The local
+    catalog cache is dropped when it moved, so a response tagged with this
+    version is never built from older cached data.
+    """
+    version = await catalog_change_repository.get_latest_version(db) or 0
+    catalog_cache.observe(version)
+    return version
+
+
+async def get_catalog_changes_service(
+    db: AsyncSession,
+    since: int,
+    limit: int = 500,
+) -> CatalogChanges:
+    logger.info("Fetching catalog changes | since=%s limit=%s", since, limit)
+
+    # Versions commit in id order (see record_changes), so every change up
+    # to the last one read is already visible and none can appear below it
+    changes = await catalog_change_repository.get_changes_since(db, since, limit + 1)
+
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    # A row changed several times in the window is sent once, in its current state
+    changed_ids: Dict[str, Set[int]] = {"product": set(), "category": set(), "restaurant": set()}
+    for change in changes:
+        changed_ids[change.entity_type].add(change.entity_id)
+
+    products = await product_repository.get_by_ids(db, changed_ids["product"])
+    categories = await category_repository.get_by_ids(db, changed_ids["category"])
+    restaurants = await restaurant_repository.get_restaurants_by_ids(db, changed_ids["restaurant"])
+
+    logger.info(
+        "Catalog changes fetched | since=%s changes=%s has_more=%s",
+        since,
+        len(changes),
+        has_more,
+    )
+
+    return CatalogChanges(
+        since=since,
+        version=changes[-1].id if changes else since,
+        has_more=has_more,
+        products=[ProductResponse.model_validate(p) for p in products],
+        categories=[CategoryResponse.model_validate(c) for c in categories],
+        restaurants=[RestaurantResponse.model_validate(r) for r in restaurants],
+    )
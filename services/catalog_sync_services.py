@@ -0,0 +1,98 @@
+"""
+Catalog Sync Services
+
+Single place where catalog writes fan out to derived read structures
+(catalog snapshot cache, restaurant menu cache, search index, typeahead
+index, category name registry, restaurant geo index, opening hours
+index, delivery zone index). Product, category and restaurant services
+call these after their own commit succeeds. The catalog change log is
+not derived here: repositories append to it inside the write's own
+transaction.
+"""
+
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.product_model import Product
+from models.category_model import Category
+from models.restaurant_model import Restaurant
+from repositories import product_repository
+from utils import typeahead_index as typeahead
+from utils.catalog_cache import catalog_cache, menu_cache
+from utils.category_registry import category_registry
+from utils.geo_index import geo_index
+from utils.opening_hours import opening_hours
+from utils.delivery_zones import delivery_zones
+
+
+async def product_written(
+    db: AsyncSession,
+    product: Product,
+    previous_restaurant_id: Optional[int] = None,
+) -> None:
+    """`previous_restaurant_id` is set when the product moved to another restaurant."""
+    if previous_restaurant_id is not None:
+        menu_cache.discard(("menu", previous_restaurant_id))
+    await products_written(db, [product])
+
+
+async def products_written(db: AsyncSession, products: List[Product]) -> None:
+    """Batch form: one cache invalidation and one index round trip per batch."""
+    if not products:
+        return
+
+    catalog_cache.invalidate()
+    for restaurant_id in {p.restaurant_id for p in products}:
+        menu_cache.discard(("menu", restaurant_id))
+    await product_repository.sync_search_documents(db, products)
+
+    for product in products:
+        if product.is_available:
+            typeahead.typeahead_index.upsert(typeahead.PRODUCT, product.id, product.name)
+        else:
+            typeahead.typeahead_index.remove(typeahead.PRODUCT, product.id)
+
+
+async def category_written(db: AsyncSession, category: Category) -> None:
+    category_registry.put(category.id, category.name)
+    catalog_cache.invalidate()
+    # Categories are shared by every restaurant's menu
+    menu_cache.invalidate()
+    if category.is_active:
+        typeahead.typeahead_index.upsert(typeahead.CATEGORY, category.id, category.name)
+    else:
+        typeahead.typeahead_index.remove(typeahead.CATEGORY, category.id)
+
+
+async def restaurant_written(db: AsyncSession, restaurant: Restaurant) -> None:
+    catalog_cache.invalidate()
+    menu_cache.discard(("menu", restaurant.id))
+    if restaurant.is_active:
+        typeahead.typeahead_index.upsert(typeahead.RESTAURANT, restaurant.id, restaurant.name)
+        geo_index.put(restaurant.id, restaurant.latitude, restaurant.longitude)
+    else:
+        typeahead.typeahead_index.remove(typeahead.RESTAURANT, restaurant.id)
+        geo_index.remove(restaurant.id)
+
+
+async def restaurant_hours_written(
+    db: AsyncSession,
+    restaurant_id: int,
+    intervals: List[Tuple[int, int, int]],
+) -> None:
+    opening_hours.put(restaurant_id, intervals)
+    catalog_cache.invalidate()
+
+
+async def delivery_zones_written(
+    db: AsyncSession,
+    restaurant_id: int,
+    polygons: List[List[List[float]]],
+) -> None:
+    delivery_zones.put(restaurant_id, polygons)
+
+
+async def ratings_written(db: AsyncSession, restaurant_id: int) -> None:
+    """A review moved the rating aggregates of a restaurant or one of its products."""
+    catalog_cache.invalidate()
+    menu_cache.discard(("menu", restaurant_id))
@@ -4,14 +4,18 @@ Category Services - Async Business Logic
 Handles category CRUD operations with async database access.
 """
 
-from typing import List
+from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from db.database import AsyncSessionLocal
 from models.category_model import Category
-from schemas.category_schema import CategoryCreate, CategoryUpdate
-from repositories import category_repository
+from schemas.category_schema import CategoryCreate, CategoryUpdate, CategoryResponse
+from repositories import category_repository, catalog_change_repository
+from services import catalog_sync_services
+from utils.catalog_cache import catalog_cache
+from utils.category_registry import category_registry
 from utils.logger_utils import get_logger
 
 
@@ -51,6 +55,7 @@ async def create_category_service(
         )
 
     created_category = await category_repository.create(db, category)
+    await catalog_sync_services.category_written(db, created_category)
 
     logger.info(
         "Category created successfully | category_id=%s",
@@ -60,16 +65,68 @@ async def create_category_service(
     return created_category
 
 
+async def load_category_registry(db: AsyncSession) -> None:
+    """Load every category name into the in-process registry."""
+    categories = await category_repository.get_all(db)
+    category_registry.load(categories)
+
+    logger.info(
+        "Category registry loaded | categories=%s",
+        len(category_registry),
+    )
+
+
+async def reload_category_registry_job() -> None:
+    """Entry point for the periodic task; owns its own session."""
+    async with AsyncSessionLocal() as db:
+        await load_category_registry(db)
+
+
+async def resolve_category_id(
+    db: AsyncSession,
+    name: str,
+) -> Optional[int]:
+    """
+    Category id for `name`, from the registry when possible.
+
+    A miss falls back to the DB, which covers categories created by
+    another worker process since this one last loaded its registry;
+    renames elsewhere are picked up by the periodic reload.
+    """
+    category_id = category_registry.get_id(name)
+    if category_id is not None:
+        return category_id
+
+    category = await category_repository.get_by_name(db, name)
+    if not category:
+        return None
+
+    category_registry.put(category.id, category.name)
+    return category.id
+
+
+async def _load_category(
+    db: AsyncSession,
+    category_id: int,
+) -> Optional[CategoryResponse]:
+    category = await category_repository.get_by_id(db, category_id)
+    return CategoryResponse.model_validate(category) if category else None
+
+
 async def get_category_by_id_service(
     db: AsyncSession,
     category_id: int,
-) -> Category:
+) -> CategoryResponse:
     logger.info(
         "Fetching category | category_id=%s",
         category_id,
     )
 
-    category = await category_repository.get_by_id(db, category_id)
+    # Served from the catalog snapshot; missing ids are cached as None
+    category = await catalog_cache.get_or_load(
+        ("category", category_id),
+        lambda: _load_category(db, category_id),
+    )
 
     if not category:
         logger.warning(
@@ -96,19 +153,22 @@ async def get_category_by_id_service(
 
 async def get_all_categories_service(
     db: AsyncSession,
-) -> List[Category]:
+) -> List[CategoryResponse]:
     logger.info("Fetching all active categories")
 
-    categories = await category_repository.get_all(db)
-    active_categories = [c for c in categories if c.is_active]
+    async def load_categories() -> List[CategoryResponse]:
+        categories = await category_repository.get_all(db)
+        active_categories = [c for c in categories if c.is_active]
 
-    logger.info(
-        "Categories fetched | total=%s active=%s",
-        len(categories),
-        len(active_categories),
-    )
+        logger.info(
+            "Categories fetched from DB | total=%s active=%s",
+            len(categories),
+            len(active_categories),
+        )
+
+        return [CategoryResponse.model_validate(c) for c in active_categories]
 
-    return active_categories
+    return await catalog_cache.get_or_load(("categories",), load_categories)
 
 
 async def update_category_service(
@@ -151,6 +211,7 @@ async def update_category_service(
         db_category,
         category_update,
     )
+    await catalog_sync_services.category_written(db, updated_category)
 
     logger.info(
         "Category updated successfully | category_id=%s",
@@ -182,7 +243,9 @@ async def delete_category_service(
         )
 
     category.is_active = False
+    await catalog_change_repository.record_changes(db, "category", [category_id])
     await db.commit()
+    await catalog_sync_services.category_written(db, category)
 
     logger.info(
         "Category soft-deleted successfully | category_id=%s",
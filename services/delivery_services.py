@@ -1,12 +1,22 @@
+from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import HTTPException
+from fastapi import HTTPException, status
 import json
 
+import numpy as np
+
 from utils.delivery_utils import uber_client
+from utils.delivery_estimator import DeliveryTariff, estimate
+from utils.geo_index import geo_index
+from utils.delivery_zones import delivery_zones
+from utils.order_load import order_load
 from models.order_model import Order
 from models.restaurant_model import Restaurant
 from models.address_model import Address
-from repositories import order_repository
+from models.user_model import User
+from repositories import order_repository, address_repository
+from schemas.delivery_schema import DeliveryEstimate
+from services.kitchen_services import publish_order_event
 from utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
@@ -122,8 +132,11 @@ async def dispatch_uber_delivery_service(db: AsyncSession, order: Order):
         # Update order with delivery info
         order.uber_delivery_id = delivery.get("id")
         order.uber_tracking_url = delivery.get("tracking_url")
+        previous_status = order.status
         order.status = "preparing" # Move status forward
         await db.commit()
+        order_load.transition(order.restaurant_id, previous_status, order.status)
+        publish_order_event(order, "order_status")
         
         logger.info(f"Uber Delivery dispatched for order {order.id} | delivery_id={order.uber_delivery_id}")
         return delivery
@@ -132,3 +145,81 @@ async def dispatch_uber_delivery_service(db: AsyncSession, order: Order):
         logger.error(f"Uber Dispatch Service Error: {str(e)}")
         # Don't fail the verification process, just log it. 
         # Manual retry might be needed.
+
+
+async def _resolve_destination(
+    db: AsyncSession,
+    user: User,
+    address_id: Optional[int],
+    lat: Optional[float],
+    lng: Optional[float],
+) -> tuple:
+    """Explicit coordinates, else the given address, else the user's default address."""
+    if lat is not None and lng is not None:
+        return lat, lng
+
+    if address_id is not None:
+        address = await address_repository.get_address_by_id(db, address_id)
+        if not address or address.user_id != user.id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Address not found")
+    else:
+        addresses = await address_repository.get_user_addresses(db, user.id)
+        address = addresses[0] if addresses else None
+        if not address:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No address given and no saved address",
+            )
+
+    if address.latitude is None or address.longitude is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Address has no coordinates",
+        )
+    return address.latitude, address.longitude
+
+
+async def estimate_delivery_service(
+    db: AsyncSession,
+    user: User,
+    restaurant_ids: List[int],
+    address_id: Optional[int] = None,
+    lat: Optional[float] = None,
+    lng: Optional[float] = None,
+) -> List[DeliveryEstimate]:
+    """
+    Local fee/ETA estimates from each restaurant to one drop-off, in one
+    vectorized pass. Restaurant coordinates and delivery zones come from
+    in-process indexes, so only the drop-off address may need a query.
+    """
+    dest_lat, dest_lng = await _resolve_destination(db, user, address_id, lat, lng)
+
+    restaurant_ids = list(dict.fromkeys(restaurant_ids))
+    located = [(rid, geo_index.get(rid)) for rid in restaurant_ids]
+    located = [(rid, point) for rid, point in located if point is not None]
+
+    estimates = {}
+    if located:
+        points = np.array([point for _, point in located], dtype=np.float64)
+        result = estimate(points[:, 0], points[:, 1], dest_lat, dest_lng, DeliveryTariff.from_settings())
+        in_zone = delivery_zones.serving(restaurant_ids, dest_lat, dest_lng)
+        for i, (rid, _) in enumerate(located):
+            estimates[rid] = DeliveryEstimate(
+                restaurant_id=rid,
+                deliverable=bool(result.deliverable[i]) and rid in in_zone,
+                distance_km=float(result.distance_km[i]),
+                fee=float(result.fee[i]),
+                eta_minutes=int(result.eta_minutes[i]),
+            )
+
+    logger.info(
+        "Delivery estimated | user_id=%s restaurants=%s located=%s",
+        user.id,
+        len(restaurant_ids),
+        len(located),
+    )
+
+    return [
+        estimates.get(rid) or DeliveryEstimate(restaurant_id=rid, deliverable=False)
+        for rid in restaurant_ids
+    ]
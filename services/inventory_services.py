@@ -7,13 +7,18 @@ Includes:
 - Transaction management (via repository)
 """
 
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from models.category_model import Category
+from models.order_model import Order
 from models.user_model import User
 from constants.roles import Roles
-from repositories import inventory_repository
+from repositories import inventory_repository, product_repository
+from schemas.response_schema import InventoryResponse
 from utils.logger_utils import get_logger
 
 
@@ -205,3 +210,193 @@ async def get_current_stock_service(
         )
 
     return category.stock
+
+
+# ─────────────────────────────────────────────
+# Product Inventory (reservations)
+#
+# available -> reserved on checkout, reserved -> gone on payment,
+# reserved -> available on cancellation. Products without an inventory
+# row are not stock-tracked and are never blocked.
+# ─────────────────────────────────────────────
+
+def _quantities_by_product(items: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    # Sorted by product id so concurrent checkouts take row locks in the same order
+    totals: Dict[int, int] = defaultdict(int)
+    for product_id, quantity in items:
+        totals[product_id] += quantity
+    return sorted(totals.items())
+
+
+def _to_inventory_response(inventory) -> InventoryResponse:
+    return InventoryResponse(
+        product_id=inventory.product_id,
+        total_stock=inventory.available_quantity + inventory.reserved_quantity,
+        available_stock=inventory.available_quantity,
+        reserved_stock=inventory.reserved_quantity,
+    )
+
+
+async def reserve_order_stock_service(
+    db: AsyncSession,
+    items: Iterable[Tuple[int, int]],
+) -> None:
+    """
+    Reserve stock for (product_id, quantity) pairs. Does not commit;
+    on a shortfall the caller's transaction is rolled back and 409 raised.
+    """
+    quantities = _quantities_by_product(items)
+    tracked = await inventory_repository.get_tracked_product_ids(
+        db, [product_id for product_id, _ in quantities]
+    )
+
+    for product_id, quantity in quantities:
+        if product_id not in tracked:
+            continue
+        if not await inventory_repository.reserve_stock(db, product_id, quantity):
+            await db.rollback()
+            logger.warning(
+                "Stock reservation failed | product_id=%s quantity=%s",
+                product_id,
+                quantity,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Insufficient stock for product {product_id}",
+            )
+
+    logger.info("Stock reserved | products=%s", len(tracked))
+
+
+async def _move_order_reservations(db: AsyncSession, order: Order, move, action: str) -> None:
+    order_id = order.id
+    quantities = _quantities_by_product((item.product_id, item.quantity) for item in order.items)
+    tracked = await inventory_repository.get_tracked_product_ids(
+        db, [product_id for product_id, _ in quantities]
+    )
+
+    for product_id, quantity in quantities:
+        if product_id not in tracked:
+            continue
+        if not await move(db, product_id, quantity):
+            # The reservation is gone: applying it anyway would take another order's stock
+            await db.rollback()
+            logger.error(
+                "Reserved stock missing | action=%s order_id=%s product_id=%s quantity=%s",
+                action,
+                order_id,
+                product_id,
+                quantity,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Reserved stock missing for product {product_id}",
+            )
+
+
+async def commit_order_stock_service(db: AsyncSession, order: Order) -> None:
+    """
+    Consume the reservations of a paid order. Does not commit; if a
+    reservation is missing, the transaction is rolled back and 409 raised.
+    """
+    await _move_order_reservations(db, order, inventory_repository.commit_reserved_stock, "commit")
+
+    logger.info("Reserved stock committed | order_id=%s", order.id)
+
+
+async def release_order_stock_service(db: AsyncSession, order: Order) -> None:
+    """
+    Return the reservations of a cancelled order. Does not commit; if a
+    reservation is missing, the transaction is rolled back and 409 raised.
+    """
+    await _move_order_reservations(db, order, inventory_repository.release_reserved_stock, "release")
+
+    logger.info("Reserved stock released | order_id=%s", order.id)
+
+
+async def restock_order_service(db: AsyncSession, order: Order) -> None:
+    """Return the sold stock of a cancelled paid order. Does not commit."""
+    quantities = _quantities_by_product((item.product_id, item.quantity) for item in order.items)
+    tracked = await inventory_repository.get_tracked_product_ids(
+        db, [product_id for product_id, _ in quantities]
+    )
+
+    for product_id, quantity in quantities:
+        if product_id in tracked:
+            await inventory_repository.add_available_stock(db, product_id, quantity)
+
+    logger.info("Sold stock returned | order_id=%s products=%s", order.id, len(tracked))
+
+
+async def set_product_stock_service(
+    db: AsyncSession,
+    product_id: int,
+    stock: int,
+    current_user: User,
+) -> InventoryResponse:
+    """Set available stock; starts tracking the product if it was untracked."""
+    _check_admin(current_user)
+
+    if not await product_repository.get_by_id(db, product_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product not found",
+        )
+
+    if not await inventory_repository.set_available_stock(db, product_id, stock):
+        await inventory_repository.create_product_inventory(db, product_id, stock)
+    await db.commit()
+
+    inventory = await inventory_repository.get_product_inventory(db, product_id)
+    await db.refresh(inventory)
+
+    logger.info(
+        "Product stock set | product_id=%s available=%s by=%s",
+        product_id,
+        stock,
+        current_user.id,
+    )
+
+    return _to_inventory_response(inventory)
+
+
+async def increase_product_stock_service(
+    db: AsyncSession,
+    product_id: int,
+    amount: int,
+    current_user: User,
+) -> InventoryResponse:
+    _check_admin(current_user)
+
+    if not await inventory_repository.add_available_stock(db, product_id, amount):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product inventory not found",
+        )
+    await db.commit()
+
+    inventory = await inventory_repository.get_product_inventory(db, product_id)
+    await db.refresh(inventory)
+
+    logger.info(
+        "Product stock increased | product_id=%s +%s available=%s",
+        product_id,
+        amount,
+        inventory.available_quantity,
+    )
+
+    return _to_inventory_response(inventory)
+
+
+async def get_product_stock_service(
+    db: AsyncSession,
+    product_id: int,
+) -> InventoryResponse:
+    inventory = await inventory_repository.get_product_inventory(db, product_id)
+    if not inventory:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product inventory not found",
+        )
+
+    return _to_inventory_response(inventory)
@@ -0,0 +1,155 @@
+"""
+Kitchen Services - Business Logic
+
+The kitchen queue of a restaurant (paid orders not yet delivered), staff
+status updates, and the push stream that tells kitchen screens about new
+and moved orders. Payment verification, delivery dispatch and the status
+update publish to the in-process event broker after their commit.
+"""
+
+import json
+from typing import AsyncIterator, List, Sequence
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models.order_model import Order
+from repositories import order_repository
+from schemas.order_schema import OrderResponse
+from services.restaurant_services import get_restaurant_by_id_service
+from utils.kitchen_events import kitchen_events
+from utils.order_load import order_load
+from utils.logger_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+# Paid orders the kitchen still has to work on
+KITCHEN_STATUSES = ("confirmed", "preparing")
+
+# new status -> statuses it may be set from
+_TRANSITIONS = {
+    "preparing": ("confirmed",),
+    "delivered": ("preparing",),
+}
+
+
+def publish_order_event(order: Order, event_type: str) -> None:
+    """Push an order to its restaurant's kitchen screens. Needs `order.items` loaded."""
+    kitchen_events.publish(
+        order.restaurant_id,
+        {
+            "type": event_type,
+            "order": OrderResponse.model_validate(order).model_dump(mode="json"),
+        },
+    )
+
+
+async def get_kitchen_queue_service(
+    db: AsyncSession,
+    restaurant_id: int,
+    statuses: Sequence[str] = KITCHEN_STATUSES,
+    limit: int = 100,
+) -> List[OrderResponse]:
+    """
+    A restaurant's orders in `statuses`, oldest first.
+
+    Authorization: Caller must be admin (enforced at controller level).
+    """
+    await get_restaurant_by_id_service(db, restaurant_id)
+
+    orders = await order_repository.get_restaurant_orders(db, restaurant_id, statuses, limit)
+    return [OrderResponse.model_validate(o) for o in orders]
+
+
+async def update_kitchen_order_status_service(
+    db: AsyncSession,
+    order_id: int,
+    new_status: str,
+) -> OrderResponse:
+    """
+    Move an order forward in the kitchen: confirmed -> preparing -> delivered.
+
+    Authorization: Caller must be admin (enforced at controller level).
+    """
+    # Row lock: the transition is checked against the status cancellation sees
+    order = await order_repository.get_order_for_update(db, order_id)
+    if not order:
+        logger.warning("Kitchen status update failed: order not found | order_id=%s", order_id)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
+
+    previous_status = order.status
+    if previous_status not in _TRANSITIONS[new_status]:
+        logger.warning(
+            "Kitchen status update failed: bad transition | order_id=%s from=%s to=%s",
+            order_id, previous_status, new_status,
+        )
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Cannot move order from {previous_status} to {new_status}",
+        )
+
+    order.status = new_status
+    await db.commit()
+    order_load.transition(order.restaurant_id, previous_status, new_status)
+    publish_order_event(order, "order_status")
+
+    logger.info(
+        "Kitchen status updated | order_id=%s from=%s to=%s",
+        order_id, previous_status, new_status,
+    )
+
+    return OrderResponse.model_validate(order)
+
+
+def _sse(event_type: str, data) -> str:
+    return f"event: {event_type}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+async def open_kitchen_stream_service(
+    db: AsyncSession,
+    request: Request,
+    restaurant_id: int,
+) -> AsyncIterator[str]:
+    """
+    Validate the restaurant and return its event stream.
+
+    Authorization: Caller must be admin (enforced at controller level).
+    The request's session is closed first: a stream stays open for hours
+    and must not hold a pooled connection.
+    """
+    await get_restaurant_by_id_service(db, restaurant_id)
+    await db.close()
+    return kitchen_event_stream(request, restaurant_id)
+
+
+async def kitchen_event_stream(request: Request, restaurant_id: int) -> AsyncIterator[str]:
+    """
+    Server-sent events for one restaurant's kitchen screens: `order_confirmed`
+    when a payment confirms an order, `order_status` when an order moves.
+    A comment line every KITCHEN_STREAM_HEARTBEAT_SECONDS keeps proxies from
+    closing an idle connection and lets the server notice disconnects.
+    """
+    subscription = kitchen_events.subscribe(restaurant_id)
+    logger.info(
+        "Kitchen stream opened | restaurant_id=%s subscribers=%s",
+        restaurant_id, kitchen_events.subscribers(restaurant_id),
+    )
+    try:
+        # Tell the client how long to wait before reconnecting
+        yield f"retry: {settings.KITCHEN_STREAM_HEARTBEAT_SECONDS * 1000}\n\n"
+        while not await request.is_disconnected():
+            try:
+                event = await subscription.get(settings.KITCHEN_STREAM_HEARTBEAT_SECONDS)
+            except EOFError:
+                logger.warning("Kitchen stream dropped: too slow | restaurant_id=%s", restaurant_id)
+                break
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield _sse(event["type"], event["order"])
+    finally:
+        kitchen_events.unsubscribe(subscription)
+        logger.info("Kitchen stream closed | restaurant_id=%s", restaurant_id)
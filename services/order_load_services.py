@@ -0,0 +1,37 @@
+"""
+Order Load Services - Business Logic
+
+Seeds and resyncs the in-process kitchen load tracker from the orders
+table. Between resyncs the order, payment and delivery services keep it
+current by applying each status transition.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from db.database import AsyncSessionLocal
+from repositories import order_repository
+from utils.order_load import order_load, ACTIVE_STATUSES
+from utils.logger_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+async def load_order_load(db: AsyncSession) -> None:
+    """One grouped COUNT of recent queued orders per restaurant and status."""
+    since = datetime.now(timezone.utc) - timedelta(hours=settings.ORDER_LOAD_WINDOW_HOURS)
+    order_load.load(await order_repository.get_status_counts(db, ACTIVE_STATUSES, since))
+
+    logger.info(
+        "Order load loaded | restaurants=%s",
+        len(order_load),
+    )
+
+
+async def resync_order_load_job() -> None:
+    """Entry point for the periodic task; owns its own session."""
+    async with AsyncSessionLocal() as db:
+        await load_order_load(db)
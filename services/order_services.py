@@ -4,17 +4,32 @@ Order Services - Business Logic
 Handles checkout process, order management, and status updates.
 """
 
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from core.config import settings
+from db.database import AsyncSessionLocal
 from models.user_model import User
 from models.order_model import Order
-from repositories import order_repository, cart_repository
+from repositories import order_repository, cart_repository, payment_repository
 from services.cart_services import get_cart_service
-from services.inventory_services import decrease_stock_service
+from services.inventory_services import (
+    reserve_order_stock_service,
+    release_order_stock_service,
+    restock_order_service,
+)
 from services.delivery_services import get_uber_quote_service
+from services.restaurant_services import is_restaurant_open, is_serviceable, is_zone_restricted
+from services.sales_services import record_order_sales
+from services.kitchen_services import publish_order_event
+from services.payment_services import refund_payment_service
 from schemas.order_schema import OrderResponse, OrderItemResponse
+from utils.http_cache_utils import make_etag
+from utils.fieldset_utils import parse_fields, subset_model
+from utils.order_load import order_load
 from utils.logger_utils import get_logger
 
 
@@ -43,10 +58,36 @@ async def place_order_service(db: AsyncSession, user: User) -> OrderResponse:
          raise HTTPException(status_code=400, detail="Cart empty")
 
     restaurant_id = db_cart.items[0].product.restaurant_id # Take first item's restaurant
+
+    if not is_restaurant_open(restaurant_id):
+        logger.warning("Order placement failed: restaurant closed | user_id=%s restaurant_id=%s", user.id, restaurant_id)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Restaurant is closed right now"
+        )
     
     # 2. Get Delivery Quote (Optional: only if restaurant and user addresses are set)
     user_address = next((a for a in db_cart.user.addresses if a.is_default), db_cart.user.addresses[0] if db_cart.user.addresses else None)
     
+    # Reject addresses outside the restaurant's delivery zones before paying for a quote
+    located = (
+        user_address is not None
+        and user_address.latitude is not None
+        and user_address.longitude is not None
+    )
+    if not located and is_zone_restricted(restaurant_id):
+        logger.warning("Order placement failed: address not located for zoned restaurant | user_id=%s restaurant_id=%s", user.id, restaurant_id)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Restaurant delivers only within its zones; add an address with coordinates"
+        )
+    if located and not is_serviceable(restaurant_id, user_address.latitude, user_address.longitude):
+        logger.warning("Order placement failed: address outside delivery zones | user_id=%s restaurant_id=%s", user.id, restaurant_id)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Restaurant does not deliver to this address"
+        )
+
     uber_quote_id = None
     delivery_fee = 0.0
     
@@ -62,7 +103,12 @@ async def place_order_service(db: AsyncSession, user: User) -> OrderResponse:
 
     total_with_delivery = cart.total_price + delivery_fee
 
-    # 3. Create Order
+    # 3. Reserve stock per product; committed together with the order below
+    await reserve_order_stock_service(
+        db, [(item.product_id, item.quantity) for item in db_cart.items]
+    )
+
+    # 4. Create Order
     order = await order_repository.create_order(
         db, 
         user.id, 
@@ -77,17 +123,9 @@ async def place_order_service(db: AsyncSession, user: User) -> OrderResponse:
         order.id, restaurant_id, total_with_delivery, delivery_fee
     )
     
-    # 3. Create Order Items & Update Inventory
+    # 5. Create Order Items
     items_data = []
     for item in db_cart.items:
-        await decrease_stock_service(
-             db, 
-             item.product.category_id, 
-             item.quantity, 
-             user,
-             check_permissions=False # Order placement is authorized system action
-        )
-        
         items_data.append({
             "product_id": item.product_id,
             "quantity": item.quantity,
@@ -96,20 +134,30 @@ async def place_order_service(db: AsyncSession, user: User) -> OrderResponse:
 
     await order_repository.create_order_items(db, order.id, items_data)
     
-    logger.info("Order items created and stock updated | order_id=%s", order.id)
+    logger.info("Order items created and stock reserved | order_id=%s", order.id)
     
-    # 4. Clear Cart
+    # 6. Clear Cart; its commit also commits the reservation, order and items,
+    # so a failure anywhere above rolls all of them back together
     await cart_repository.clear_cart(db, cart.id)
     
-    # 5. Return Order Response
+    order_load.transition(restaurant_id, None, "pending")
+
+    # 7. Return Order Response
     full_order = await order_repository.get_order_by_id(db, order.id)
     
     return OrderResponse.model_validate(full_order)
 
 
-async def get_my_orders_service(db: AsyncSession, user: User) -> List[OrderResponse]:
+async def get_my_orders_service(
+    db: AsyncSession, user: User, fields: Optional[str] = None
+) -> List[BaseModel]:
     # logger.info("Fetching orders | user_id=%s", user.id) 
-    orders = await order_repository.get_user_orders(db, user.id)
+    field_names = parse_fields(fields, OrderResponse)
+    orders = await order_repository.get_user_orders(db, user.id, columns=field_names)
+
+    if field_names:
+        order_model = subset_model(OrderResponse, field_names)
+        return [order_model.model_validate(o) for o in orders]
     return [OrderResponse.model_validate(o) for o in orders]
 
 
@@ -127,10 +175,30 @@ async def get_order_details_service(db: AsyncSession, user: User, order_id: int)
     return OrderResponse.model_validate(order)
 
 
+async def get_order_validators_service(
+    db: AsyncSession, user: User, order_id: int
+) -> Tuple[str, datetime]:
+    """
+    ETag and Last-Modified of an order, from `updated_at` alone.
+    Enforces the same access rules as `get_order_details_service`.
+    """
+    version = await order_repository.get_order_version(db, order_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    owner_id, updated_at = version
+    if owner_id != user.id and user.role != "admin":
+        logger.warning("Unauthorized order access | order_id=%s user_id=%s", order_id, user.id)
+        raise HTTPException(status_code=403, detail="Not authorized to view this order")
+
+    return make_etag("order", order_id, updated_at), updated_at
+
+
 async def cancel_order_service(db: AsyncSession, user: User, order_id: int) -> OrderResponse:
     logger.info("Cancelling order | order_id=%s user_id=%s", order_id, user.id)
     
-    order = await order_repository.get_order_by_id(db, order_id)
+    # Row lock: serializes with payment verification and expiry
+    order = await order_repository.get_order_for_update(db, order_id)
     if not order:
         logger.warning("Cancel failed: order not found | order_id=%s", order_id)
         raise HTTPException(status_code=404, detail="Order not found")
@@ -139,15 +207,100 @@ async def cancel_order_service(db: AsyncSession, user: User, order_id: int) -> O
         logger.warning("Cancel failed: unauthorized | order_id=%s user_id=%s", order_id, user.id)
         raise HTTPException(status_code=403, detail="Not authorized")
 
+    if order.status == "confirmed" and order.payment_status == "paid" and user.role == "admin":
+        return await _cancel_paid_order(db, order)
+
     if order.status != "pending":
          logger.warning("Cancel failed: bad status | order_id=%s status=%s", order_id, order.status)
          raise HTTPException(status_code=400, detail="Cannot cancel non-pending order")
 
-    # Ideally we should restore stock here too!
-    # Skipping for brevity/MVP unless requested.
-    
+    # Return reserved stock; committed together with the status change.
+    # Pending orders are unpaid, so there are no sales to take back.
+    await release_order_stock_service(db, order)
+
     updated_order = await order_repository.update_order_status(db, order_id, "cancelled")
+    order_load.transition(order.restaurant_id, "pending", "cancelled")
     
     logger.info("Order cancelled successfully | order_id=%s", order_id)
     
     return OrderResponse.model_validate(updated_order)
+
+
+async def _cancel_paid_order(db: AsyncSession, order: Order) -> OrderResponse:
+    """
+    Cancel a confirmed order the kitchen has not started: stock goes back,
+    the sales rollups drop the order and the status changes in one
+    transaction, then the payment is refunded.
+    """
+    order_id = order.id
+    await restock_order_service(db, order)
+    await record_order_sales(db, order, sign=-1)
+    order.status = "cancelled"
+    await db.commit()
+
+    order_load.transition(order.restaurant_id, "confirmed", "cancelled")
+    publish_order_event(order, "order_status")
+
+    payment = await payment_repository.get_payment_by_order_id(db, order_id)
+    if payment:
+        await refund_payment_service(db, order, payment)
+
+    logger.info("Paid order cancelled | order_id=%s payment_status=%s", order_id, order.payment_status)
+
+    updated_order = await order_repository.get_order_by_id(db, order_id)
+    return OrderResponse.model_validate(updated_order)
+
+
+async def expire_pending_orders(db: AsyncSession) -> int:
+    """
+    Cancel unpaid orders older than PENDING_ORDER_TTL_MINUTES and release
+    their reservations, one order per transaction. Returns the number
+    expired; a late payment for an expired order is refunded. An order
+    whose reservation cannot be released is set to `expired_unreleased`
+    and logged for a manual stock correction.
+    """
+    before = datetime.now(timezone.utc) - timedelta(minutes=settings.PENDING_ORDER_TTL_MINUTES)
+    expired = 0
+    for order_id in await order_repository.get_stale_pending_order_ids(
+        db, before, settings.ORDER_EXPIRY_BATCH_SIZE
+    ):
+        # Re-checked under the row lock: the payment may have landed meanwhile
+        order = await order_repository.get_order_for_update(db, order_id)
+        if not order or order.status != "pending" or order.payment_status != "unpaid":
+            await db.commit()
+            continue
+        restaurant_id = order.restaurant_id
+        try:
+            await release_order_stock_service(db, order)
+        except HTTPException:
+            # Rolled back; park the order so it stops filling later batches
+            await _park_unreleased_order(db, order_id, restaurant_id)
+            continue
+        order.status = "cancelled"
+        await db.commit()
+        order_load.transition(restaurant_id, "pending", "cancelled")
+        expired += 1
+
+    if expired:
+        logger.info("Pending orders expired | count=%s", expired)
+    return expired
+
+
+async def _park_unreleased_order(db: AsyncSession, order_id: int, restaurant_id: int) -> None:
+    order = await order_repository.get_order_for_update(db, order_id)
+    if order and order.status == "pending" and order.payment_status == "unpaid":
+        order.status = "expired_unreleased"
+        await db.commit()
+        order_load.transition(restaurant_id, "pending", "expired_unreleased")
+    else:
+        await db.commit()
+    logger.error(
+        "Order expired without releasing stock; needs a manual stock correction | order_id=%s",
+        order_id,
+    )
+
+
+async def expire_pending_orders_job() -> None:
+    """Entry point for the periodic task; owns its own session."""
+    async with AsyncSessionLocal() as db:
+        await expire_pending_orders(db)
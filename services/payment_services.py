@@ -5,19 +5,30 @@ Handles Razorpay integration, payment verification, and order status updates.
 """
 
 import os
+from typing import Optional
+
 import razorpay
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from models.user_model import User
+from models.order_model import Order
+from models.payment_model import Payment
 from repositories import payment_repository, order_repository
 from schemas.payment_schema import PaymentCreate, PaymentVerify, PaymentSessionResponse, PaymentResponse
 from services.delivery_services import dispatch_uber_delivery_service
+from services.inventory_services import commit_order_stock_service
+from services.sales_services import record_order_sales
+from services.kitchen_services import publish_order_event
 from core.config import settings
+from utils.order_load import order_load
 from utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Payment/order states after a refund was issued or attempted
+REFUND_STATUSES = ("refunded", "refund_pending")
+
 # Initialize Razorpay Client
 RAZORPAY_KEY_ID = settings.RAZORPAY_KEY_ID
 RAZORPAY_KEY_SECRET = settings.RAZORPAY_KEY_SECRET
@@ -46,6 +57,13 @@ async def create_payment_session_service(
     if order.payment_status == "paid":
         raise HTTPException(status_code=400, detail="Order already paid")
 
+    if order.status != "pending":
+        logger.warning(
+            "Payment session refused: order not pending | order_id=%s status=%s",
+            order.id, order.status,
+        )
+        raise HTTPException(status_code=400, detail="Order is not awaiting payment")
+
     # Create Razorpay Order
     # Amount is in paise (Multiply by 100)
     amount_in_paise = int(order.total_amount * 100)
@@ -123,29 +141,104 @@ async def verify_payment_service(
     payment = await payment_repository.get_payment_by_transaction_id(db, verification_data.razorpay_order_id)
     if not payment:
          raise HTTPException(status_code=404, detail="Payment record not found")
-         
-    # Update Payment
-    updated_payment = await payment_repository.update_payment_status(
-        db, payment, status="completed", payment_method="razorpay" # Explicitly setting method
-    )
-    
-    # Update Order
-    order = await order_repository.get_order_by_id(db, payment.order_id)
-    if order:
-        order.payment_status = "paid"
-        order.status = "confirmed" # Auto-confirm on payment
+
+    # Lock the order before touching either row; serializes with cancellation and expiry
+    order = await order_repository.get_order_for_update(db, payment.order_id)
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    if payment.status in REFUND_STATUSES or order.payment_status in REFUND_STATUSES:
+        # Verification retried after a refund: nothing left to apply or refund
         await db.commit()
-        await db.refresh(order) # Refresh to ensure attributes are available for dispatch
-        
-        # 3. Dispatch to Uber Direct
-        logger.info(f"Triggering Uber Direct dispatch for order {order.id}")
-        try:
-            await dispatch_uber_delivery_service(db, order)
-            logger.info(f"Uber Direct dispatch completed for order {order.id}")
-        except Exception as e:
-            logger.error(f"Post-payment delivery dispatch failed for order {order.id}: {str(e)}")
-            # We don't fail the verification since payment is already confirmed
+        logger.info("Payment already refunded | order_id=%s status=%s", order.id, payment.status)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Order is no longer pending; the payment was refunded",
+        )
+    if order.payment_status == "paid":
+        # Verification retried: the order was already confirmed
+        await db.commit()
+        logger.info("Payment already applied | order_id=%s", order.id)
+        return PaymentResponse.model_validate(payment)
+
+    # Committed together with the order change below
+    payment.status = "completed"
+    payment.payment_method = "razorpay"
+
+    if order.status != "pending":
+        # Cancelled or expired while the customer was paying: nothing to fulfil
+        logger.warning(
+            "Payment for non-pending order | order_id=%s status=%s",
+            order.id, order.status,
+        )
+        await refund_payment_service(db, order, payment, verification_data.razorpay_payment_id)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Order is no longer pending; the payment will be refunded",
+        )
+
+    try:
+        # Reserved stock is now sold; committed together with the status change
+        await commit_order_stock_service(db, order)
+    except HTTPException:
+        # Rolled back; the customer paid for stock we no longer hold
+        await db.refresh(payment)
+        order = await order_repository.get_order_for_update(db, payment.order_id)
+        await refund_payment_service(db, order, payment, verification_data.razorpay_payment_id)
+        raise
+
+    # Sales rollups move in the same transaction
+    await record_order_sales(db, order)
+    previous_status = order.status
+    order.payment_status = "paid"
+    order.status = "confirmed" # Auto-confirm on payment
+    await db.commit()
+    order_load.transition(order.restaurant_id, previous_status, order.status)
+    publish_order_event(order, "order_confirmed")
+    await db.refresh(order) # Refresh to ensure attributes are available for dispatch
     
+    # 3. Dispatch to Uber Direct
+    logger.info(f"Triggering Uber Direct dispatch for order {order.id}")
+    try:
+        await dispatch_uber_delivery_service(db, order)
+        logger.info(f"Uber Direct dispatch completed for order {order.id}")
+    except Exception as e:
+        logger.error(f"Post-payment delivery dispatch failed for order {order.id}: {str(e)}")
+        # We don't fail the verification since payment is already confirmed
+
     logger.info("Payment verified and order updated | order_id=%s", payment.order_id)
     
-    return PaymentResponse.model_validate(updated_payment)
+    return PaymentResponse.model_validate(payment)
+
+
+async def refund_payment_service(
+    db: AsyncSession,
+    order: Order,
+    payment: Payment,
+    razorpay_payment_id: Optional[str] = None,
+) -> bool:
+    """
+    Refund a captured payment in full and record the outcome on the
+    payment and the order; commits. A failed refund is left as
+    `refund_pending` for manual follow-up. Without `razorpay_payment_id`
+    the captured payments of the Razorpay order are looked up.
+    """
+    try:
+        if razorpay_payment_id:
+            payment_ids = [razorpay_payment_id]
+        else:
+            captured = razorpay_client.order.payments(payment.transaction_id).get("items", [])
+            payment_ids = [p["id"] for p in captured if p.get("status") == "captured"]
+        for payment_id in payment_ids:
+            razorpay_client.payment.refund(payment_id, {"amount": int(float(payment.amount) * 100)})
+        refunded = True
+    except Exception as e:
+        logger.error("Refund failed | order_id=%s error=%s", order.id, str(e))
+        refunded = False
+
+    payment.status = "refunded" if refunded else "refund_pending"
+    order.payment_status = payment.status
+    await db.commit()
+
+    logger.info("Payment refund %s | order_id=%s", payment.status, order.id)
+    return refunded
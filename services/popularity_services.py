@@ -0,0 +1,145 @@
+"""
+Popularity Services - Business Logic
+
+A periodic job computes time-decayed popularity per product from recent
+order items and favorites, and per restaurant as the sum over its
+products. Scores live in the in-process ranking; the ranked endpoints
+only slice it and hydrate the top ids from the catalog cache.
+"""
+
+import math
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from db.database import AsyncSessionLocal
+from repositories import popularity_repository, product_repository, restaurant_repository
+from repositories.search_repository import FAVORITE_WEIGHT
+from schemas.product_schema import PopularProduct, ProductResponse
+from schemas.restaurant_schema import PopularRestaurant, RestaurantResponse
+from utils.catalog_cache import catalog_cache
+from utils.popularity_ranking import popularity_ranking
+from utils.order_load import order_load
+from utils.typeahead_index import typeahead_index, PRODUCT, RESTAURANT
+from utils.logger_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _decay(day: date, today: date) -> float:
+    """Weight of activity `day` old: halves every POPULARITY_HALF_LIFE_DAYS."""
+    age_days = max((today - day).days, 0)
+    return math.exp(-math.log(2) * age_days / settings.POPULARITY_HALF_LIFE_DAYS)
+
+
+async def refresh_popularity(db: AsyncSession) -> None:
+    now = datetime.now(timezone.utc)
+    since = now - timedelta(days=settings.POPULARITY_WINDOW_DAYS)
+    today = now.date()
+
+    product_scores: Dict[int, float] = {}
+    product_restaurants: Dict[int, int] = {}
+
+    sources = (
+        (1.0, await popularity_repository.get_daily_units(db, since)),
+        (float(FAVORITE_WEIGHT), await popularity_repository.get_daily_favorites(db, since)),
+    )
+    for weight, rows in sources:
+        for product_id, restaurant_id, day, count in rows:
+            product_scores[product_id] = (
+                product_scores.get(product_id, 0.0) + weight * count * _decay(day, today)
+            )
+            product_restaurants[product_id] = restaurant_id
+
+    popularity_ranking.replace(product_scores, product_restaurants)
+
+    # Suggestions rank by the same recency-aware popularity
+    typeahead_index.set_weights(PRODUCT, product_scores)
+    typeahead_index.set_weights(RESTAURANT, dict(popularity_ranking.snapshot.restaurants))
+
+    logger.info(
+        "Popularity refreshed | products=%s restaurants=%s version=%s",
+        len(product_scores),
+        len(popularity_ranking.snapshot.restaurants),
+        popularity_ranking.version,
+    )
+
+
+async def refresh_popularity_job() -> None:
+    """Entry point for the periodic task; owns its own session."""
+    async with AsyncSessionLocal() as db:
+        await refresh_popularity(db)
+
+
+async def get_popular_products_service(
+    db: AsyncSession,
+    limit: int = 20,
+    restaurant_id: Optional[int] = None,
+) -> List[PopularProduct]:
+    ranked = popularity_ranking.top_products(limit, restaurant_id)
+
+    async def load() -> List[PopularProduct]:
+        products = {
+            p.id: p for p in await product_repository.get_by_ids(db, {pid for pid, _ in ranked})
+        }
+        return [
+            PopularProduct(
+                **ProductResponse.model_validate(products[pid]).model_dump(),
+                score=round(score, 4),
+            )
+            for pid, score in ranked
+            if pid in products and products[pid].is_available
+        ]
+
+    return await catalog_cache.get_or_load(
+        ("popular_products", popularity_ranking.version, limit, restaurant_id),
+        load,
+    )
+
+
+async def get_popular_restaurants_service(
+    db: AsyncSession,
+    limit: int = 20,
+) -> List[PopularRestaurant]:
+    """
+    Top restaurants by popularity, re-ranked by current kitchen load:
+    the score is divided by (1 + queued orders per kitchen slot), so a
+    swamped favourite yields to an idle one of similar popularity.
+    """
+    ranked = popularity_ranking.top_restaurants(limit)
+
+    async def load() -> List[PopularRestaurant]:
+        restaurants = {
+            r.id: r
+            for r in await restaurant_repository.get_restaurants_by_ids(db, {rid for rid, _ in ranked})
+        }
+        return [
+            PopularRestaurant(
+                **RestaurantResponse.model_validate(restaurants[rid]).model_dump(),
+                score=round(score, 4),
+            )
+            for rid, score in ranked
+            if rid in restaurants and restaurants[rid].is_active
+        ]
+
+    popular = await catalog_cache.get_or_load(
+        ("popular_restaurants", popularity_ranking.version, limit),
+        load,
+    )
+
+    # Load moves every order, so it is applied to copies after the cache
+    adjusted = [
+        restaurant.model_copy(
+            update={
+                "score": round(restaurant.score / (1 + order_load.load_factor(restaurant.id)), 4),
+                "active_orders": order_load.active(restaurant.id),
+                "prep_delay_minutes": order_load.prep_delay_minutes(restaurant.id),
+            }
+        )
+        for restaurant in popular
+    ]
+    adjusted.sort(key=lambda restaurant: (-restaurant.score, restaurant.id))
+    return adjusted
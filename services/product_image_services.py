@@ -0,0 +1,160 @@
+"""
+Product Image Services - Upload Flow
+
+1. The client asks for an upload ticket: a presigned POST form for one
+   object key under the product's prefix.
+2. The client uploads the file straight to object storage.
+3. The client confirms the key; the product's `image_url` is set and the
+   worker pool renders the thumbnail and WebP variants in the background.
+   Their URLs are written back to the product when ready.
+"""
+
+import asyncio
+import uuid
+from typing import Set
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from core.config import settings
+from db.database import AsyncSessionLocal
+from models.product_model import Product
+from repositories import product_repository, catalog_change_repository
+from schemas.product_schema import ProductImageUploadTicket
+from services import catalog_sync_services
+from utils.image_worker import image_worker_pool
+from utils.logger_utils import get_logger
+from utils.storage_utils import storage
+
+
+logger = get_logger(__name__)
+
+_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+}
+
+# Strong references to in-flight variant jobs (the loop only keeps weak ones)
+_variant_tasks: Set[asyncio.Task] = set()
+
+
+def _require_storage() -> None:
+    if not storage.enabled:
+        logger.warning("Image upload rejected: object storage not configured")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Image uploads are not configured",
+        )
+
+
+async def _get_product_or_404(db: AsyncSession, product_id: int) -> Product:
+    product = await product_repository.get_by_id(db, product_id)
+    if not product:
+        logger.warning("Product not found | product_id=%s", product_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product not found",
+        )
+    return product
+
+
+async def create_image_upload_service(
+    db: AsyncSession,
+    product_id: int,
+    content_type: str,
+) -> ProductImageUploadTicket:
+    _require_storage()
+    await _get_product_or_404(db, product_id)
+
+    key = f"products/{product_id}/{uuid.uuid4().hex}/original.{_EXTENSIONS[content_type]}"
+    post = storage.presigned_post(
+        key,
+        content_type,
+        max_bytes=settings.PRODUCT_IMAGE_MAX_BYTES,
+        expires_in=settings.S3_PRESIGN_EXPIRES_SECONDS,
+    )
+
+    logger.info("Image upload ticket issued | product_id=%s key=%s", product_id, key)
+
+    return ProductImageUploadTicket(
+        upload_url=post["url"],
+        fields=post["fields"],
+        key=key,
+        expires_in=settings.S3_PRESIGN_EXPIRES_SECONDS,
+        max_bytes=settings.PRODUCT_IMAGE_MAX_BYTES,
+    )
+
+
+async def complete_image_upload_service(
+    db: AsyncSession,
+    product_id: int,
+    key: str,
+) -> Product:
+    _require_storage()
+    product = await _get_product_or_404(db, product_id)
+
+    # Only keys issued for this product are accepted
+    prefix = f"products/{product_id}/"
+    name = key.rsplit("/", 1)[-1]
+    if not key.startswith(prefix) or key.count("/") != 3 or not name.startswith("original."):
+        logger.warning("Image upload rejected: foreign key | product_id=%s key=%s", product_id, key)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Key was not issued for this product",
+        )
+
+    head = await run_in_threadpool(storage.head, key)
+    if head is None:
+        logger.warning("Image upload not found in storage | product_id=%s key=%s", product_id, key)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded image not found",
+        )
+
+    product.image_url = storage.public_url(key)
+    product.thumbnail_url = None
+    product.image_variants = None
+    await catalog_change_repository.record_changes(db, "product", [product_id])
+    await db.commit()
+    await db.refresh(product)
+    await catalog_sync_services.product_written(db, product)
+
+    task = asyncio.create_task(_render_variants(product_id, key))
+    _variant_tasks.add(task)
+    task.add_done_callback(_variant_tasks.discard)
+
+    logger.info(
+        "Product image uploaded | product_id=%s key=%s bytes=%s",
+        product_id,
+        key,
+        head.get("ContentLength"),
+    )
+
+    return product
+
+
+async def _render_variants(product_id: int, key: str) -> None:
+    try:
+        variant_keys = await image_worker_pool.render(key)
+    except Exception as e:
+        logger.error("Image variant rendering failed | product_id=%s key=%s error=%s", product_id, key, str(e))
+        return
+
+    # The request session is gone by now; write back in a fresh one
+    async with AsyncSessionLocal() as db:
+        product = await product_repository.get_by_id(db, product_id)
+        if not product or product.image_url != storage.public_url(key):
+            logger.info("Image variants discarded: image replaced | product_id=%s", product_id)
+            return
+
+        product.thumbnail_url = storage.public_url(variant_keys.pop("thumbnail"))
+        product.image_variants = {
+            name: storage.public_url(variant_key) for name, variant_key in variant_keys.items()
+        }
+        await catalog_change_repository.record_changes(db, "product", [product_id])
+        await db.commit()
+        await catalog_sync_services.product_written(db, product)
+
+    logger.info("Image variants stored | product_id=%s variants=%s", product_id, len(variant_keys))
@@ -4,19 +4,45 @@ Product Services - Async Business Logic
 Handles product CRUD operations with async database access.
 """
 
-from typing import List
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from pydantic import ValidationError
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from models.product_model import Product
-from schemas.product_schema import ProductCreate, ProductUpdate
-from repositories import product_repository
+from schemas.product_schema import (
+    ProductCreate,
+    ProductUpdate,
+    ProductResponse,
+    ProductPage,
+    ProductSearchHit,
+    ProductSearchPage,
+    ProductImportRowError,
+    ProductImportReport,
+    ProductBulkUpdate,
+    ProductBulkUpdateReport,
+    ProductFacets,
+    ProductFacetCount,
+    PriceFacetCount,
+)
+from repositories import product_repository, restaurant_repository, catalog_change_repository
+from services import catalog_sync_services
+from services.category_services import resolve_category_id
+from utils.catalog_cache import catalog_cache
 from utils.logger_utils import get_logger
+from utils.pagination_utils import encode_cursor, decode_cursor
+from utils.import_utils import ImportRow
+from utils.fieldset_utils import parse_fields, subset_model
 
 
 logger = get_logger(__name__)
 
+# Rows inserted per INSERT/commit during bulk import
+IMPORT_BATCH_SIZE = 200
+
 
 async def create_product_service(
     db: AsyncSession,
@@ -65,10 +91,9 @@ async def create_product_service(
             detail="Product already exists for this restaurant",
         )
 
-    # Resolve category_name to category_id
-    from repositories import category_repository
-    category = await category_repository.get_by_name(db, product.category_name)
-    if not category:
+    # Resolve category_name to category_id (in-process registry, no query on a hit)
+    category_id = await resolve_category_id(db, product.category_name)
+    if category_id is None:
         logger.warning(
             "Category not found during product creation | category_name=%s",
             product.category_name,
@@ -79,8 +104,9 @@ async def create_product_service(
         )
 
     created_product = await product_repository.create_with_category_id(
-        db, product, category.id
+        db, product, category_id
     )
+    await catalog_sync_services.product_written(db, created_product)
 
     logger.info(
         "Product created successfully | product_id=%s",
@@ -90,13 +116,159 @@ async def create_product_service(
     return created_product
 
 
+async def _load_product(
+    db: AsyncSession,
+    product_id: int,
+) -> Optional[ProductResponse]:
+    product = await product_repository.get_by_id(db, product_id)
+    return ProductResponse.model_validate(product) if product else None
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+async def import_products_service(
+    db: AsyncSession,
+    rows: Iterable[ImportRow],
+) -> ProductImportReport:
+    """
+    Bulk-create products from parsed upload rows.
+
+    Categories are resolved through the in-process registry, duplicates are
+    detected per batch with one set-based query, and every batch is
+    inserted with a single commit. Bad rows are reported, not fatal.
+    """
+    logger.info("Bulk product import started")
+
+    # Per-upload memo, so an unknown name is looked up in the DB only once
+    category_ids: Dict[str, Optional[int]] = {}
+
+    errors: List[ProductImportRowError] = []
+    seen: Set[Tuple[int, str]] = set()
+    batch: List[Tuple[int, ProductCreate, int]] = []
+    total_rows = 0
+    created = 0
+
+    async def flush_batch() -> None:
+        nonlocal created
+        if not batch:
+            return
+
+        existing = await product_repository.get_existing_names(
+            db, {(p.restaurant_id, p.name) for _, p, _ in batch}
+        )
+        restaurant_ids = await restaurant_repository.get_existing_ids(
+            db, {p.restaurant_id for _, p, _ in batch}
+        )
+
+        accepted = []
+        for row, product, category_id in batch:
+            if (product.restaurant_id, product.name) in existing:
+                errors.append(ProductImportRowError(
+                    row=row, name=product.name, error="Product already exists for this restaurant"
+                ))
+            elif product.restaurant_id not in restaurant_ids:
+                errors.append(ProductImportRowError(
+                    row=row, name=product.name, error="Restaurant not found"
+                ))
+            else:
+                accepted.append((row, product, category_id))
+
+        if accepted:
+            try:
+                created_products = await product_repository.create_many(
+                    db, [(product, category_id) for _, product, category_id in accepted]
+                )
+            except IntegrityError:
+                # Lost a race with a concurrent write; the whole batch was rolled back
+                await db.rollback()
+                logger.warning("Bulk import batch rejected by database | rows=%s", len(accepted))
+                errors.extend(
+                    ProductImportRowError(row=row, name=product.name, error="Batch insert failed")
+                    for row, product, _ in accepted
+                )
+            else:
+                await catalog_sync_services.products_written(db, created_products)
+                created += len(created_products)
+
+        batch.clear()
+
+    for row, data, parse_error in rows:
+        total_rows += 1
+
+        if parse_error:
+            errors.append(ProductImportRowError(row=row, error=parse_error))
+            continue
+
+        try:
+            product = ProductCreate(**data)
+        except ValidationError as e:
+            errors.append(ProductImportRowError(
+                row=row, name=data.get("name"), error=_validation_message(e)
+            ))
+            continue
+
+        if not product.name.strip():
+            errors.append(ProductImportRowError(row=row, error="Product name cannot be empty"))
+            continue
+
+        if product.category_name not in category_ids:
+            category_ids[product.category_name] = await resolve_category_id(
+                db, product.category_name
+            )
+        category_id = category_ids[product.category_name]
+        if category_id is None:
+            errors.append(ProductImportRowError(
+                row=row, name=product.name, error=f"Category '{product.category_name}' not found"
+            ))
+            continue
+
+        key = (product.restaurant_id, product.name)
+        if key in seen:
+            errors.append(ProductImportRowError(
+                row=row, name=product.name, error="Duplicate of an earlier row in this upload"
+            ))
+            continue
+        seen.add(key)
+
+        batch.append((row, product, category_id))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await flush_batch()
+
+    await flush_batch()
+
+    errors.sort(key=lambda e: e.row)
+
+    logger.info(
+        "Bulk product import finished | rows=%s created=%s failed=%s",
+        total_rows,
+        created,
+        len(errors),
+    )
+
+    return ProductImportReport(
+        total_rows=total_rows,
+        created=created,
+        failed=len(errors),
+        errors=errors,
+    )
+
+
 async def get_product_by_id_service(
     db: AsyncSession,
     product_id: int,
-) -> Product:
+) -> ProductResponse:
     logger.info("Fetching product | product_id=%s", product_id)
 
-    product = await product_repository.get_by_id(db, product_id)
+    # Served from the catalog snapshot; missing ids are cached as None
+    product = await catalog_cache.get_or_load(
+        ("product", product_id),
+        lambda: _load_product(db, product_id),
+    )
 
     if not product:
         logger.warning(
@@ -123,19 +295,213 @@ async def get_product_by_id_service(
 
 async def get_all_products_service(
     db: AsyncSession,
-) -> List[Product]:
-    logger.info("Fetching all available products")
+    *,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    sort: str = "newest",
+    restaurant_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    fields: Optional[str] = None,
+) -> Union[ProductPage, Dict[str, Any]]:
+    """
+    With `fields`, only those product columns are loaded and serialized,
+    and the page is returned as a plain dict of subset models.
+    """
+    logger.info(
+        "Fetching available products | sort=%s limit=%s restaurant_id=%s category_id=%s fields=%s",
+        sort,
+        limit,
+        restaurant_id,
+        category_id,
+        fields,
+    )
+
+    field_names = parse_fields(fields, ProductResponse)
+
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_price cannot be greater than max_price",
+        )
+
+    after = None
+    if cursor:
+        try:
+            after = product_repository.parse_page_key(decode_cursor(cursor, sort), sort)
+        except (ValueError, TypeError, ArithmeticError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+
+    async def load_page() -> Union[ProductPage, Dict[str, Any]]:
+        products = await product_repository.get_page(
+            db,
+            limit=limit,
+            sort=sort,
+            after=after,
+            restaurant_id=restaurant_id,
+            category_id=category_id,
+            min_price=min_price,
+            max_price=max_price,
+            columns=field_names,
+        )
+
+        next_cursor = None
+        if len(products) > limit:
+            products = products[:limit]
+            next_cursor = encode_cursor(
+                sort, product_repository.page_key(products[-1], sort)
+            )
+
+        logger.info(
+            "Products fetched from DB | count=%s has_more=%s",
+            len(products),
+            next_cursor is not None,
+        )
+
+        if field_names:
+            item_model = subset_model(ProductResponse, field_names)
+            return {
+                "items": [item_model.model_validate(p) for p in products],
+                "next_cursor": next_cursor,
+            }
+
+        return ProductPage(
+            items=[ProductResponse.model_validate(p) for p in products],
+            next_cursor=next_cursor,
+        )
+
+    return await catalog_cache.get_or_load(
+        ("products", sort, limit, cursor, restaurant_id, category_id, min_price, max_price, field_names),
+        load_page,
+    )
+
+
+async def get_product_facets_service(
+    db: AsyncSession,
+    *,
+    restaurant_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+) -> ProductFacets:
+    logger.info(
+        "Fetching product facets | restaurant_id=%s category_id=%s min_price=%s max_price=%s",
+        restaurant_id,
+        category_id,
+        min_price,
+        max_price,
+    )
 
-    products = await product_repository.get_all(db)
-    available_products = [p for p in products if p.is_available]
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_price cannot be greater than max_price",
+        )
 
+    async def load_facets() -> ProductFacets:
+        counts = await product_repository.get_facet_counts(
+            db,
+            restaurant_id=restaurant_id,
+            category_id=category_id,
+            min_price=min_price,
+            max_price=max_price,
+        )
+
+        edges = (0, *product_repository.PRICE_FACET_EDGES)
+        price_buckets = [
+            PriceFacetCount(
+                min_price=low,
+                max_price=edges[i + 1] if i + 1 < len(edges) else None,
+                count=counts["price"].get(i, 0),
+            )
+            for i, low in enumerate(edges)
+        ]
+
+        def by_count(facet: str) -> List[ProductFacetCount]:
+            return [
+                ProductFacetCount(id=facet_id, count=count)
+                for facet_id, count in sorted(
+                    counts[facet].items(), key=lambda item: (-item[1], item[0])
+                )
+            ]
+
+        return ProductFacets(
+            total=sum(counts["price"].values()),
+            categories=by_count("category"),
+            restaurants=by_count("restaurant"),
+            price_buckets=price_buckets,
+        )
+
+    return await catalog_cache.get_or_load(
+        ("product_facets", restaurant_id, category_id, min_price, max_price),
+        load_facets,
+    )
+
+
+async def search_products_service(
+    db: AsyncSession,
+    query: str,
+    *,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    restaurant_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+) -> ProductSearchPage:
     logger.info(
-        "Products fetched | total=%s available=%s",
-        len(products),
-        len(available_products),
+        "Searching products | q=%s restaurant_id=%s category_id=%s",
+        query,
+        restaurant_id,
+        category_id,
     )
 
-    return available_products
+    if not re.search(r"\w", query):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query cannot be empty",
+        )
+
+    offset = 0
+    if cursor:
+        try:
+            offset = int(decode_cursor(cursor, "search")[0])
+        except (ValueError, TypeError):
+            offset = -1
+        if offset < 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+
+    hits = await product_repository.search(
+        db,
+        query,
+        limit=limit,
+        offset=offset,
+        restaurant_id=restaurant_id,
+        category_id=category_id,
+    )
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_cursor = encode_cursor("search", [offset + limit])
+
+    logger.info("Product search done | q=%s hits=%s", query, len(hits))
+
+    return ProductSearchPage(
+        items=[
+            ProductSearchHit(
+                **ProductResponse.model_validate(product).model_dump(),
+                rank=rank,
+            )
+            for product, rank in hits
+        ],
+        next_cursor=next_cursor,
+    )
 
 
 async def update_product_service(
@@ -171,11 +537,22 @@ async def update_product_service(
             detail="Product price must be greater than zero",
         )
 
+    previous_restaurant_id = db_product.restaurant_id
+
     updated_product = await product_repository.update(
         db,
         db_product,
         product_update,
     )
+    await catalog_sync_services.product_written(
+        db,
+        updated_product,
+        previous_restaurant_id=(
+            previous_restaurant_id
+            if updated_product.restaurant_id != previous_restaurant_id
+            else None
+        ),
+    )
 
     logger.info(
         "Product updated successfully | product_id=%s",
@@ -185,6 +562,45 @@ async def update_product_service(
     return updated_product
 
 
+async def bulk_update_products_service(
+    db: AsyncSession,
+    payload: ProductBulkUpdate,
+) -> ProductBulkUpdateReport:
+    prices = {i.product_id: i.price for i in payload.items if i.price is not None}
+    availability = {
+        i.product_id: i.is_available for i in payload.items if i.is_available is not None
+    }
+
+    logger.info(
+        "Bulk updating products | count=%s prices=%s availability=%s",
+        len(payload.items),
+        len(prices),
+        len(availability),
+    )
+
+    updated, missing_ids = await product_repository.bulk_update_price_availability(
+        db,
+        prices,
+        availability,
+    )
+    if updated:
+        await catalog_sync_services.products_written(db, updated)
+
+    if missing_ids:
+        logger.warning(
+            "Bulk update skipped unknown products | missing_ids=%s",
+            missing_ids,
+        )
+
+    logger.info(
+        "Bulk update finished | updated=%s missing=%s",
+        len(updated),
+        len(missing_ids),
+    )
+
+    return ProductBulkUpdateReport(updated=len(updated), missing_ids=missing_ids)
+
+
 async def delete_product_service(
     db: AsyncSession,
     product_id: int,
@@ -207,7 +623,9 @@ async def delete_product_service(
         )
 
     product.is_available = False
+    await catalog_change_repository.record_changes(db, "product", [product_id])
     await db.commit()
+    await catalog_sync_services.product_written(db, product)
 
     logger.info(
         "Product soft-deleted successfully | product_id=%s",
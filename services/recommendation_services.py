@@ -0,0 +1,140 @@
+"""
+Recommendation Services - Business Logic
+
+"Frequently bought together": a periodic job builds the sparse product x
+product co-occurrence matrix from recent orders (utils.cooccurrence) and
+stores the top-k neighbours per product. Serving is one indexed lookup
+into those lists, never a self-join over order history.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from core.config import settings
+from db.database import AsyncSessionLocal
+from models.user_model import User
+from repositories import cart_repository, recommendation_repository
+from schemas.product_schema import ProductResponse, RecommendedProduct
+from services.product_services import get_product_by_id_service
+from utils.catalog_cache import catalog_cache
+from utils.cooccurrence import top_k_neighbours
+from utils.logger_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+# Order history the stored lists were built from; unchanged history skips the rebuild
+_built_from: Optional[Tuple] = None
+# Bumped on every rebuild in this process, to key cached lists
+_version = 0
+
+
+async def refresh_recommendations(db: AsyncSession) -> None:
+    global _built_from, _version
+
+    since = datetime.now(timezone.utc) - timedelta(days=settings.RECOMMENDATIONS_WINDOW_DAYS)
+    history = await recommendation_repository.get_order_history_version(db, since)
+    if history == _built_from:
+        logger.debug("Recommendations up to date | orders=%s", history[0])
+        return
+
+    pairs = await recommendation_repository.get_order_product_pairs(db, since)
+    pair_array = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+
+    # Matrix work is CPU-bound; keep it off the event loop
+    neighbours = await run_in_threadpool(
+        top_k_neighbours,
+        pair_array[:, 0],
+        pair_array[:, 1],
+        settings.RECOMMENDATIONS_TOP_K,
+        settings.RECOMMENDATIONS_MIN_CO_ORDERS,
+    )
+
+    await recommendation_repository.replace_recommendations(
+        db,
+        (
+            {
+                "product_id": product_id,
+                "rank": rank,
+                "recommended_product_id": neighbour_id,
+                "score": score,
+                "co_orders": co_orders,
+            }
+            for product_id, rank, neighbour_id, score, co_orders in zip(
+                neighbours.product_ids.tolist(),
+                neighbours.ranks.tolist(),
+                neighbours.neighbour_ids.tolist(),
+                neighbours.scores.tolist(),
+                neighbours.co_orders.tolist(),
+            )
+        ),
+    )
+    _built_from = history
+    _version += 1
+
+    logger.info(
+        "Recommendations rebuilt | order_lines=%s products=%s pairs=%s",
+        len(pairs),
+        len(np.unique(neighbours.product_ids)),
+        len(neighbours.product_ids),
+    )
+
+
+async def refresh_recommendations_job() -> None:
+    """Entry point for the periodic task; owns its own session."""
+    async with AsyncSessionLocal() as db:
+        await refresh_recommendations(db)
+
+
+def _to_response(rows) -> List[RecommendedProduct]:
+    return [
+        RecommendedProduct(
+            **ProductResponse.model_validate(product).model_dump(),
+            score=round(score, 4),
+        )
+        for product, score in rows
+    ]
+
+
+async def get_product_recommendations_service(
+    db: AsyncSession,
+    product_id: int,
+    limit: int = 10,
+) -> List[RecommendedProduct]:
+    # 404 for missing or unavailable products
+    await get_product_by_id_service(db, product_id)
+
+    async def load() -> List[RecommendedProduct]:
+        return _to_response(
+            await recommendation_repository.get_for_product(db, product_id, limit)
+        )
+
+    return await catalog_cache.get_or_load(
+        ("product_recommendations", _version, product_id, limit),
+        load,
+    )
+
+
+async def get_cart_recommendations_service(
+    db: AsyncSession,
+    user: User,
+    limit: int = 10,
+) -> List[RecommendedProduct]:
+    cart = await cart_repository.get_cart_by_user_id(db, user.id)
+    product_ids = {item.product_id for item in cart.items} if cart else set()
+
+    recommendations = _to_response(
+        await recommendation_repository.get_for_products(db, product_ids, limit)
+    )
+
+    logger.info(
+        "Cart recommendations | user_id=%s cart_products=%s results=%s",
+        user.id,
+        len(product_ids),
+        len(recommendations),
+    )
+    return recommendations
@@ -4,17 +4,51 @@ Restaurant Services - Async Business Logic
 Handles restaurant CRUD operations. Role enforcement is handled at controller level.
 """
 
-from typing import List, Optional
+from datetime import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from repositories.restaurant_repository import (
     create_restaurant,
     update_restaurant,
     get_restaurant_by_id,
-    get_all_restaurants,
+    get_restaurants_by_ids,
+    get_active_locations,
+)
+from repositories import restaurant_repository
+from schemas.restaurant_schema import (
+    RestaurantCreate,
+    RestaurantUpdate,
+    RestaurantResponse,
+    RestaurantPage,
+    RestaurantMenu,
+    MenuCategory,
+    NearbyRestaurant,
+    NearbyRestaurantPage,
+    OpeningInterval,
+    RestaurantHoursUpdate,
+    RestaurantHoursResponse,
+    DeliveryZone,
+    ZoneVertex,
+    DeliveryZonesUpdate,
+    DeliveryZonesResponse,
 )
-from schemas.restaurant_schema import RestaurantCreate, RestaurantUpdate
+from schemas.product_schema import ProductResponse
+from core.config import settings
+from db.database import AsyncSessionLocal
+from services import catalog_sync_services
 from models.restaurant_model import Restaurant
+from utils.catalog_cache import catalog_cache, menu_cache
+from utils.http_cache_utils import make_etag
+from utils.fieldset_utils import parse_fields, subset_model
+from utils.geo_index import geo_index
+from utils.opening_hours import opening_hours, minute_of_week
+from utils.delivery_zones import delivery_zones
+from utils.order_load import order_load
+from utils.delivery_estimator import DeliveryTariff, estimate
+from utils.pagination_utils import encode_cursor, decode_cursor
 from utils.logger_utils import get_logger
 from fastapi import HTTPException, status
 
@@ -36,6 +70,7 @@ async def create_restaurant_service(
     )
 
     created_restaurant = await create_restaurant(db, restaurant)
+    await catalog_sync_services.restaurant_written(db, created_restaurant)
 
     logger.info(
         "Restaurant created successfully",
@@ -72,6 +107,7 @@ async def update_restaurant_service(
         )
 
     updated = await update_restaurant(db, restaurant_id, restaurant)
+    await catalog_sync_services.restaurant_written(db, updated)
 
     logger.info(
         "Restaurant updated successfully",
@@ -81,21 +117,33 @@ async def update_restaurant_service(
     return updated
 
 
+async def _load_restaurant(
+    db: AsyncSession,
+    restaurant_id: int,
+) -> Optional[RestaurantResponse]:
+    restaurant = await get_restaurant_by_id(db, restaurant_id)
+    return RestaurantResponse.model_validate(restaurant) if restaurant else None
+
+
 async def get_restaurant_by_id_service(
     db: AsyncSession,
     restaurant_id: int,
-) -> Optional[Restaurant]:
+) -> RestaurantResponse:
     """
     Fetch a restaurant by ID.
     
     Authorization: Any authenticated user (enforced at controller level).
+    Served from the catalog snapshot; missing ids are cached as None.
     """
     logger.info(
         "Fetching restaurant",
         extra={"restaurant_id": restaurant_id},
     )
 
-    restaurant = await get_restaurant_by_id(db, restaurant_id)
+    restaurant = await catalog_cache.get_or_load(
+        ("restaurant", restaurant_id),
+        lambda: _load_restaurant(db, restaurant_id),
+    )
 
     if not restaurant:
         logger.warning(
@@ -112,12 +160,476 @@ async def get_restaurant_by_id_service(
 
 async def get_all_restaurants_service(
     db: AsyncSession,
-) -> List[Restaurant]:
+    *,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    sort: str = "rating",
+    is_active: bool = True,
+    city: Optional[str] = None,
+    min_rating: Optional[float] = None,
+    open_now: bool = False,
+    fields: Optional[str] = None,
+) -> Union[RestaurantPage, Dict[str, Any]]:
     """
-    Fetch all restaurants.
+    Fetch a page of restaurants.
     
+    Authorization: Any authenticated user (enforced at controller level).
+    Filtering, sorting and keyset pagination are done in SQL; pages are
+    served from the catalog snapshot. `open_now` drops restaurants that
+    are closed at this minute; at most OPEN_NOW_SCAN_LIMIT rows are scanned
+    per request, so when few are open the page can be short (even empty)
+    while `next_cursor` still points past the scanned rows. With `fields`,
+    only those columns are loaded and serialized, and the page is returned
+    as a plain dict.
+    """
+    logger.info(
+        "Fetching restaurants",
+        extra={"sort": sort, "limit": limit, "city": city, "min_rating": min_rating},
+    )
+
+    field_names = parse_fields(fields, RestaurantResponse)
+
+    after = None
+    if cursor:
+        try:
+            after = restaurant_repository.parse_page_key(decode_cursor(cursor, sort), sort)
+        except (ValueError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+
+    # Opening state changes by the minute, so it is part of the cache key
+    minute = minute_of_week() if open_now else None
+
+    async def load_page() -> Union[RestaurantPage, Dict[str, Any]]:
+        if minute is None:
+            restaurants = await restaurant_repository.get_page(
+                db,
+                limit=limit,
+                sort=sort,
+                after=after,
+                is_active=is_active,
+                city=city,
+                min_rating=min_rating,
+                columns=field_names,
+            )
+            next_key = None
+            if len(restaurants) > limit:
+                restaurants = restaurants[:limit]
+                next_key = restaurant_repository.page_key(restaurants[-1], sort)
+        else:
+            restaurants, next_key = await _scan_open_restaurants(
+                db,
+                minute,
+                limit=limit,
+                sort=sort,
+                after=after,
+                is_active=is_active,
+                city=city,
+                min_rating=min_rating,
+                columns=field_names,
+            )
+
+        next_cursor = encode_cursor(sort, next_key) if next_key is not None else None
+
+        if field_names:
+            item_model = subset_model(RestaurantResponse, field_names)
+            return {
+                "items": [item_model.model_validate(r) for r in restaurants],
+                "next_cursor": next_cursor,
+            }
+
+        return RestaurantPage(
+            items=[RestaurantResponse.model_validate(r) for r in restaurants],
+            next_cursor=next_cursor,
+        )
+
+    return await catalog_cache.get_or_load(
+        ("restaurants", sort, limit, cursor, is_active, city, min_rating, minute, field_names),
+        load_page,
+    )
+
+
+async def _scan_open_restaurants(
+    db: AsyncSession,
+    minute: int,
+    *,
+    limit: int,
+    sort: str,
+    after: Optional[List[Any]],
+    **filters: Any,
+) -> Tuple[List[Restaurant], Optional[List[Any]]]:
+    """
+    Collect up to `limit` restaurants open at `minute`, reading keyset
+    batches of OPEN_NOW_BATCH_SIZE rows and skipping closed ones with a bit
+    test. Stops after OPEN_NOW_SCAN_LIMIT rows; the returned key then
+    resumes after the last row scanned, not the last row returned.
+    """
+    batch_size = max(settings.OPEN_NOW_BATCH_SIZE, limit)
+    scan_limit = max(settings.OPEN_NOW_SCAN_LIMIT, batch_size)
+
+    restaurants: List[Restaurant] = []
+    scanned = 0
+    while True:
+        batch = await restaurant_repository.get_page(
+            db, limit=batch_size, sort=sort, after=after, **filters
+        )
+        # The extra look-ahead row is scanned by the next batch instead
+        has_more = len(batch) > batch_size
+        for restaurant in batch[:batch_size]:
+            scanned += 1
+            after = restaurant_repository.page_key(restaurant, sort)
+            if not opening_hours.is_open(restaurant.id, minute):
+                continue
+            if len(restaurants) == limit:
+                # A further open row exists: the page ends at the last one kept
+                return restaurants, restaurant_repository.page_key(restaurants[-1], sort)
+            restaurants.append(restaurant)
+
+        if not has_more:
+            return restaurants, None
+        if scanned >= scan_limit:
+            logger.info(
+                "Open restaurant scan limit reached | scanned=%s found=%s", scanned, len(restaurants)
+            )
+            return restaurants, after
+
+
+async def _load_menu(
+    db: AsyncSession,
+    restaurant_id: int,
+) -> Optional[Tuple[str, bytes]]:
+    found = await restaurant_repository.get_menu(db, restaurant_id)
+    # Inactive restaurants have no menu; cached as a miss until reactivated
+    if not found or not found[0].is_active:
+        return None
+
+    restaurant, items = found
+    categories: Dict[int, MenuCategory] = {}
+    for product, category in items:
+        section = categories.get(category.id)
+        if section is None:
+            section = categories[category.id] = MenuCategory(
+                id=category.id,
+                name=category.name,
+                products=[],
+            )
+        section.products.append(ProductResponse.model_validate(product))
+
+    menu = RestaurantMenu(
+        restaurant_id=restaurant.id,
+        restaurant_name=restaurant.name,
+        categories=list(categories.values()),
+    )
+    body = menu.model_dump_json().encode()
+    return make_etag("menu", body.decode()), body
+
+
+async def get_restaurant_menu_service(
+    db: AsyncSession,
+    restaurant_id: int,
+) -> Tuple[str, bytes]:
+    """
+    Fetch a restaurant's menu as (etag, serialized JSON body).
+
+    Authorization: Any authenticated user (enforced at controller level).
+    The serialized body is cached per restaurant and dropped when that
+    restaurant, its products or any category change. Inactive restaurants
+    are reported as not found.
+    """
+    logger.info(
+        "Fetching restaurant menu",
+        extra={"restaurant_id": restaurant_id},
+    )
+
+    menu = await menu_cache.get_or_load(
+        ("menu", restaurant_id),
+        lambda: _load_menu(db, restaurant_id),
+    )
+
+    if not menu:
+        logger.warning(
+            "Restaurant not found",
+            extra={"restaurant_id": restaurant_id},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Restaurant not found",
+        )
+
+    return menu
+
+
+async def load_geo_index(db: AsyncSession) -> None:
+    """Load active restaurant locations into the in-process geo index."""
+    geo_index.load(await get_active_locations(db))
+
+    logger.info(
+        "Restaurant geo index loaded | restaurants=%s",
+        len(geo_index),
+    )
+
+
+async def reload_geo_index_job() -> None:
+    """Entry point for the periodic task; owns its own session."""
+    async with AsyncSessionLocal() as db:
+        await load_geo_index(db)
+
+
+async def get_nearby_restaurants_service(
+    db: AsyncSession,
+    lat: float,
+    lng: float,
+    radius_km: float,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    open_now: bool = False,
+    serviceable_only: bool = False,
+    sort: str = "distance",
+) -> NearbyRestaurantPage:
+    """
+    Active restaurants within `radius_km`, nearest first, or with
+    `sort="fastest"` by estimated delivery time including the kitchen's
+    current prep delay, so swamped kitchens sink below idle ones nearby.
+
+    Authorization: Any authenticated user (enforced at controller level).
+    Candidates come from the in-process geo index and are priced and
+    ranked in memory (kitchen load is a counter lookup); only the page is
+    read from the DB. Items are only deliverable inside the restaurant's
+    delivery zones (if any). The cursor is the sort key of the last item.
+    """
+    logger.info(
+        "Fetching nearby restaurants",
+        extra={"lat": lat, "lng": lng, "radius_km": radius_km, "sort": sort},
+    )
+
+    matches = geo_index.nearby(lat, lng, radius_km)
+    if open_now:
+        minute = minute_of_week()
+        matches = [m for m in matches if opening_hours.is_open(m[0], minute)]
+    tariff = DeliveryTariff.from_settings()
+    in_zone = delivery_zones.serving((rid for rid, _ in matches), lat, lng)
+    if serviceable_only:
+        max_km = tariff.max_distance_km / tariff.road_factor
+        matches = [m for m in matches if m[1] <= max_km and m[0] in in_zone]
+
+    # Price every candidate in one pass; coordinates come from the geo index
+    points = np.array([geo_index.get(rid) for rid, _ in matches], dtype=np.float64).reshape(-1, 2)
+    estimates = estimate(points[:, 0], points[:, 1], lat, lng, tariff)
+    delays = [order_load.prep_delay_minutes(rid) for rid, _ in matches]
+    etas = [int(eta) + delay for eta, delay in zip(estimates.eta_minutes, delays)]
+
+    # (sort key, position in matches)
+    if sort == "fastest":
+        ranked = sorted(((etas[i], rid), i) for i, (rid, _) in enumerate(matches))
+        cursor_sort, key_type = "nearby_fastest", int
+    else:
+        ranked = [((distance, rid), i) for i, (rid, distance) in enumerate(matches)]
+        cursor_sort, key_type = "nearby", float
+
+    if cursor:
+        try:
+            last_key, last_id = decode_cursor(cursor, cursor_sort)
+            after = (key_type(last_key), int(last_id))
+        except (ValueError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+        ranked = [entry for entry in ranked if entry[0] > after]
+
+    page = ranked[:limit]
+    restaurants = {
+        r.id: r
+        for r in await get_restaurants_by_ids(db, {matches[i][0] for _, i in page})
+    }
+
+    items = []
+    for _, i in page:
+        rid, distance = matches[i]
+        if rid not in restaurants:
+            continue
+        items.append(
+            NearbyRestaurant(
+                **RestaurantResponse.model_validate(restaurants[rid]).model_dump(),
+                distance_km=round(distance, 3),
+                deliverable=bool(estimates.deliverable[i]) and rid in in_zone,
+                delivery_fee=float(estimates.fee[i]),
+                eta_minutes=etas[i],
+                active_orders=order_load.active(rid),
+                prep_delay_minutes=delays[i],
+            )
+        )
+
+    next_cursor = None
+    if len(ranked) > limit:
+        last_key, last_id = ranked[limit - 1][0]
+        next_cursor = encode_cursor(cursor_sort, [last_key, last_id])
+
+    return NearbyRestaurantPage(items=items, next_cursor=next_cursor)
+
+
+# --------------------------------------------------
+# OPENING HOURS
+# --------------------------------------------------
+
+def _to_minute(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def _to_time(minute: int) -> time:
+    return time(minute // 60, minute % 60)
+
+
+async def load_opening_hours(db: AsyncSession) -> None:
+    """Compile every restaurant schedule into the in-process hours index."""
+    opening_hours.load(await restaurant_repository.get_all_hours(db))
+
+    logger.info(
+        "Opening hours loaded | restaurants=%s",
+        len(opening_hours),
+    )
+
+
+async def reload_opening_hours_job() -> None:
+    """Entry point for the periodic task; owns its own session."""
+    async with AsyncSessionLocal() as db:
+        await load_opening_hours(db)
+
+
+def is_restaurant_open(restaurant_id: int) -> bool:
+    """O(1) check against the compiled weekly bitmap."""
+    return opening_hours.is_open(restaurant_id, minute_of_week())
+
+
+async def get_restaurant_hours_service(
+    db: AsyncSession,
+    restaurant_id: int,
+) -> RestaurantHoursResponse:
+    """
+    Fetch a restaurant's weekly schedule.
+
+    Authorization: Any authenticated user (enforced at controller level).
+    """
+    await get_restaurant_by_id_service(db, restaurant_id)
+    hours = await restaurant_repository.get_hours(db, restaurant_id)
+
+    return RestaurantHoursResponse(
+        restaurant_id=restaurant_id,
+        timezone=settings.RESTAURANT_TIMEZONE,
+        open_now=is_restaurant_open(restaurant_id),
+        intervals=[
+            OpeningInterval(
+                day_of_week=h.day_of_week,
+                opens=_to_time(h.open_minute),
+                closes=_to_time(h.close_minute),
+            )
+            for h in hours
+        ],
+    )
+
+
+async def set_restaurant_hours_service(
+    db: AsyncSession,
+    restaurant_id: int,
+    hours: RestaurantHoursUpdate,
+) -> RestaurantHoursResponse:
+    """
+    Replace a restaurant's weekly schedule.
+
+    Authorization: Caller must be admin (enforced at controller level).
+    """
+    await get_restaurant_by_id_service(db, restaurant_id)
+
+    intervals = [
+        (i.day_of_week, _to_minute(i.opens), _to_minute(i.closes))
+        for i in hours.intervals
+    ]
+    await restaurant_repository.replace_hours(db, restaurant_id, intervals)
+    await catalog_sync_services.restaurant_hours_written(db, restaurant_id, intervals)
+
+    logger.info(
+        "Restaurant hours updated",
+        extra={"restaurant_id": restaurant_id, "intervals": len(intervals)},
+    )
+
+    return await get_restaurant_hours_service(db, restaurant_id)
+
+
+# --------------------------------------------------
+# DELIVERY ZONES
+# --------------------------------------------------
+
+async def load_delivery_zones(db: AsyncSession) -> None:
+    """Load every delivery polygon into the in-process zone index."""
+    delivery_zones.load(await restaurant_repository.get_all_delivery_zones(db))
+
+    logger.info(
+        "Delivery zones loaded | restaurants=%s",
+        len(delivery_zones),
+    )
+
+
+async def reload_delivery_zones_job() -> None:
+    """Entry point for the periodic task; owns its own session."""
+    async with AsyncSessionLocal() as db:
+        await load_delivery_zones(db)
+
+
+def is_serviceable(restaurant_id: int, lat: float, lng: float) -> bool:
+    """Point-in-polygon check against the restaurant's zones; no zones means yes."""
+    return delivery_zones.serves(restaurant_id, lat, lng)
+
+
+def is_zone_restricted(restaurant_id: int) -> bool:
+    """True if the restaurant only delivers inside its zones."""
+    return delivery_zones.is_restricted(restaurant_id)
+
+
+async def get_delivery_zones_service(
+    db: AsyncSession,
+    restaurant_id: int,
+) -> DeliveryZonesResponse:
+    """
+    Fetch a restaurant's delivery zones.
+
     Authorization: Any authenticated user (enforced at controller level).
     """
-    logger.info("Fetching all restaurants")
+    await get_restaurant_by_id_service(db, restaurant_id)
+    zones = await restaurant_repository.get_delivery_zones(db, restaurant_id)
+
+    return DeliveryZonesResponse(
+        restaurant_id=restaurant_id,
+        zones=[
+            DeliveryZone(vertices=[ZoneVertex(latitude=lat, longitude=lng) for lat, lng in z.polygon])
+            for z in zones
+        ],
+    )
+
+
+async def set_delivery_zones_service(
+    db: AsyncSession,
+    restaurant_id: int,
+    zones: DeliveryZonesUpdate,
+) -> DeliveryZonesResponse:
+    """
+    Replace a restaurant's delivery zones.
+
+    Authorization: Caller must be admin (enforced at controller level).
+    """
+    await get_restaurant_by_id_service(db, restaurant_id)
+
+    polygons = [
+        [[v.latitude, v.longitude] for v in zone.vertices]
+        for zone in zones.zones
+    ]
+    await restaurant_repository.replace_delivery_zones(db, restaurant_id, polygons)
+    await catalog_sync_services.delivery_zones_written(db, restaurant_id, polygons)
+
+    logger.info(
+        "Restaurant delivery zones updated",
+        extra={"restaurant_id": restaurant_id, "zones": len(polygons)},
+    )
 
-    return await get_all_restaurants(db)
+    return await get_delivery_zones_service(db, restaurant_id)
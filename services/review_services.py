@@ -0,0 +1,173 @@
+"""
+Review Services - Business Logic
+
+Customers rate a paid order's restaurant and its products. Each write
+moves the target's running aggregates (count, sum, Bayesian average) in
+the same transaction, so rating reads and sorts never aggregate reviews.
+"""
+
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+
+from models.product_model import Product
+from models.restaurant_model import Restaurant
+from models.review_model import Review
+from models.user_model import User
+from repositories import order_repository, review_repository
+from schemas.review_schema import ReviewCreate, ReviewUpdate, ReviewResponse, ReviewPage
+from services import catalog_sync_services
+from utils.pagination_utils import encode_cursor, decode_cursor
+from utils.logger_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _target(review: Review):
+    """Model and id whose aggregates a review feeds."""
+    if review.product_id is not None:
+        return Product, review.product_id
+    return Restaurant, review.restaurant_id
+
+
+async def _get_own_review(db: AsyncSession, user: User, review_id: int, allow_admin: bool = False) -> Review:
+    # Locked until the caller commits: the rating delta is taken from this row
+    review = await review_repository.get_review_for_update(db, review_id)
+    if not review:
+        logger.warning("Review not found | review_id=%s", review_id)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
+
+    if review.user_id != user.id and not (allow_admin and user.role == "admin"):
+        logger.warning("Unauthorized review access | review_id=%s user_id=%s", review_id, user.id)
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to modify this review")
+    return review
+
+
+async def create_review_service(db: AsyncSession, user: User, data: ReviewCreate) -> ReviewResponse:
+    logger.info("Creating review | user_id=%s order_id=%s product_id=%s", user.id, data.order_id, data.product_id)
+
+    order = await order_repository.get_order_by_id(db, data.order_id)
+    if not order:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
+
+    if order.user_id != user.id:
+        logger.warning("Unauthorized review attempt | order_id=%s user_id=%s", order.id, user.id)
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to review this order")
+
+    if order.payment_status != "paid" or order.status == "cancelled":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only paid orders can be reviewed",
+        )
+
+    if data.product_id is not None and data.product_id not in {item.product_id for item in order.items}:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Product is not part of this order",
+        )
+
+    try:
+        review = await review_repository.create_review(
+            db,
+            user_id=user.id,
+            order_id=order.id,
+            restaurant_id=order.restaurant_id,
+            product_id=data.product_id,
+            rating=data.rating,
+            comment=data.comment,
+        )
+    except IntegrityError:
+        await db.rollback()
+        logger.warning("Duplicate review | order_id=%s product_id=%s", data.order_id, data.product_id)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="This order has already been reviewed",
+        )
+
+    model, target_id = _target(review)
+    await review_repository.apply_rating_delta(db, model, target_id, 1, review.rating)
+    await db.commit()
+    await db.refresh(review)
+    await catalog_sync_services.ratings_written(db, review.restaurant_id)
+
+    logger.info("Review created | review_id=%s rating=%s", review.id, review.rating)
+    return ReviewResponse.model_validate(review)
+
+
+async def update_review_service(
+    db: AsyncSession, user: User, review_id: int, data: ReviewUpdate
+) -> ReviewResponse:
+    logger.info("Updating review | review_id=%s user_id=%s", review_id, user.id)
+    review = await _get_own_review(db, user, review_id)
+
+    changes = data.model_dump(exclude_unset=True)
+    new_rating = changes.get("rating")
+    if new_rating is not None and new_rating != review.rating:
+        model, target_id = _target(review)
+        await review_repository.apply_rating_delta(db, model, target_id, 0, new_rating - review.rating)
+        review.rating = new_rating
+    if "comment" in changes:
+        review.comment = changes["comment"]
+
+    await db.commit()
+    await db.refresh(review)
+    if new_rating is not None:
+        await catalog_sync_services.ratings_written(db, review.restaurant_id)
+
+    return ReviewResponse.model_validate(review)
+
+
+async def delete_review_service(db: AsyncSession, user: User, review_id: int) -> None:
+    logger.info("Deleting review | review_id=%s user_id=%s", review_id, user.id)
+    review = await _get_own_review(db, user, review_id, allow_admin=True)
+
+    model, target_id = _target(review)
+    await review_repository.apply_rating_delta(db, model, target_id, -1, -review.rating)
+    await review_repository.delete_review(db, review.id)
+    await db.commit()
+    await catalog_sync_services.ratings_written(db, review.restaurant_id)
+
+
+async def get_reviews_service(
+    db: AsyncSession,
+    *,
+    restaurant_id: Optional[int] = None,
+    product_id: Optional[int] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> ReviewPage:
+    if (restaurant_id is None) == (product_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pass exactly one of restaurant_id or product_id",
+        )
+
+    before_id = None
+    if cursor:
+        try:
+            before_id = int(decode_cursor(cursor, "reviews")[0])
+        except (ValueError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+
+    reviews = await review_repository.get_page(
+        db,
+        limit=limit,
+        restaurant_id=restaurant_id,
+        product_id=product_id,
+        before_id=before_id,
+    )
+
+    next_cursor = None
+    if len(reviews) > limit:
+        reviews = reviews[:limit]
+        next_cursor = encode_cursor("reviews", [reviews[-1].id])
+
+    return ReviewPage(
+        items=[ReviewResponse.model_validate(r) for r in reviews],
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,179 @@
+"""
+Sales Services - Business Logic
+
+Restaurant sales by day and by product, served from pre-aggregated daily
+rollups. Payment confirmation adds an order's totals and an admin cancelling
+a paid order subtracts them, in the same transaction as the status change. The
+backfill rebuilds a trailing range of days from order history.
+
+Days are calendar days in RESTAURANT_TIMEZONE of when the order was placed.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models.order_model import Order
+from repositories import sales_repository
+from schemas.sales_schema import DailySales, ProductSales, SalesDashboard, SalesBackfillResult
+from services.restaurant_services import get_restaurant_by_id_service
+from utils.logger_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def sales_day(at: datetime) -> date:
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)  # SQLite drops the offset
+    return at.astimezone(ZoneInfo(settings.RESTAURANT_TIMEZONE)).date()
+
+
+async def record_order_sales(db: AsyncSession, order: Order, sign: int = 1) -> None:
+    """
+    Add (sign=1) or remove (sign=-1) a paid order's totals. Needs
+    `order.items` loaded; the caller commits.
+    """
+    day = sales_day(order.created_at)
+
+    units: Dict[int, List[float]] = {}
+    for item in order.items:
+        totals = units.setdefault(item.product_id, [0, 0.0])
+        totals[0] += item.quantity
+        totals[1] += item.quantity * float(item.price_at_time)
+
+    await sales_repository.add_restaurant_sales(db, [{
+        "restaurant_id": order.restaurant_id,
+        "day": day,
+        "orders": sign,
+        "revenue": sign * float(order.total_amount),
+        "delivery_fees": sign * float(order.delivery_fee or 0),
+    }])
+    await sales_repository.add_product_sales(db, [
+        {
+            "product_id": product_id,
+            "day": day,
+            "restaurant_id": order.restaurant_id,
+            "units": sign * quantity,
+            "revenue": sign * revenue,
+        }
+        for product_id, (quantity, revenue) in units.items()
+    ])
+
+
+async def backfill_sales_service(db: AsyncSession, days: int) -> SalesBackfillResult:
+    """
+    Rebuild the rollups of the last `days` days (today included) from
+    orders. History is streamed and aggregated in memory, one row per
+    restaurant/product and day; the range is replaced in one transaction.
+    The rollup tables are locked before reading, so a payment cannot add
+    to a day between the read and the replace; payments wait for the
+    backfill to commit.
+
+    Authorization: Caller must be admin (enforced at controller level).
+    """
+    tz = ZoneInfo(settings.RESTAURANT_TIMEZONE)
+    since_day = sales_day(datetime.now(timezone.utc)) - timedelta(days=days - 1)
+    since = datetime.combine(since_day, time.min, tzinfo=tz).astimezone(timezone.utc)
+
+    await sales_repository.lock_sales_tables(db)
+
+    restaurant_totals: Dict[Tuple[int, date], List[float]] = {}
+    orders = 0
+    async for _, restaurant_id, created_at, total_amount, delivery_fee in (
+        sales_repository.stream_paid_orders(db, since)
+    ):
+        totals = restaurant_totals.setdefault((restaurant_id, sales_day(created_at)), [0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += float(total_amount)
+        totals[2] += float(delivery_fee or 0)
+        orders += 1
+
+    product_totals: Dict[Tuple[int, date], List[float]] = {}
+    async for restaurant_id, created_at, product_id, quantity, price in (
+        sales_repository.stream_paid_order_items(db, since)
+    ):
+        totals = product_totals.setdefault((product_id, sales_day(created_at)), [restaurant_id, 0, 0.0])
+        totals[1] += quantity
+        totals[2] += quantity * float(price)
+
+    await sales_repository.delete_sales_since(db, since_day)
+    await sales_repository.add_restaurant_sales(db, [
+        {"restaurant_id": rid, "day": day, "orders": n, "revenue": revenue, "delivery_fees": fees}
+        for (rid, day), (n, revenue, fees) in restaurant_totals.items()
+    ])
+    await sales_repository.add_product_sales(db, [
+        {"product_id": pid, "day": day, "restaurant_id": rid, "units": n, "revenue": revenue}
+        for (pid, day), (rid, n, revenue) in product_totals.items()
+    ])
+    await db.commit()
+
+    logger.info(
+        "Sales rollups backfilled | since=%s orders=%s restaurant_days=%s product_days=%s",
+        since_day,
+        orders,
+        len(restaurant_totals),
+        len(product_totals),
+    )
+
+    return SalesBackfillResult(
+        since=since_day,
+        orders=orders,
+        restaurant_days=len(restaurant_totals),
+        product_days=len(product_totals),
+    )
+
+
+async def get_sales_dashboard_service(
+    db: AsyncSession,
+    restaurant_id: int,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    top_products: int = 10,
+) -> SalesDashboard:
+    """
+    Daily totals and best-selling products of a restaurant over [start, end]
+    (default: the last 30 days). Reads only the rollup tables.
+
+    Authorization: Caller must be admin (enforced at controller level).
+    """
+    await get_restaurant_by_id_service(db, restaurant_id)
+
+    end = end or sales_day(datetime.now(timezone.utc))
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end",
+        )
+    if (end - start).days >= settings.SALES_DASHBOARD_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range is limited to {settings.SALES_DASHBOARD_MAX_DAYS} days",
+        )
+
+    days = [
+        DailySales.model_validate(row)
+        for row in await sales_repository.get_daily_sales(db, restaurant_id, start, end)
+    ]
+    products = [
+        ProductSales(product_id=pid, name=name, units=units, revenue=round(revenue, 2))
+        for pid, name, units, revenue in await sales_repository.get_product_sales(
+            db, restaurant_id, start, end, top_products
+        )
+    ]
+
+    return SalesDashboard(
+        restaurant_id=restaurant_id,
+        timezone=settings.RESTAURANT_TIMEZONE,
+        start=start,
+        end=end,
+        orders=sum(d.orders for d in days),
+        revenue=round(sum(d.revenue for d in days), 2),
+        days=days,
+        top_products=products,
+    )
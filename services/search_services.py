@@ -0,0 +1,54 @@
+"""
+Search Services - Business Logic
+
+Builds the in-memory typeahead index and serves suggestions from it.
+"""
+
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories import search_repository
+from schemas.search_schema import SuggestionResponse
+from utils.typeahead_index import (
+    typeahead_index,
+    Suggestion,
+    PRODUCT,
+    RESTAURANT,
+    CATEGORY,
+)
+from utils.logger_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+async def rebuild_typeahead_index(db: AsyncSession) -> None:
+    """Reload every suggestable name and its popularity weight from the DB."""
+    logger.info("Building typeahead index")
+
+    entries = []
+    sources = (
+        (PRODUCT, search_repository.get_product_name_weights),
+        (RESTAURANT, search_repository.get_restaurant_name_weights),
+        (CATEGORY, search_repository.get_category_name_weights),
+    )
+    for kind, load in sources:
+        rows = await load(db)
+        entries.extend(Suggestion(kind, row_id, name, weight) for row_id, name, weight in rows)
+
+    typeahead_index.build(entries)
+
+    logger.info("Typeahead index built | entries=%s", len(typeahead_index))
+
+
+def suggest_service(
+    prefix: str,
+    limit: int = 10,
+    types: Optional[List[str]] = None,
+) -> List[SuggestionResponse]:
+    # Pure memory lookup: no DB session, no await
+    suggestions = typeahead_index.suggest(prefix, limit=limit, kinds=types)
+    return [
+        SuggestionResponse(type=s.kind, id=s.id, name=s.name, score=s.weight)
+        for s in suggestions
+    ]
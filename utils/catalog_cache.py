@@ -0,0 +1,103 @@
+"""
+Catalog Snapshot Cache
+
+In-process, versioned cache for catalog reads (products, categories,
+restaurants). Every catalog write bumps `version` and drops all entries,
+so readers never see data older than the last local write. Entries also
+expire after CATALOG_CACHE_TTL_SECONDS, which bounds staleness for writes
+made by other worker processes; requests that read the persisted catalog
+version (conditional GETs) drop the cache as soon as it has moved.
+
+Missing ids are cached too (negative caching), so repeated lookups of a
+nonexistent product do not reach the DB either.
+
+`menu_cache` is a second instance holding pre-serialized restaurant menus.
+It is invalidated per restaurant via `discard`, so a write to one
+restaurant's products does not evict every other menu.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+from core.config import settings
+
+
+_MISS = object()
+
+
+class CatalogCache:
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.version = 0
+        self.source_version: Optional[int] = None
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Cached value for `key` (may be None for a known-missing id), or _MISS."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISS
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return _MISS
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for `key`, calling `loader` on a miss.
+        A loader result of None is cached as well (negative entry).
+        """
+        value = self.get(key)
+        if value is not _MISS:
+            return value
+
+        version = self.version
+        value = await loader()
+        # A write that landed while we were loading makes this result stale
+        if version == self.version:
+            self.set(key, value)
+        return value
+
+    def discard(self, key: Hashable) -> None:
+        """Drop a single entry; in-flight loads are not stored afterwards."""
+        self.version += 1
+        self._entries.pop(key, None)
+
+    def observe(self, source_version: int) -> None:
+        """Drop every entry if the persisted catalog version moved since last seen."""
+        if source_version != self.source_version:
+            self.invalidate()
+            self.source_version = source_version
+
+    def invalidate(self) -> int:
+        """Bump the catalog version and drop every cached entry."""
+        self.version += 1
+        self._entries.clear()
+        return self.version
+
+
+# Singleton instance
+catalog_cache = CatalogCache(
+    ttl_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+    max_entries=settings.CATALOG_CACHE_MAX_ENTRIES,
+)
+
+menu_cache = CatalogCache(
+    ttl_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+    max_entries=settings.MENU_CACHE_MAX_ENTRIES,
+)
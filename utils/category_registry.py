@@ -0,0 +1,48 @@
+"""
+Category Name Registry
+
+Process-level name -> id map for categories, so product writes can resolve
+`category_name` without a query. Loaded at startup and kept current by
+the category write services (through catalog_sync_services); reloaded
+every CATEGORY_REGISTRY_RELOAD_SECONDS so renames made by other worker
+processes do not keep resolving to a stale name.
+
+Names are matched exactly, like the `Category.name == name` lookup it replaces.
+Inactive categories stay registered: product creation never required an
+active category.
+"""
+
+from typing import Dict, Iterable, Optional
+
+from models.category_model import Category
+
+
+class CategoryRegistry:
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def load(self, categories: Iterable[Category]) -> None:
+        """Replace the whole registry."""
+        self._ids = {c.name: c.id for c in categories}
+        self._names = {category_id: name for name, category_id in self._ids.items()}
+        self.loaded = True
+
+    def put(self, category_id: int, name: str) -> None:
+        """Register a category, dropping its previous name after a rename."""
+        old_name = self._names.get(category_id)
+        if old_name is not None and old_name != name:
+            self._ids.pop(old_name, None)
+        self._ids[name] = category_id
+        self._names[category_id] = name
+
+    def get_id(self, name: str) -> Optional[int]:
+        return self._ids.get(name)
+
+
+# Singleton instance
+category_registry = CategoryRegistry()
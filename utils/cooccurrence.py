@@ -0,0 +1,81 @@
+"""
+Product Co-occurrence ("frequently bought together")
+
+Pure NumPy/SciPy computation behind the recommendations job, kept free of
+I/O so it can run in a worker thread.
+
+With B the binary order x product matrix (B[o, p] = 1 if order o contains
+product p), C = Bᵀ·B counts, for every product pair, the orders containing
+both; its diagonal holds each product's own order count. Pairs are scored
+by cosine similarity, C[i, j] / sqrt(C[i, i] * C[j, j]), so best sellers
+do not become everyone's neighbour.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+from scipy import sparse
+
+
+class Neighbours(NamedTuple):
+    """Parallel arrays, one entry per (product, neighbour) pair, ranked within each product."""
+    product_ids: np.ndarray
+    ranks: np.ndarray
+    neighbour_ids: np.ndarray
+    scores: np.ndarray
+    co_orders: np.ndarray
+
+
+def top_k_neighbours(
+    order_ids: np.ndarray,
+    product_ids: np.ndarray,
+    k: int,
+    min_co_orders: int = 1,
+) -> Neighbours:
+    """
+    Top-k co-ordered products per product from (order_id, product_id) pairs.
+
+    Pairs may repeat (several lines of one product in one order); they
+    count once. Ties are broken by co-order count, then by product id.
+    """
+    empty = np.empty(0, dtype=np.int64)
+    if len(order_ids) == 0:
+        return Neighbours(empty, empty, empty, np.empty(0), empty)
+
+    # Dense indexes for the sparse matrix; `products[i]` is the id of column i
+    orders, order_index = np.unique(order_ids, return_inverse=True)
+    products, product_index = np.unique(product_ids, return_inverse=True)
+
+    basket = sparse.csr_matrix(
+        (np.ones(len(order_index), dtype=np.int32), (order_index, product_index)),
+        shape=(len(orders), len(products)),
+    )
+    basket.sum_duplicates()
+    basket.data[:] = 1
+
+    co = (basket.T @ basket).tocoo()
+    order_counts = co.diagonal()
+
+    keep = (co.row != co.col) & (co.data >= min_co_orders)
+    rows, cols, counts = co.row[keep], co.col[keep], co.data[keep]
+    if len(rows) == 0:
+        return Neighbours(empty, empty, empty, np.empty(0), empty)
+
+    scores = counts / np.sqrt(order_counts[rows].astype(np.float64) * order_counts[cols])
+
+    # Sort by product, then best neighbour first; the last key is the primary one
+    order = np.lexsort((products[cols], -counts, -scores, rows))
+    rows, cols, counts, scores = rows[order], cols[order], counts[order], scores[order]
+
+    # Rank within each product = position minus the product's first position
+    starts = np.searchsorted(rows, rows, side="left")
+    ranks = np.arange(len(rows)) - starts
+    top = ranks < k
+
+    return Neighbours(
+        product_ids=products[rows[top]].astype(np.int64),
+        ranks=ranks[top].astype(np.int64),
+        neighbour_ids=products[cols[top]].astype(np.int64),
+        scores=scores[top],
+        co_orders=counts[top].astype(np.int64),
+    )
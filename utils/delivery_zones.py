@@ -0,0 +1,142 @@
+"""
+In-Process Delivery Zone Index
+
+Restaurants may restrict delivery to one or more polygons. Each polygon is
+registered in every grid cell its bounding box overlaps, so a lookup is a
+cell fetch, a bounding-box check and a ray-casting point-in-polygon test
+on the few candidates, with no DB or Uber round trip.
+
+Polygons are lists of (latitude, longitude) vertices, treated as planar:
+fine at city scale, not across the antimeridian. A zone's bounding box may
+span at most MAX_ZONE_SPAN_DEGREES per axis, which bounds the cells it
+occupies. Restaurants without zones are unrestricted.
+
+Loaded at startup and kept current by the zone write service (through
+catalog_sync_services); reloaded every DELIVERY_ZONES_RELOAD_SECONDS so
+zone changes made in other worker processes reach this one.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from utils.geo_index import CELL_DEGREES
+
+
+Point = Tuple[float, float]
+
+# ~111 km: 20 x 20 cells per zone at most
+MAX_ZONE_SPAN_DEGREES = 1.0
+
+
+@dataclass(frozen=True)
+class Zone:
+    restaurant_id: int
+    vertices: Tuple[Point, ...]
+    min_lat: float
+    min_lng: float
+    max_lat: float
+    max_lng: float
+
+    @classmethod
+    def build(cls, restaurant_id: int, vertices: Sequence[Sequence[float]]) -> "Zone":
+        points = tuple((float(lat), float(lng)) for lat, lng in vertices)
+        lats = [p[0] for p in points]
+        lngs = [p[1] for p in points]
+        return cls(restaurant_id, points, min(lats), min(lngs), max(lats), max(lngs))
+
+    def contains(self, lat: float, lng: float) -> bool:
+        if not (self.min_lat <= lat <= self.max_lat and self.min_lng <= lng <= self.max_lng):
+            return False
+        # Ray casting along the latitude axis
+        inside = False
+        vertices = self.vertices
+        j = len(vertices) - 1
+        for i in range(len(vertices)):
+            lat_i, lng_i = vertices[i]
+            lat_j, lng_j = vertices[j]
+            if (lng_i > lng) != (lng_j > lng):
+                crossing = lat_i + (lng - lng_i) * (lat_j - lat_i) / (lng_j - lng_i)
+                if lat < crossing:
+                    inside = not inside
+            j = i
+        return inside
+
+
+def _cell(lat: float, lng: float) -> Tuple[int, int]:
+    return math.floor(lat / CELL_DEGREES), math.floor(lng / CELL_DEGREES)
+
+
+def _cells_of(zone: Zone) -> Iterable[Tuple[int, int]]:
+    row_min, col_min = _cell(zone.min_lat, zone.min_lng)
+    row_max, col_max = _cell(zone.max_lat, zone.max_lng)
+    for row in range(row_min, row_max + 1):
+        for col in range(col_min, col_max + 1):
+            yield row, col
+
+
+class DeliveryZoneIndex:
+    def __init__(self):
+        self._zones: Dict[int, List[Zone]] = {}
+        self._cells: Dict[Tuple[int, int], Set[Zone]] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+    def load(self, rows: Iterable[Tuple[int, Sequence[Sequence[float]]]]) -> None:
+        """Replace the whole index from (restaurant_id, polygon) rows."""
+        self._zones = {}
+        self._cells = {}
+        for restaurant_id, polygon in rows:
+            self._add(Zone.build(restaurant_id, polygon))
+        self.loaded = True
+
+    def put(self, restaurant_id: int, polygons: Iterable[Sequence[Sequence[float]]]) -> None:
+        """Replace one restaurant's zones; no polygons means unrestricted."""
+        for zone in self._zones.pop(restaurant_id, ()):
+            for cell in _cells_of(zone):
+                members = self._cells[cell]
+                members.discard(zone)
+                if not members:
+                    del self._cells[cell]
+        for polygon in polygons:
+            self._add(Zone.build(restaurant_id, polygon))
+
+    def _add(self, zone: Zone) -> None:
+        self._zones.setdefault(zone.restaurant_id, []).append(zone)
+        for cell in _cells_of(zone):
+            self._cells.setdefault(cell, set()).add(zone)
+
+    def is_restricted(self, restaurant_id: int) -> bool:
+        return restaurant_id in self._zones
+
+    def serves(self, restaurant_id: int, lat: float, lng: float) -> bool:
+        """True if the restaurant has no zones or one of them contains the point."""
+        zones = self._zones.get(restaurant_id)
+        if zones is None:
+            return True
+        return any(zone.contains(lat, lng) for zone in zones)
+
+    def serving(self, restaurant_ids: Iterable[int], lat: float, lng: float) -> Set[int]:
+        """
+        The restaurants among `restaurant_ids` that deliver to the point:
+        one cell lookup for the whole batch instead of a zone scan each.
+        """
+        covering = self.restaurants_covering(lat, lng)
+        return {
+            rid for rid in restaurant_ids
+            if rid in covering or rid not in self._zones
+        }
+
+    def restaurants_covering(self, lat: float, lng: float) -> Set[int]:
+        """Restaurants with a zone containing the point (unrestricted ones excluded)."""
+        return {
+            zone.restaurant_id
+            for zone in self._cells.get(_cell(lat, lng), ())
+            if zone.contains(lat, lng)
+        }
+
+
+# Singleton instance
+delivery_zones = DeliveryZoneIndex()
@@ -0,0 +1,67 @@
+"""
+Sparse Fieldset Helpers
+
+Support for the `fields=` query parameter on list endpoints, e.g.
+`GET /products?fields=name,price,image_url`.
+
+Requested names are validated against the response schema; the same
+names then narrow the SELECT column list (repositories) and the
+serialized payload (a subset model per schema + field list). `id` is
+always included so clients can still address the rows.
+"""
+
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Type
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, create_model
+
+
+def parse_fields(
+    fields: Optional[str],
+    schema: Type[BaseModel],
+) -> Optional[Tuple[str, ...]]:
+    """
+    Validate a comma-separated `fields` value against `schema`.
+
+    Returns the field names in schema order, or None when no fieldset
+    was requested. Raises 400 on unknown or empty field lists.
+    """
+    if fields is None:
+        return None
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(schema.model_fields)
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Invalid fields: {', '.join(sorted(unknown)) or '(empty)'}. "
+                f"Allowed: {', '.join(schema.model_fields)}"
+            ),
+        )
+
+    requested.add("id")
+    return tuple(name for name in schema.model_fields if name in requested)
+
+
+@lru_cache(maxsize=256)
+def subset_model(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """A model with only `fields` of `schema`, same types and defaults."""
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields},
+    )
+
+
+def sparse_response(content: Any) -> JSONResponse:
+    """
+    Serialize a sparse payload directly.
+
+    The route's `response_model` describes the full schema, so partial
+    objects must bypass its validation.
+    """
+    return JSONResponse(content=jsonable_encoder(content))
@@ -0,0 +1,110 @@
+"""
+In-Process Geo Grid Index
+
+Active restaurants with coordinates, bucketed into a fixed grid of
+CELL_DEGREES x CELL_DEGREES cells. A radius query visits only the cells
+overlapping the radius' bounding box, then refines the candidates with
+the haversine distance; it never touches the DB.
+
+Built at startup and kept current by the restaurant write services
+(through catalog_sync_services); rebuilt every GEO_INDEX_RELOAD_SECONDS so
+restaurants created, moved or deactivated in other worker processes show
+up here too.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.195
+
+# ~5.5 km of latitude per cell: a typical delivery radius spans a few cells
+CELL_DEGREES = 0.05
+
+_LNG_CELLS = round(360 / CELL_DEGREES)
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _cell(lat: float, lng: float) -> Tuple[int, int]:
+    return math.floor(lat / CELL_DEGREES), math.floor(lng / CELL_DEGREES) % _LNG_CELLS
+
+
+class GeoIndex:
+    def __init__(self):
+        self._points: Dict[int, Tuple[float, float]] = {}
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def load(self, points: Iterable[Tuple[int, float, float]]) -> None:
+        """Replace the whole index with (id, latitude, longitude) points."""
+        self._points = {}
+        self._cells = {}
+        for point_id, lat, lng in points:
+            self._add(point_id, lat, lng)
+        self.loaded = True
+
+    def put(self, point_id: int, lat: Optional[float], lng: Optional[float]) -> None:
+        """Insert or move a point; missing coordinates remove it."""
+        self.remove(point_id)
+        if lat is not None and lng is not None:
+            self._add(point_id, lat, lng)
+
+    def remove(self, point_id: int) -> None:
+        point = self._points.pop(point_id, None)
+        if point is None:
+            return
+        cell = _cell(*point)
+        members = self._cells[cell]
+        members.discard(point_id)
+        if not members:
+            del self._cells[cell]
+
+    def get(self, point_id: int) -> Optional[Tuple[float, float]]:
+        return self._points.get(point_id)
+
+    def _add(self, point_id: int, lat: float, lng: float) -> None:
+        self._points[point_id] = (lat, lng)
+        self._cells.setdefault(_cell(lat, lng), set()).add(point_id)
+
+    def nearby(self, lat: float, lng: float, radius_km: float) -> List[Tuple[int, float]]:
+        """(id, distance in km) within `radius_km`, nearest first, ties by id."""
+        dlat = radius_km / KM_PER_DEGREE_LAT
+        row_min = math.floor((lat - dlat) / CELL_DEGREES)
+        row_max = math.floor((lat + dlat) / CELL_DEGREES)
+
+        # Longitude degrees shrink towards the poles; near them, scan whole rows
+        cos_lat = math.cos(math.radians(min(abs(lat) + dlat, 90.0)))
+        if cos_lat * 180 * KM_PER_DEGREE_LAT <= radius_km:
+            columns = range(_LNG_CELLS)
+        else:
+            dlng = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+            col_min = math.floor((lng - dlng) / CELL_DEGREES)
+            col_max = math.floor((lng + dlng) / CELL_DEGREES)
+            columns = range(col_min, min(col_max, col_min + _LNG_CELLS - 1) + 1)
+
+        matches: List[Tuple[int, float]] = []
+        for row in range(row_min, row_max + 1):
+            for column in columns:
+                for point_id in self._cells.get((row, column % _LNG_CELLS), ()):
+                    distance = haversine_km(lat, lng, *self._points[point_id])
+                    if distance <= radius_km:
+                        matches.append((point_id, distance))
+
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+
+# Singleton instance
+geo_index = GeoIndex()
@@ -0,0 +1,108 @@
+"""
+HTTP Conditional GET Helpers
+
+Builds ETag / Last-Modified validators and answers 304 Not Modified
+when the client's copy is still fresh, before any response body is
+serialized.
+
+Two kinds of validators are used:
+- Row validators, from `TimestampMixin.updated_at` of the rows a response
+  is built from (product, order, cart).
+- Catalog validators, from the persisted catalog version (the latest
+  catalog change id), so every worker issues the same tag for the same
+  data and a tag only changes when the catalog does.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(
+        "|".join(str(p) for p in parts).encode(), digest_size=8
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def catalog_etag(request: Request, version: int, *extra: Any) -> str:
+    """`extra` covers inputs besides the catalog, e.g. the minute for `open_now`."""
+    return make_etag(
+        "catalog",
+        version,
+        request.url.path,
+        request.url.query,
+        *extra,
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; they are stored as UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _is_fresh(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+        tags = [_opaque(t) for t in if_none_match.split(",")]
+        return "*" in tags or _opaque(etag) in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+    return False
+
+
+def _validator_headers(
+    etag: str,
+    last_modified: Optional[datetime],
+    private: bool,
+) -> Dict[str, str]:
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache" if private else "no-cache",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified_response(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    private: bool = False,
+) -> Optional[Response]:
+    """A bodyless 304 response if the client copy is fresh, else None."""
+    if not _is_fresh(request, etag, last_modified):
+        return None
+    return Response(
+        status_code=304,
+        headers=_validator_headers(etag, last_modified, private),
+    )
+
+
+def set_validators(
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    private: bool = False,
+) -> None:
+    response.headers.update(_validator_headers(etag, last_modified, private))
@@ -0,0 +1,105 @@
+"""
+Product Image Worker Pool
+
+Resizing images is CPU-bound, so it runs in a process pool instead of the
+event loop. A worker downloads the original from object storage, renders
+a JPEG thumbnail and WebP variants, uploads them next to the original and
+returns their keys.
+
+`render_variants` runs in the child process: it must stay a top-level,
+picklable function and only depend on its arguments.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, Optional
+
+from core.config import settings
+from utils.storage_utils import make_s3_client, storage_config
+
+
+THUMBNAIL_SIZE = (320, 320)
+WEBP_WIDTHS = (320, 640, 1280)
+WEBP_QUALITY = 80
+
+
+def _upload(client, bucket: str, key: str, image, fmt: str, content_type: str, **save_args) -> str:
+    buffer = BytesIO()
+    image.save(buffer, format=fmt, **save_args)
+    client.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=buffer.getvalue(),
+        ContentType=content_type,
+        CacheControl="public, max-age=31536000, immutable",
+    )
+    return key
+
+
+def render_variants(config: Dict[str, Any], key: str) -> Dict[str, str]:
+    """Render and upload variants of the image at `key`. Returns variant name -> key."""
+    # Imported here so only worker processes pay for Pillow
+    from PIL import Image, ImageOps
+
+    client = make_s3_client(config)
+    bucket = config["bucket"]
+    original = client.get_object(Bucket=bucket, Key=key)["Body"].read()
+
+    image = Image.open(BytesIO(original))
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+    prefix = key.rsplit("/", 1)[0]
+    variants: Dict[str, str] = {}
+
+    thumbnail = image.convert("RGB")
+    thumbnail.thumbnail(THUMBNAIL_SIZE)
+    variants["thumbnail"] = _upload(
+        client, bucket, f"{prefix}/thumb.jpg", thumbnail, "JPEG", "image/jpeg", quality=85, optimize=True
+    )
+
+    for width in WEBP_WIDTHS:
+        # Never upscale; widths past the original collapse to one variant
+        target_width = min(width, image.width)
+        height = max(1, round(image.height * target_width / image.width))
+        resized = image if target_width == image.width else image.resize(
+            (target_width, height), Image.Resampling.LANCZOS
+        )
+        variants[f"webp_{width}"] = _upload(
+            client, bucket, f"{prefix}/w{width}.webp", resized, "WEBP", "image/webp", quality=WEBP_QUALITY
+        )
+
+    return variants
+
+
+class ImageWorkerPool:
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def render(self, key: str) -> Dict[str, str]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), render_variants, storage_config(), key
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Singleton instance
+image_worker_pool = ImageWorkerPool(max_workers=settings.IMAGE_WORKER_PROCESSES)
@@ -0,0 +1,44 @@
+"""
+Bulk Import Parsing Helpers
+
+Stream rows out of an uploaded CSV or NDJSON file one at a time, so
+large uploads are never held in memory as a whole. Each row is yielded
+as (row_number, data, error) with exactly one of data / error set.
+"""
+
+import codecs
+import csv
+import json
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+
+ImportRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def iter_csv_rows(file: BinaryIO) -> Iterator[ImportRow]:
+    """Header row required. Empty cells are treated as missing values."""
+    reader = csv.DictReader(codecs.getreader("utf-8-sig")(file))
+    try:
+        for row in reader:
+            if None in row:
+                yield reader.line_num, None, "Too many columns"
+                continue
+            yield reader.line_num, {k.strip(): v for k, v in row.items() if v not in (None, "")}, None
+    except (UnicodeDecodeError, csv.Error) as e:
+        yield reader.line_num, None, f"Unreadable CSV: {e}"
+
+
+def iter_ndjson_rows(file: BinaryIO) -> Iterator[ImportRow]:
+    """One JSON object per line; blank lines are skipped."""
+    for line_num, raw in enumerate(file, start=1):
+        if not raw.strip():
+            continue
+        try:
+            data = json.loads(raw)
+        except (UnicodeDecodeError, ValueError) as e:
+            yield line_num, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(data, dict):
+            yield line_num, None, "Each line must be a JSON object"
+            continue
+        yield line_num, data, None
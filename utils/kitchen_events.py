@@ -0,0 +1,70 @@
+"""
+In-Process Kitchen Event Broker
+
+Fan-out of order events to the kitchen screens of one restaurant. Each
+open stream subscribes with a bounded queue; publishing is a non-blocking
+put per subscriber, so order services never wait on a slow screen. A
+subscriber whose queue overflows is dropped and its stream ends; the
+client reconnects and refetches the queue.
+
+Per worker: a stream only sees events published by the worker it is
+connected to.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Set
+
+
+Event = Dict[str, Any]
+
+
+class Subscription:
+    def __init__(self, restaurant_id: int, max_pending: int):
+        self.restaurant_id = restaurant_id
+        self.queue: "asyncio.Queue[Optional[Event]]" = asyncio.Queue(max_pending + 1)
+        self.max_pending = max_pending
+
+    async def get(self, timeout: float) -> Optional[Event]:
+        """Next event, or None on timeout; raises EOFError once dropped."""
+        try:
+            event = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event is None:
+            raise EOFError
+        return event
+
+
+class KitchenEventBroker:
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max_pending
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+
+    def subscribe(self, restaurant_id: int) -> Subscription:
+        subscription = Subscription(restaurant_id, self.max_pending)
+        self._subscribers.setdefault(restaurant_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        members = self._subscribers.get(subscription.restaurant_id)
+        if members is None:
+            return
+        members.discard(subscription)
+        if not members:
+            del self._subscribers[subscription.restaurant_id]
+
+    def subscribers(self, restaurant_id: int) -> int:
+        return len(self._subscribers.get(restaurant_id, ()))
+
+    def publish(self, restaurant_id: int, event: Event) -> None:
+        for subscription in list(self._subscribers.get(restaurant_id, ())):
+            # One slot is kept free for the end-of-stream marker
+            if subscription.queue.qsize() < subscription.max_pending:
+                subscription.queue.put_nowait(event)
+            else:
+                self.unsubscribe(subscription)
+                subscription.queue.put_nowait(None)
+
+
+# Singleton instance
+kitchen_events = KitchenEventBroker()
@@ -0,0 +1,87 @@
+"""
+In-Process Opening Hours Index
+
+Each restaurant's weekly schedule is compiled into a bitmap of the 10080
+minutes of the week (bit set = open), stored as 1260 bytes. "Is it open
+at t?" is then a single byte lookup and bit test, with no interval query.
+
+Restaurants without any configured hours are treated as always open, so
+schedules can be rolled out restaurant by restaurant.
+
+Loaded at startup and kept current by the hours write service (through
+catalog_sync_services); reloaded every OPENING_HOURS_RELOAD_SECONDS so
+schedule changes made in other worker processes reach this one.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from core.config import settings
+
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+BITMAP_BYTES = MINUTES_PER_WEEK // 8
+
+# (day_of_week, open_minute, close_minute)
+Interval = Tuple[int, int, int]
+
+
+def compile_week(intervals: Iterable[Interval]) -> bytes:
+    """
+    Weekly minute bitmap of a schedule. An interval whose close is not
+    after its open runs past midnight (equal means 24 hours); Sunday
+    night wraps into Monday.
+    """
+    mask = 0
+    for day, open_minute, close_minute in intervals:
+        start = day * MINUTES_PER_DAY + open_minute
+        length = (close_minute - open_minute) % MINUTES_PER_DAY or MINUTES_PER_DAY
+        end = start + length
+        mask |= ((1 << length) - 1) << start
+        if end > MINUTES_PER_WEEK:
+            mask |= (1 << (end - MINUTES_PER_WEEK)) - 1
+    mask &= (1 << MINUTES_PER_WEEK) - 1
+    return mask.to_bytes(BITMAP_BYTES, "little")
+
+
+def minute_of_week(at: Optional[datetime] = None) -> int:
+    """Minute of the week (0 = Monday 00:00) in RESTAURANT_TIMEZONE."""
+    local = (at or datetime.now(timezone.utc)).astimezone(ZoneInfo(settings.RESTAURANT_TIMEZONE))
+    return local.weekday() * MINUTES_PER_DAY + local.hour * 60 + local.minute
+
+
+class OpeningHoursIndex:
+    def __init__(self):
+        self._bitmaps: Dict[int, bytes] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._bitmaps)
+
+    def load(self, rows: Iterable[Tuple[int, int, int, int]]) -> None:
+        """Replace the whole index from (restaurant_id, day, open, close) rows."""
+        schedules: Dict[int, list] = {}
+        for restaurant_id, day, open_minute, close_minute in rows:
+            schedules.setdefault(restaurant_id, []).append((day, open_minute, close_minute))
+        self._bitmaps = {rid: compile_week(intervals) for rid, intervals in schedules.items()}
+        self.loaded = True
+
+    def put(self, restaurant_id: int, intervals: Iterable[Interval]) -> None:
+        """Replace one schedule; an empty schedule means always open."""
+        intervals = list(intervals)
+        if intervals:
+            self._bitmaps[restaurant_id] = compile_week(intervals)
+        else:
+            self._bitmaps.pop(restaurant_id, None)
+
+    def is_open(self, restaurant_id: int, minute: int) -> bool:
+        bitmap = self._bitmaps.get(restaurant_id)
+        if bitmap is None:
+            return True
+        return bool(bitmap[minute >> 3] >> (minute & 7) & 1)
+
+
+# Singleton instance
+opening_hours = OpeningHoursIndex()
@@ -0,0 +1,79 @@
+"""
+In-Process Kitchen Load Tracker
+
+Per-restaurant counts of orders still in the kitchen's queue (pending,
+confirmed, preparing). The order services apply each status transition as
+it commits, so listings read a restaurant's load as a dict lookup instead
+of a COUNT query.
+
+Seeded at startup from one grouped COUNT over recent orders, and resynced
+the same way by a periodic job: that corrects drift from other workers and
+ages out orders that never leave `pending` (abandoned checkouts).
+"""
+
+import math
+from typing import Dict, Iterable, Optional, Tuple
+
+from core.config import settings
+
+
+ACTIVE_STATUSES = ("pending", "confirmed", "preparing")
+
+
+class OrderLoadTracker:
+    def __init__(self):
+        self._counts: Dict[int, Dict[str, int]] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def load(self, rows: Iterable[Tuple[int, str, int]]) -> None:
+        """Replace all counts from (restaurant_id, status, count) rows."""
+        counts: Dict[int, Dict[str, int]] = {}
+        for restaurant_id, status, count in rows:
+            if status in ACTIVE_STATUSES and count > 0:
+                counts.setdefault(restaurant_id, {})[status] = count
+        self._counts = counts
+        self.loaded = True
+
+    def transition(
+        self,
+        restaurant_id: int,
+        old_status: Optional[str],
+        new_status: Optional[str],
+    ) -> None:
+        """Apply one order's status change; None means the order did not / no longer exists."""
+        if old_status == new_status:
+            return
+        counts = self._counts.setdefault(restaurant_id, {})
+        if old_status in ACTIVE_STATUSES and counts.get(old_status, 0) > 0:
+            counts[old_status] -= 1
+            if not counts[old_status]:
+                del counts[old_status]
+        if new_status in ACTIVE_STATUSES:
+            counts[new_status] = counts.get(new_status, 0) + 1
+        if not counts:
+            del self._counts[restaurant_id]
+
+    def counts(self, restaurant_id: int) -> Dict[str, int]:
+        return dict(self._counts.get(restaurant_id, {}))
+
+    def active(self, restaurant_id: int) -> int:
+        return sum(self._counts.get(restaurant_id, {}).values())
+
+    def prep_delay_minutes(self, restaurant_id: int) -> int:
+        """
+        Extra wait before a new order is started: one prep cycle for every
+        full batch of KITCHEN_CONCURRENT_ORDERS already queued.
+        """
+        batches = self.active(restaurant_id) // settings.KITCHEN_CONCURRENT_ORDERS
+        return math.ceil(batches * settings.DELIVERY_PREP_MINUTES)
+
+    def load_factor(self, restaurant_id: int) -> float:
+        """Queued orders per kitchen slot; 0 means idle."""
+        return self.active(restaurant_id) / settings.KITCHEN_CONCURRENT_ORDERS
+
+
+# Singleton instance
+order_load = OrderLoadTracker()
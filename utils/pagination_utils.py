@@ -0,0 +1,39 @@
+"""
+Keyset Pagination Helpers
+
+Cursors are opaque, URL-safe tokens wrapping the sort key of the last
+row on a page. The next page resumes strictly after that key, so each
+page is a bounded index range scan instead of an OFFSET over the table.
+"""
+
+import base64
+import json
+from typing import Any, List
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(sort: str, values: List[Any]) -> str:
+    payload = json.dumps([sort, *values], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> List[Any]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises 400 if the token is malformed or was issued for another sort order.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        payload = None
+
+    if not isinstance(payload, list) or len(payload) < 2 or payload[0] != sort:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+    return payload[1:]
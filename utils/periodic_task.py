@@ -0,0 +1,48 @@
+"""
+Periodic Background Tasks
+
+Runs an async job on a fixed interval inside the app's event loop, started
+and stopped from the FastAPI lifespan. A failing run is logged and retried
+on the next tick; it never stops the loop.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from utils.logger_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class PeriodicTask:
+    def __init__(self, name: str, interval_seconds: float, job: Callable[[], Awaitable[None]]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.job = job
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Schedule the loop; the first run starts immediately."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.job()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Periodic task failed | task=%s error=%s", self.name, str(e))
+            await asyncio.sleep(self.interval_seconds)
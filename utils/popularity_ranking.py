@@ -0,0 +1,74 @@
+"""
+In-Process Popularity Ranking
+
+Holds the latest precomputed popularity scores as ready-sorted top lists,
+so ranked reads are a slice of an in-memory tuple. A background job builds
+a new snapshot and swaps it in whole; readers never see a partial update.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+
+Ranked = Tuple[Tuple[int, float], ...]  # ((id, score), ...) best first
+
+
+@dataclass(frozen=True)
+class RankingSnapshot:
+    version: int = 0
+    computed_at: Optional[datetime] = None
+    products: Ranked = ()
+    products_by_restaurant: Dict[int, Ranked] = field(default_factory=dict)
+    restaurants: Ranked = ()
+
+
+def _top(scores: Dict[int, float], limit: int) -> Ranked:
+    return tuple(heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0])))
+
+
+class PopularityRanking:
+    def __init__(self, max_items: int = 500):
+        self.max_items = max_items
+        self.snapshot = RankingSnapshot()
+
+    @property
+    def version(self) -> int:
+        return self.snapshot.version
+
+    def replace(
+        self,
+        product_scores: Dict[int, float],
+        product_restaurants: Dict[int, int],
+    ) -> None:
+        """Build and swap in a new snapshot from per-product scores."""
+        by_restaurant: Dict[int, Dict[int, float]] = {}
+        restaurant_scores: Dict[int, float] = {}
+        for product_id, score in product_scores.items():
+            restaurant_id = product_restaurants[product_id]
+            by_restaurant.setdefault(restaurant_id, {})[product_id] = score
+            restaurant_scores[restaurant_id] = restaurant_scores.get(restaurant_id, 0.0) + score
+
+        self.snapshot = RankingSnapshot(
+            version=self.snapshot.version + 1,
+            computed_at=datetime.now(timezone.utc),
+            products=_top(product_scores, self.max_items),
+            products_by_restaurant={
+                restaurant_id: _top(scores, self.max_items)
+                for restaurant_id, scores in by_restaurant.items()
+            },
+            restaurants=_top(restaurant_scores, self.max_items),
+        )
+
+    def top_products(self, limit: int, restaurant_id: Optional[int] = None) -> List[Tuple[int, float]]:
+        snapshot = self.snapshot
+        ranked = snapshot.products if restaurant_id is None else snapshot.products_by_restaurant.get(restaurant_id, ())
+        return list(ranked[:limit])
+
+    def top_restaurants(self, limit: int) -> List[Tuple[int, float]]:
+        return list(self.snapshot.restaurants[:limit])
+
+
+# Singleton instance
+popularity_ranking = PopularityRanking()
@@ -0,0 +1,110 @@
+"""
+S3-Compatible Object Storage
+
+Thin wrapper over boto3 for product images. Clients upload directly to
+the bucket with presigned POST forms, so image bytes never pass through
+the API workers.
+
+Works against AWS S3 or any S3-compatible store (MinIO) via
+S3_ENDPOINT_URL. The connection settings are exported as a plain dict so
+worker processes can build their own client.
+"""
+
+from typing import Any, Dict, Optional
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from core.config import settings
+
+
+def storage_config() -> Dict[str, Any]:
+    """Picklable connection settings, for use in worker processes."""
+    return {
+        "bucket": settings.S3_BUCKET,
+        "region": settings.S3_REGION,
+        "endpoint_url": settings.S3_ENDPOINT_URL,
+        "access_key_id": settings.S3_ACCESS_KEY_ID,
+        "secret_access_key": settings.S3_SECRET_ACCESS_KEY,
+    }
+
+
+def make_s3_client(config: Dict[str, Any]):
+    return boto3.client(
+        "s3",
+        region_name=config["region"],
+        endpoint_url=config["endpoint_url"],
+        aws_access_key_id=config["access_key_id"],
+        aws_secret_access_key=config["secret_access_key"],
+        # Path-style addressing is what MinIO and most local stand-ins expect
+        config=Config(
+            signature_version="s3v4",
+            s3={"addressing_style": "path" if config["endpoint_url"] else "auto"},
+        ),
+    )
+
+
+class ObjectStorage:
+    def __init__(self):
+        self._client = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(settings.S3_BUCKET)
+
+    @property
+    def bucket(self) -> Optional[str]:
+        return settings.S3_BUCKET
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = make_s3_client(storage_config())
+        return self._client
+
+    def public_url(self, key: str) -> str:
+        if settings.S3_PUBLIC_BASE_URL:
+            base = settings.S3_PUBLIC_BASE_URL.rstrip("/")
+        elif settings.S3_ENDPOINT_URL:
+            base = f"{settings.S3_ENDPOINT_URL.rstrip('/')}/{self.bucket}"
+        else:
+            base = f"https://{self.bucket}.s3.{settings.S3_REGION}.amazonaws.com"
+        return f"{base}/{key}"
+
+    # ------------------------
+    # PRESIGN (local signing, no network call)
+    # ------------------------
+    def presigned_post(
+        self,
+        key: str,
+        content_type: str,
+        max_bytes: int,
+        expires_in: int,
+    ) -> Dict[str, Any]:
+        """Presigned POST form limited to one key, content type and size range."""
+        return self._get_client().generate_presigned_post(
+            Bucket=self.bucket,
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_bytes],
+            ],
+            ExpiresIn=expires_in,
+        )
+
+    # ------------------------
+    # HEAD (blocking; run in a thread)
+    # ------------------------
+    def head(self, key: str) -> Optional[Dict[str, Any]]:
+        """Object metadata, or None if the object does not exist."""
+        try:
+            return self._get_client().head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+
+# Singleton instance
+storage = ObjectStorage()
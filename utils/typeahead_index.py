@@ -0,0 +1,155 @@
+"""
+In-Process Typeahead Index
+
+Sorted-array prefix index over product, restaurant and category names.
+Each name is indexed under every word-start suffix ("veg burger" is found
+by "veg" and by "bur"), so a lookup is a binary search followed by a
+short forward scan. Results are ranked by a popularity weight.
+
+The index lives in process memory: it is built once at startup and kept
+current by the catalog write services, so suggestions never touch the DB.
+"""
+
+import heapq
+import re
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+PRODUCT = "product"
+RESTAURANT = "restaurant"
+CATEGORY = "category"
+
+KINDS = (PRODUCT, RESTAURANT, CATEGORY)
+
+# Short prefixes match large ranges, so their results are memoized until a
+# write touches a name under that prefix
+_CACHED_PREFIX_MAX_LEN = 3
+_CACHE_MAX_ENTRIES = 4096
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    return _NON_WORD.sub(" ", text.casefold()).strip()
+
+
+def _terms(name: str) -> Set[str]:
+    words = normalize(name).split()
+    return {" ".join(words[i:]) for i in range(len(words))}
+
+
+@dataclass
+class Suggestion:
+    kind: str
+    id: int
+    name: str
+    weight: float = 0.0
+
+
+class TypeaheadIndex:
+    def __init__(self):
+        self._keys: List[Tuple[str, str, int]] = []  # sorted (term, kind, id)
+        self._entries: Dict[Tuple[str, int], Suggestion] = {}
+        self._cache: Dict[Tuple[str, int, Tuple[str, ...]], List[Suggestion]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------
+    # WRITES
+    # ------------------------
+    def build(self, entries: Iterable[Suggestion]) -> None:
+        """Replace the whole index."""
+        self._entries = {(e.kind, e.id): e for e in entries}
+        self._keys = sorted(
+            (term, e.kind, e.id)
+            for e in self._entries.values()
+            for term in _terms(e.name)
+        )
+        self._cache.clear()
+
+    def upsert(self, kind: str, entry_id: int, name: str, weight: Optional[float] = None) -> None:
+        """Add or rename an entry. A rename keeps its weight unless one is given."""
+        existing = self._entries.get((kind, entry_id))
+        if existing:
+            if weight is None:
+                weight = existing.weight
+            self._drop_keys(existing)
+            self._invalidate(existing.name)
+
+        entry = Suggestion(kind, entry_id, name, weight or 0.0)
+        self._entries[(kind, entry_id)] = entry
+        for term in _terms(name):
+            insort(self._keys, (term, kind, entry_id))
+        self._invalidate(name)
+
+    def remove(self, kind: str, entry_id: int) -> None:
+        existing = self._entries.pop((kind, entry_id), None)
+        if existing:
+            self._drop_keys(existing)
+            self._invalidate(existing.name)
+
+    def set_weights(self, kind: str, weights: Dict[int, float]) -> None:
+        """Update popularity weights in place; ids not listed drop to zero."""
+        for (entry_kind, entry_id), entry in self._entries.items():
+            if entry_kind == kind:
+                entry.weight = weights.get(entry_id, 0.0)
+        self._cache.clear()
+
+    def _invalidate(self, name: str) -> None:
+        terms = _terms(name)
+        stale = [key for key in self._cache if any(t.startswith(key[0]) for t in terms)]
+        for key in stale:
+            del self._cache[key]
+
+    def _drop_keys(self, entry: Suggestion) -> None:
+        for term in _terms(entry.name):
+            key = (term, entry.kind, entry.id)
+            i = bisect_left(self._keys, key)
+            if i < len(self._keys) and self._keys[i] == key:
+                del self._keys[i]
+
+    # ------------------------
+    # READS
+    # ------------------------
+    def suggest(
+        self,
+        prefix: str,
+        limit: int = 10,
+        kinds: Optional[Iterable[str]] = None,
+    ) -> List[Suggestion]:
+        """Top `limit` entries having a word starting with `prefix`, most popular first."""
+        query = normalize(prefix)
+        if not query:
+            return []
+
+        kind_filter = tuple(sorted(set(kinds))) if kinds else KINDS
+        cache_key = (query, limit, kind_filter)
+        if len(query) <= _CACHED_PREFIX_MAX_LEN and cache_key in self._cache:
+            return self._cache[cache_key]
+
+        matched: Dict[Tuple[str, int], Suggestion] = {}
+        i = bisect_left(self._keys, (query,))
+        while i < len(self._keys) and self._keys[i][0].startswith(query):
+            _, kind, entry_id = self._keys[i]
+            if kind in kind_filter:
+                matched[(kind, entry_id)] = self._entries[(kind, entry_id)]
+            i += 1
+
+        results = heapq.nsmallest(
+            limit,
+            matched.values(),
+            key=lambda e: (-e.weight, len(e.name), e.name),
+        )
+
+        if len(query) <= _CACHED_PREFIX_MAX_LEN:
+            if len(self._cache) >= _CACHE_MAX_ENTRIES:
+                self._cache.clear()
+            self._cache[cache_key] = results
+        return results
+
+
+# Singleton instance
+typeahead_index = TypeaheadIndex()